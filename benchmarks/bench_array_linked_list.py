@@ -0,0 +1,95 @@
+"""
+Benchmark of ArrayDoubleLinkedList against the object-node DoubleLinkedList.
+
+Measures retained memory, build and traversal throughput, the pause of a full
+garbage collection while the list is alive, the cost of `clear()` followed by
+a collection, and queue-like churn with the garbage collector runs recorded
+through `gc.callbacks`.
+
+Usage:
+    python -m benchmarks.bench_array_linked_list
+"""
+import gc
+import time
+
+from benchmarks.bench_node_pool import GCMonitor
+from benchmarks.common import best_of, report, retained_memory
+from data_structures.array_linked_list import ArrayDoubleLinkedList
+from data_structures.double_linked_list import DoubleLinkedList, Node
+
+COUNT = 1_000_000
+OPERATIONS = 1_000_000
+
+
+def build_nodes() -> DoubleLinkedList:
+    dll = DoubleLinkedList()
+    for value in range(COUNT):
+        dll.insert_at_tail(Node(value))
+    return dll
+
+
+def build_array() -> ArrayDoubleLinkedList:
+    dll = ArrayDoubleLinkedList()
+    for value in range(COUNT):
+        dll.insert_at_tail(value)
+    return dll
+
+
+def churn_nodes(dll: DoubleLinkedList) -> None:
+    for value in range(OPERATIONS):
+        dll.insert_at_tail(Node(value))
+        dll.delete_from_head()
+
+
+def churn_array(dll: ArrayDoubleLinkedList) -> None:
+    for value in range(OPERATIONS):
+        dll.insert_at_tail(value)
+        dll.delete_from_head()
+
+
+def timed_collect() -> float:
+    start = time.perf_counter()
+    gc.collect()
+    return time.perf_counter() - start
+
+
+def clear_and_collect(dll) -> float:
+    start = time.perf_counter()
+    dll.clear()
+    gc.collect()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{COUNT} values")
+    variants = (("DoubleLinkedList", build_nodes, churn_nodes),
+                ("ArrayDoubleLinkedList", build_array, churn_array))
+    for label, build, _ in variants:
+        print(f"{'memory, ' + label:<48} {retained_memory(build) / 2**20:>10.1f} MiB")
+
+    baselines = {}
+    for label, build, churn in variants:
+        dll = build()
+        gc.collect()
+        measurements = {
+            "build": best_of(build, repeat=1),
+            "traversal_forward": best_of(dll.traversal_forward),
+            "full gc.collect() with the list alive": min(timed_collect() for _ in range(3)),
+        }
+        monitor = GCMonitor()
+        gc.callbacks.append(monitor)
+        try:
+            measurements[f"churn, {OPERATIONS} tail insert + head delete"] = \
+                best_of(lambda: churn(dll), repeat=1)
+        finally:
+            gc.callbacks.remove(monitor)
+        measurements["clear() + gc.collect()"] = clear_and_collect(dll)
+        for name, seconds in measurements.items():
+            report(f"{label}: {name}", seconds, baselines.get(name))
+            baselines.setdefault(name, seconds)
+        print(f"{'  gc runs / total pause during churn':<48} "
+              f"{monitor.collections:>6} / {monitor.paused * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of AVLTree and RedBlackTree against a sorted Python list with `bisect`.
+
+Measures bulk building from sorted keys, key lookups, random inserts and
+deletes, range scans and rank/select queries, at two sizes. The sorted list
+answers lookups with a C binary search, but each insert or delete shifts on
+average half of the list; the trees pay a Python-level O(log n) walk for
+every operation.
+
+Usage:
+    python -m benchmarks.bench_balanced_tree
+"""
+import bisect
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.balanced_tree import AVLTree, RedBlackTree
+
+COUNTS = (100_000, 1_000_000)
+QUERIES = 20_000
+TREES = (AVLTree, RedBlackTree)
+
+
+def bench(count: int) -> None:
+    rng = random.Random(0)
+    keys = sorted(rng.sample(range(10 * count), count))
+    queries = [rng.randrange(10 * count) for _ in range(QUERIES)]
+    present = set(keys)
+    fresh = [key for key in dict.fromkeys(queries) if key not in present]
+    print(f"{count} keys, {QUERIES} queries")
+
+    baseline = best_of(lambda: list(keys), repeat=1)
+    report("build, list(sorted keys)", baseline)
+    trees = {}
+    for tree_type in TREES:
+        report(f"build, {tree_type.__name__}.from_sorted",
+               best_of(lambda: tree_type.from_sorted(keys), repeat=1), baseline)
+        trees[tree_type] = tree_type.from_sorted(keys)
+
+    def bisect_find() -> None:
+        for query in queries:
+            index = bisect.bisect_left(keys, query)
+            index < len(keys) and keys[index] == query
+
+    baseline = best_of(bisect_find)
+    report("find, bisect", baseline)
+    for tree_type, tree in trees.items():
+        report(f"find, {tree_type.__name__}", best_of(lambda: [tree.find(query) for query in queries]),
+               baseline)
+
+    def bisect_updates() -> None:
+        for key in fresh:
+            bisect.insort(keys, key)
+        for key in fresh:
+            del keys[bisect.bisect_left(keys, key)]
+
+    def tree_updates(tree) -> None:
+        for key in fresh:
+            tree.insert_node(key)
+        for key in fresh:
+            tree.delete_node(key)
+
+    baseline = best_of(bisect_updates)
+    report(f"{len(fresh)} inserts + deletes, insort / del", baseline)
+    for tree_type, tree in trees.items():
+        report(f"{len(fresh)} inserts + deletes, {tree_type.__name__}",
+               best_of(lambda: tree_updates(tree)), baseline)
+
+    width = 1_000
+    baseline = best_of(lambda: [keys[bisect.bisect_left(keys, query):bisect.bisect_left(keys, query + width)]
+                                for query in queries[:2_000]])
+    report("2000 range scans of ~100 keys, slices", baseline)
+    for tree_type, tree in trees.items():
+        report(f"2000 range scans of ~100 keys, {tree_type.__name__}",
+               best_of(lambda: [[node.key for node in tree.range(query, query + width)]
+                                for query in queries[:2_000]]), baseline)
+
+    positions = [rng.randrange(count) for _ in range(QUERIES)]
+    baseline = best_of(lambda: ([bisect.bisect_left(keys, query) for query in queries],
+                                [keys[position] for position in positions]))
+    report("rank + select, bisect / indexing", baseline)
+    for tree_type, tree in trees.items():
+        report(f"rank + select, {tree_type.__name__}",
+               best_of(lambda: ([tree.rank(query) for query in queries],
+                                [tree.select(position) for position in positions])), baseline)
+    print()
+
+
+def main() -> None:
+    for count in COUNTS:
+        bench(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of building a BinaryTree with and without array-backed storage.
+
+The linked tree finds the first free slot with a BFS from the root, so
+building n nodes is O(n^2) and is only measured up to a few thousand nodes.
+The array-backed tree appends to its level-order array and is measured up
+to 10^6 nodes. `last_node()` is timed on the largest tree of each mode.
+
+Usage:
+    python -m benchmarks.bench_binary_tree_build
+"""
+from benchmarks.common import best_of, report
+from data_structures.binary_tree import BinaryTree
+
+LINKED_COUNTS = (1_000, 2_000, 4_000)
+ARRAY_COUNTS = (1_000, 2_000, 4_000, 100_000, 1_000_000)
+LAST_NODE_CALLS = 100
+
+
+def build(count: int, array_backed: bool) -> BinaryTree:
+    tree = BinaryTree(array_backed=array_backed)
+    for value in range(count):
+        tree.insert_node(value)
+    return tree
+
+
+def main() -> None:
+    baselines = {}
+    for count in LINKED_COUNTS:
+        baselines[count] = best_of(lambda: build(count, False), repeat=1)
+        report(f"build {count}, linked", baselines[count])
+    for count in ARRAY_COUNTS:
+        report(f"build {count}, array-backed",
+               best_of(lambda: build(count, True), repeat=1), baselines.get(count))
+
+    for array_backed, count in ((False, LINKED_COUNTS[-1]), (True, ARRAY_COUNTS[-1])):
+        tree = build(count, array_backed)
+
+        def last_nodes() -> None:
+            for _ in range(LAST_NODE_CALLS):
+                tree.last_node()
+
+        label = "array-backed" if array_backed else "linked"
+        report(f"{LAST_NODE_CALLS} x last_node() on {count}, {label}", best_of(last_nodes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of the disk-backed BPlusTree: bulk loading, point lookups, range
+scans and random inserts.
+
+The keys are the even numbers below 2 * KEYS, so half of the lookups miss.
+Point lookups and range scans are timed on a freshly reopened tree, whose
+page cache starts empty, and again once the cache is warm. Up to 10^7 keys, a
+sorted Python list with `bisect` is timed as an in-memory baseline; beyond
+that, the list would not fit in memory on small machines and is skipped.
+
+Usage:
+    python -m benchmarks.bench_bplus_tree
+    python -m benchmarks.bench_bplus_tree --keys 100000000 --directory /mnt/scratch
+"""
+import argparse
+import bisect
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import best_of, report
+from data_structures.bplus_tree import BPlusTree
+
+QUERIES = 20_000
+RANGES = 2_000
+RANGE_WIDTH = 200
+INSERTS = 20_000
+BASELINE_LIMIT = 10_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, default=1_000_000, help="number of keys to load")
+    parser.add_argument("--directory", default=None, help="where to create the tree file")
+    parser.add_argument("--cache-pages", type=int, default=1024, help="page cache size")
+    arguments = parser.parse_args()
+    count = arguments.keys
+
+    rng = random.Random(0)
+    queries = [rng.randrange(2 * count) for _ in range(QUERIES)]
+    starts = [rng.randrange(2 * count) for _ in range(RANGES)]
+    inserts = [rng.randrange(count) * 2 + 1 for _ in range(INSERTS)]
+
+    with tempfile.TemporaryDirectory(dir=arguments.directory) as directory:
+        path = os.path.join(directory, "bench.db")
+        start = time.perf_counter()
+        BPlusTree.from_sorted(path, range(0, 2 * count, 2), range(count)).close()
+        report(f"from_sorted, {count} keys", time.perf_counter() - start)
+        print(f"{'  file size':<48} {os.path.getsize(path) / 2**20:>10.1f} MiB")
+
+        keys = list(range(0, 2 * count, 2)) if count <= BASELINE_LIMIT else None
+        with BPlusTree(path, cache_pages=arguments.cache_pages) as tree:
+            print(f"{'  height':<48} {tree.height:>10}")
+            for label in ("cold cache", "warm cache"):
+                seconds = best_of(lambda: [tree.find(query) for query in queries], repeat=1)
+                report(f"{QUERIES} finds, {label}", seconds)
+            if keys is not None:
+                report(f"{QUERIES} finds, sorted list + bisect",
+                       best_of(lambda: [bisect.bisect_left(keys, query) for query in queries]))
+
+            def scans() -> None:
+                for start in starts:
+                    for _ in tree.range(start, start + RANGE_WIDTH):
+                        pass
+
+            report(f"{RANGES} range scans of {RANGE_WIDTH // 2} keys", best_of(scans))
+            if keys is not None:
+                report(f"{RANGES} range scans, sorted list slices",
+                       best_of(lambda: [keys[bisect.bisect_left(keys, start):
+                                             bisect.bisect_left(keys, start + RANGE_WIDTH)]
+                                        for start in starts]))
+            start = time.perf_counter()
+            for key in inserts:
+                tree.insert_node(key, -key)
+            tree.flush()
+            report(f"{INSERTS} random inserts + flush", time.perf_counter() - start)
+            print(f"{'  height after inserts':<48} {tree.height:>10}")
+
+
+if __name__ == "__main__":
+    main()
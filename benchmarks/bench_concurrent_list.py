@@ -0,0 +1,92 @@
+"""
+Multi-threaded contention benchmark of ConcurrentDoubleLinkedList.
+
+Half of the threads insert at the tail while the other half delete from the
+head, as in a shared work list. The baseline is a DoubleLinkedList behind one
+global lock. The total number of operations is fixed, so with real
+parallelism the time should drop as threads are added.
+
+With the GIL, threads never run Python code in parallel and the per-node locks
+only add overhead; the per-node design pays off on free-threaded builds
+(python3.13t and later), where `sys._is_gil_enabled()` returns False.
+
+Usage:
+    python -m benchmarks.bench_concurrent_list
+    PYTHON_GIL=0 python3.13t -m benchmarks.bench_concurrent_list
+"""
+import sys
+import threading
+import time
+
+from benchmarks.common import report
+from data_structures.concurrent_linked_list import ConcurrentDoubleLinkedList
+from data_structures.double_linked_list import DoubleLinkedList
+
+OPERATIONS = 400_000
+PRELOAD = 1_000
+THREADS = (2, 4, 8)
+
+
+class GlobalLockList:
+    """A DoubleLinkedList with every operation behind one lock."""
+
+    def __init__(self) -> None:
+        self._list = DoubleLinkedList()
+        self._lock = threading.Lock()
+
+    def insert_at_tail(self, data: any) -> None:
+        with self._lock:
+            self._list.insert_at_tail(self._list.new_node(data))
+
+    def delete_from_head(self) -> any:
+        with self._lock:
+            data = self._list.head.data if self._list.head is not None else None
+            self._list.delete_from_head()
+            return data
+
+
+def run(structure, threads: int) -> float:
+    for value in range(PRELOAD):
+        structure.insert_at_tail(value)
+    per_thread = OPERATIONS // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def producer() -> None:
+        barrier.wait()
+        for value in range(per_thread):
+            structure.insert_at_tail(value)
+
+    def consumer() -> None:
+        barrier.wait()
+        done = 0
+        while done < per_thread:
+            try:
+                structure.delete_from_head()
+                done += 1
+            except IndexError:
+                pass
+
+    workers = [threading.Thread(target=producer if index % 2 else consumer)
+               for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+    print(f"{OPERATIONS} tail inserts and head deletes in total")
+    for threads in THREADS:
+        baseline = min(run(GlobalLockList(), threads) for _ in range(3))
+        report(f"{threads} threads, global lock", baseline)
+        report(f"{threads} threads, per-node locks",
+               min(run(ConcurrentDoubleLinkedList(), threads) for _ in range(3)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark of the Deque value index: maintenance overhead against query savings.
+
+The first section measures append/pop_left churn with and without the index.
+The second one measures a dedup-style workload that calls `count` and membership
+once per event on a deque holding the recent events.
+
+Usage:
+    python -m benchmarks.bench_deque_index
+"""
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.deque_list import Deque
+
+EVENTS = 20_000
+WINDOWS = (100, 1_000, 10_000)
+
+
+def churn(indexed: bool, values: list[int], window: int) -> None:
+    deque = Deque(indexed=indexed)
+    for value in values:
+        deque.append(value)
+        if len(deque) > window:
+            deque.pop_left()
+
+
+def dedup(indexed: bool, values: list[int], window: int) -> None:
+    deque = Deque(indexed=indexed)
+    for value in values:
+        if value in deque:
+            deque.count(value)
+        deque.append(value)
+        if len(deque) > window:
+            deque.pop_left()
+
+
+def main() -> None:
+    rng = random.Random(0)
+    values = [rng.randrange(EVENTS) for _ in range(EVENTS)]
+    for window in WINDOWS:
+        print(f"window {window}, {EVENTS} events")
+        plain = best_of(lambda: churn(False, values, window))
+        report("append/pop_left, plain", plain)
+        report("append/pop_left, indexed", best_of(lambda: churn(True, values, window)), plain)
+        plain = best_of(lambda: dedup(False, values, window), repeat=1)
+        report("dedup (in + count), plain", plain)
+        report("dedup (in + count), indexed", best_of(lambda: dedup(True, values, window)), plain)
+        print()
+
+
+if __name__ == "__main__":
+    main()
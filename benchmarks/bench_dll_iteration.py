@@ -0,0 +1,66 @@
+"""
+Benchmark of early-exit consumers of a DoubleLinkedList.
+
+Consumers that stop at the first match, or take the first few items, used to
+call `traversal_forward`, which builds the whole list of data first. They are
+compared with the lazy iterators, for latency and peak memory. Full traversals
+are measured too, since `traversal_forward` now wraps the iterator.
+
+Usage:
+    python -m benchmarks.bench_dll_iteration
+"""
+from itertools import islice
+
+from benchmarks.common import best_of, peak_memory, report
+from data_structures.double_linked_list import DoubleLinkedList, Node
+
+COUNT = 1_000_000
+TAKE = 10
+
+
+def first_match_eager(dll: DoubleLinkedList, target: int) -> int:
+    return next(value for value in dll.traversal_forward() if value >= target)
+
+
+def first_match_lazy(dll: DoubleLinkedList, target: int) -> int:
+    return next(value for value in dll if value >= target)
+
+
+def main() -> None:
+    dll = DoubleLinkedList()
+    for value in range(COUNT):
+        dll.insert_at_tail(Node(value))
+    print(f"{COUNT}-node list")
+
+    consumers = (
+        (f"first {TAKE} items", lambda: dll.traversal_forward()[:TAKE],
+         lambda: list(islice(dll, TAKE))),
+        (f"last {TAKE} items", lambda: dll.traversal_backward()[:TAKE],
+         lambda: list(islice(reversed(dll), TAKE))),
+        ("first match at 1%", lambda: first_match_eager(dll, COUNT // 100),
+         lambda: first_match_lazy(dll, COUNT // 100)),
+        ("first match at 50%", lambda: first_match_eager(dll, COUNT // 2),
+         lambda: first_match_lazy(dll, COUNT // 2)),
+    )
+    for label, eager, lazy in consumers:
+        baseline = best_of(eager)
+        report(f"{label}, traversal list", baseline)
+        report(f"{label}, lazy iterator", best_of(lazy), baseline)
+        print(f"{'peak memory, traversal list':<48} {peak_memory(eager) / 2**20:>10.2f} MiB")
+        print(f"{'peak memory, lazy iterator':<48} {peak_memory(lazy) / 2**20:>10.2f} MiB")
+
+    def walk_links() -> list:
+        result = []
+        current = dll.head
+        while current is not None:
+            result.append(current.data)
+            current = current.next
+        return result
+
+    baseline = best_of(walk_links)
+    report("full traversal, walking the links", baseline)
+    report("full traversal, traversal_forward", best_of(dll.traversal_forward), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark of DoubleLinkedList positional inserts and deletes.
+
+Each workload alternates `insert_at_position` and `delete_from_position`, so
+the list keeps its size. The baseline always walks from the head, as the list
+did before; it is compared with walking from the closer end, and with the
+closer of the ends and the finger.
+
+Usage:
+    python -m benchmarks.bench_dll_positions
+"""
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.double_linked_list import DoubleLinkedList, Node
+
+COUNT = 100_000
+OPERATIONS = 2_000
+
+
+class HeadWalkList(DoubleLinkedList):
+    """Doubly linked list that always walks from the head."""
+
+    def _node_at(self, position: int) -> Node:
+        current = self._head
+        for _ in range(position):
+            current = current._next
+        return current
+
+
+def random_positions(rng: random.Random) -> list:
+    return [rng.randrange(COUNT) for _ in range(OPERATIONS)]
+
+
+def clustered_positions(rng: random.Random) -> list:
+    positions = []
+    cursor = COUNT // 3
+    for _ in range(OPERATIONS):
+        cursor = min(max(cursor + rng.randint(-8, 8), 0), COUNT - 1)
+        positions.append(cursor)
+    return positions
+
+
+def tail_heavy_positions(rng: random.Random) -> list:
+    return [COUNT - 1 - rng.randrange(COUNT // 100) for _ in range(OPERATIONS)]
+
+
+def build(list_class: type, finger: bool = False) -> DoubleLinkedList:
+    dll = list_class(finger=finger)
+    for value in range(COUNT):
+        dll.insert_at_tail(Node(value))
+    return dll
+
+
+def run(dll: DoubleLinkedList, positions: list) -> None:
+    for position in positions:
+        dll.insert_at_position(Node(position), position)
+        dll.delete_from_position(position)
+
+
+def main() -> None:
+    rng = random.Random(39)
+    lists = (
+        ("walk from head", build(HeadWalkList)),
+        ("walk from closer end", build(DoubleLinkedList)),
+        ("closer end or finger", build(DoubleLinkedList, finger=True)),
+    )
+    print(f"{OPERATIONS} inserts and deletes on a {COUNT}-node list")
+    for workload, make_positions in (("random", random_positions),
+                                     ("clustered", clustered_positions),
+                                     ("tail-heavy", tail_heavy_positions)):
+        positions = make_positions(rng)
+        baseline = None
+        for label, dll in lists:
+            seconds = best_of(lambda: run(dll, positions), repeat=1)
+            report(f"{workload}, {label}", seconds, baseline)
+            baseline = baseline or seconds
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark of moving ranges of nodes between DoubleLinkedList instances.
+
+Compares `concat`, `splice` and `split_at` with moving the same nodes one by
+one through the delete and insert methods. The node-by-node range move uses a
+list with a finger, so each positional delete starts next to the range.
+
+Usage:
+    python -m benchmarks.bench_dll_splice
+"""
+from benchmarks.common import best_of, report
+from data_structures.double_linked_list import DoubleLinkedList, Node
+
+COUNT = 200_000
+RANGE = 100_000
+
+
+def build(count: int, finger: bool = False) -> DoubleLinkedList:
+    dll = DoubleLinkedList(finger=finger)
+    for value in range(count):
+        dll.insert_at_tail(Node(value))
+    return dll
+
+
+def concat_one_by_one(source: DoubleLinkedList, target: DoubleLinkedList) -> None:
+    while not source.is_empty():
+        node = source.head
+        source.delete_from_head()
+        target.insert_at_tail(Node(node.data))
+
+
+def move_range_one_by_one(source: DoubleLinkedList, target: DoubleLinkedList) -> None:
+    start = COUNT // 4
+    for _ in range(RANGE):
+        data = source.node_at(start).data
+        source.delete_from_position(start)
+        target.insert_at_tail(Node(data))
+
+
+def split_one_by_one(source: DoubleLinkedList) -> DoubleLinkedList:
+    rest = DoubleLinkedList()
+    for _ in range(RANGE):
+        data = source.tail.data
+        source.delete_from_tail()
+        rest.insert_at_head(Node(data))
+    return rest
+
+
+def timed(setup: callable, operation: callable) -> float:
+    """Times an operation on fresh lists, leaving the build out of the measurement."""
+    best = float("inf")
+    for _ in range(3):
+        arguments = setup()
+        best = min(best, best_of(lambda: operation(*arguments), repeat=1))
+    return best
+
+
+def main() -> None:
+    print(f"moving {RANGE} nodes out of {COUNT}")
+    two_lists = lambda: (build(RANGE), build(RANGE))
+    baseline = timed(two_lists, concat_one_by_one)
+    report("concat, node by node", baseline)
+    report("concat", timed(two_lists, lambda source, target: target.concat(source)), baseline)
+
+    def middle_range():
+        source = build(COUNT, finger=True)
+        return source, source.node_at(COUNT // 4), source.node_at(COUNT // 4 + RANGE - 1), build(10)
+
+    baseline = timed(middle_range, lambda source, _start, _end, target:
+                     move_range_one_by_one(source, target))
+    report("move middle range, node by node", baseline)
+    report("splice, counting the range", timed(middle_range, lambda source, start, end, target:
+                                               source.splice(start, end, target, target.tail)),
+           baseline)
+    report("splice, count given", timed(middle_range, lambda source, start, end, target:
+                                        source.splice(start, end, target, target.tail, RANGE)),
+           baseline)
+
+    def full_list():
+        source = build(COUNT)
+        return source, source.node_at(COUNT - RANGE)
+
+    baseline = timed(full_list, lambda source, _node: split_one_by_one(source))
+    report("split off the second half, node by node", baseline)
+    report("split_at", timed(full_list, lambda source, node: source.split_at(node)), baseline)
+
+
+if __name__ == "__main__":
+    main()
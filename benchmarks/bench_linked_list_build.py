@@ -0,0 +1,62 @@
+"""
+Benchmark of building a LinkedList in order.
+
+Compares the tail-pointer `append`/`extend` with what was possible before:
+walking to the last node for every append (O(n^2), so measured on a smaller
+list), or inserting the reversed input at the head.
+
+Usage:
+    python -m benchmarks.bench_linked_list_build
+"""
+from benchmarks.common import best_of, report
+from data_structures.linked_list import LinkedList, Node
+
+COUNT = 1_000_000
+WALK_COUNT = 5_000
+
+
+def append_by_walking(count: int) -> LinkedList:
+    linked = LinkedList()
+    for value in range(count):
+        if linked.head is None:
+            linked.head = Node(value)
+            continue
+        current = linked.head
+        while current.next is not None:
+            current = current.next
+        current.next = Node(value)
+    return linked
+
+
+def insert_reversed(count: int) -> LinkedList:
+    linked = LinkedList()
+    for value in reversed(range(count)):
+        linked.insert(value)
+    return linked
+
+
+def append_each(count: int) -> LinkedList:
+    linked = LinkedList()
+    for value in range(count):
+        linked.append(value)
+    return linked
+
+
+def extend(count: int) -> LinkedList:
+    linked = LinkedList()
+    linked.extend(range(count))
+    return linked
+
+
+def main() -> None:
+    walk = best_of(lambda: append_by_walking(WALK_COUNT), repeat=1)
+    report(f"walk to the end + link ({WALK_COUNT} nodes)", walk)
+    print(f"{'  extrapolated to ' + str(COUNT) + ' nodes':<48} {walk * (COUNT / WALK_COUNT) ** 2:>10.0f} s")
+    baseline = best_of(lambda: insert_reversed(COUNT))
+    report(f"insert reversed input at head ({COUNT} nodes)", baseline)
+    report(f"append ({COUNT} nodes)", best_of(lambda: append_each(COUNT)), baseline)
+    report(f"extend ({COUNT} nodes)", best_of(lambda: extend(COUNT)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of in-place merge sort against copy-sort-rebuild for the linked lists.
+
+The copy-sort-rebuild baseline copies the data to a Python list, sorts it with
+`sorted` and builds a fresh chain of nodes. Peak memory is measured on top of
+the already built list.
+
+Usage:
+    python -m benchmarks.bench_linked_sort
+"""
+import random
+
+from benchmarks.common import best_of, peak_memory, report
+from data_structures.double_linked_list import DoubleLinkedList, Node
+from data_structures.linked_list import LinkedList
+
+COUNT = 200_000
+
+
+def rebuild_linked(linked: LinkedList) -> LinkedList:
+    rebuilt = LinkedList()
+    rebuilt.extend(sorted(linked))
+    return rebuilt
+
+
+def rebuild_double(dll: DoubleLinkedList) -> DoubleLinkedList:
+    rebuilt = DoubleLinkedList()
+    for value in sorted(dll.traversal_forward()):
+        rebuilt.insert_at_tail(Node(value))
+    return rebuilt
+
+
+def make_linked(values: list[int]) -> LinkedList:
+    linked = LinkedList()
+    linked.extend(values)
+    return linked
+
+
+def make_double(values: list[int]) -> DoubleLinkedList:
+    dll = DoubleLinkedList()
+    for value in values:
+        dll.insert_at_tail(Node(value))
+    return dll
+
+
+def main() -> None:
+    rng = random.Random(0)
+    values = [rng.randrange(COUNT) for _ in range(COUNT)]
+    for name, make, rebuild in (("LinkedList", make_linked, rebuild_linked),
+                                ("DoubleLinkedList", make_double, rebuild_double)):
+        print(f"{name}, {COUNT} random ints")
+        structure = make(values)
+        baseline = best_of(lambda: rebuild(structure), repeat=1)
+        report("copy, sorted(), rebuild", baseline)
+        lists = [make(values) for _ in range(3)]
+        report("in-place merge sort", best_of(lambda: lists.pop().sort()), baseline)
+        print(f"{'peak memory, copy-sort-rebuild':<48} {peak_memory(lambda: rebuild(structure)) / 2**20:>10.1f} MiB")
+        structure = make(values)
+        print(f"{'peak memory, in-place merge sort':<48} {peak_memory(structure.sort) / 2**20:>10.1f} MiB")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of the value-to-nodes index of LinkedList and DoubleLinkedList.
+
+Measures what the index costs (build time and retained memory) against what it
+saves (find, update and delete by value), on lists of unique integers. Lookups
+on the plain lists walk the chain, so they are measured with fewer queries.
+
+Usage:
+    python -m benchmarks.bench_list_index
+"""
+import random
+
+from benchmarks.common import best_of, report, retained_memory
+from data_structures.double_linked_list import DoubleLinkedList, Node
+from data_structures.linked_list import LinkedList
+
+COUNT = 100_000
+QUERIES = 100_000
+SCAN_QUERIES = 200
+
+
+def build_linked(indexed: bool) -> LinkedList:
+    linked = LinkedList(indexed=indexed)
+    linked.extend(range(COUNT))
+    return linked
+
+
+def build_double(indexed: bool) -> DoubleLinkedList:
+    dll = DoubleLinkedList(indexed=indexed)
+    for value in range(COUNT):
+        dll.insert_at_tail(Node(value))
+    return dll
+
+
+def find_all(structure, queries: list) -> None:
+    for value in queries:
+        structure.find(value)
+
+
+def update_all(dll: DoubleLinkedList, queries: list) -> None:
+    for value in queries:
+        dll.update_node(value, value)
+
+
+def remove_all(dll: DoubleLinkedList, queries: list) -> None:
+    for value in queries:
+        dll.remove(value)
+
+
+def per_query(seconds: float, count: int) -> float:
+    return seconds / count * QUERIES
+
+
+def main() -> None:
+    rng = random.Random(37)
+    queries = [rng.randrange(COUNT) for _ in range(QUERIES)]
+    scan_queries = queries[:SCAN_QUERIES]
+    print(f"{COUNT} unique values; lookups scaled to {QUERIES} queries")
+
+    for name, build in (("LinkedList", build_linked), ("DoubleLinkedList", build_double)):
+        print(name)
+        for indexed in (False, True):
+            size = retained_memory(lambda: build(indexed))
+            print(f"{'memory, indexed=' + str(indexed):<48} {size / 2**20:>10.1f} MiB")
+        baseline = best_of(lambda: build(False))
+        report("build, plain", baseline)
+        report("build, indexed", best_of(lambda: build(True)), baseline)
+        plain, indexed = build(False), build(True)
+        baseline = per_query(best_of(lambda: find_all(plain, scan_queries), repeat=1), SCAN_QUERIES)
+        report("find, plain (walk)", baseline)
+        report("find, indexed", best_of(lambda: find_all(indexed, queries)), baseline)
+        print()
+
+    print("DoubleLinkedList by value")
+    plain, indexed = build_double(False), build_double(True)
+    baseline = per_query(best_of(lambda: update_all(plain, scan_queries), repeat=1), SCAN_QUERIES)
+    report("update_node, plain (walk)", baseline)
+    report("update_node, indexed", best_of(lambda: update_all(indexed, queries)), baseline)
+    unique = list(dict.fromkeys(queries))
+    baseline = per_query(best_of(lambda: remove_all(plain, unique[:SCAN_QUERIES]), repeat=1),
+                         SCAN_QUERIES)
+    report("remove, plain (walk)", baseline)
+    seconds = best_of(lambda: remove_all(indexed, unique), repeat=1)
+    report("remove, indexed", per_query(seconds, len(unique)), baseline)
+
+
+if __name__ == "__main__":
+    main()
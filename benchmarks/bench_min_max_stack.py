@@ -0,0 +1,58 @@
+"""
+Benchmark of MinMaxStack aggregate queries against scanning a plain Stack.
+
+A deep stack is built once, then min/max/sum are queried after every push and
+pop of an undo-style workload near its top.
+
+Usage:
+    python -m benchmarks.bench_min_max_stack
+"""
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.min_max_stack import MinMaxStack
+from data_structures.stack_list import Stack
+
+DEPTHS = (1_000, 100_000)
+OPERATIONS = 1_000
+
+
+def workload(stack, queries: callable, steps: list[int]) -> None:
+    for step in steps:
+        if step < 0:
+            stack.pop()
+        else:
+            stack.push(step)
+        queries(stack)
+
+
+def scan(stack: Stack) -> None:
+    min(stack._stack)
+    max(stack._stack)
+    sum(stack._stack)
+
+
+def aggregate(stack: MinMaxStack) -> None:
+    stack.min()
+    stack.max()
+    stack.sum()
+
+
+def main() -> None:
+    rng = random.Random(0)
+    steps = [rng.choice((-1, rng.randrange(1000))) for _ in range(OPERATIONS)]
+    for depth in DEPTHS:
+        base = [rng.randrange(1000) for _ in range(depth)]
+        print(f"stack depth {depth}, {OPERATIONS} push/pop + min/max/sum")
+        plain, tracked = Stack(), MinMaxStack(track_sum=True)
+        for value in base:
+            plain.push(value)
+            tracked.push(value)
+        baseline = best_of(lambda: workload(plain, scan, steps), repeat=1)
+        report("Stack + min/max/sum scans", baseline)
+        report("MinMaxStack aggregates", best_of(lambda: workload(tracked, aggregate, steps), repeat=1), baseline)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark of queue-like churn on the linked lists with and without a NodePool.
+
+Each run keeps a list of fixed length and repeatedly inserts at the tail and
+deletes from the head. Besides wall time, garbage collector runs and the time
+spent in them are recorded through `gc.callbacks`.
+
+Usage:
+    python -m benchmarks.bench_node_pool
+"""
+import gc
+import time
+
+from benchmarks.common import report
+from data_structures import double_linked_list, linked_list
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+from data_structures.node_pool import NodePool
+
+LENGTH = 10_000
+OPERATIONS = 1_000_000
+
+
+class GCMonitor:
+    """Counts garbage collections and the total time spent in them."""
+    def __init__(self) -> None:
+        self.collections = 0
+        self.paused = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.collections += 1
+            self.paused += time.perf_counter() - self._start
+
+
+def churn_linked(pool: NodePool | None) -> None:
+    linked = LinkedList(pool=pool)
+    linked.extend(range(LENGTH))
+    for value in range(OPERATIONS):
+        linked.append(value)
+        linked.pop_head()
+
+
+def churn_double(pool: NodePool | None) -> None:
+    dll = DoubleLinkedList(pool=pool)
+    for value in range(LENGTH):
+        dll.insert_at_tail(dll.new_node(value))
+    for value in range(OPERATIONS):
+        dll.insert_at_tail(dll.new_node(value))
+        dll.delete_from_head()
+
+
+def measure(name: str, func: callable, pool: NodePool | None, baseline: float | None) -> float:
+    monitor = GCMonitor()
+    gc.collect()
+    gc.callbacks.append(monitor)
+    try:
+        start = time.perf_counter()
+        func(pool)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(monitor)
+    report(name, elapsed, baseline)
+    print(f"{'  gc runs / total pause':<48} {monitor.collections:>6} / {monitor.paused * 1000:.1f} ms")
+    if pool is not None:
+        print(f"{'  pool stats':<48} {pool.stats()}")
+    return elapsed
+
+
+def main() -> None:
+    for name, func, node_class in (("LinkedList", churn_linked, linked_list.Node),
+                                   ("DoubleLinkedList", churn_double, double_linked_list.Node)):
+        print(f"{name}, length {LENGTH}, {OPERATIONS} append + delete")
+        baseline = measure("without pool", func, None, None)
+        measure("with pool (cap 1024)", func, NodePool(node_class, cap=1024), baseline)
+        print()
+
+
+if __name__ == "__main__":
+    main()
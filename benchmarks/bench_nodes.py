@@ -0,0 +1,115 @@
+"""
+Memory and throughput benchmark of the slotted Node classes.
+
+For each structure, the slotted node is compared with a subclass that adds
+back a per-instance `__dict__` (the layout the nodes had before `__slots__`).
+Traversals compare the internal fast path with walking the public, validating
+properties.
+
+Usage:
+    python -m benchmarks.bench_nodes
+"""
+from benchmarks.common import best_of, report, retained_memory
+from data_structures import binary_tree, double_linked_list, linked_list
+from data_structures.deque_list import Deque
+
+COUNT = 1_000_000
+
+
+class DictLinkedNode(linked_list.Node):
+    """Singly linked node with a per-instance __dict__."""
+
+
+class DictDoubleNode(double_linked_list.Node):
+    """Doubly linked node with a per-instance __dict__."""
+
+
+class DictTreeNode(binary_tree.Node):
+    """Binary tree node with a per-instance __dict__."""
+
+
+def build_linked(node_class: type) -> linked_list.LinkedList:
+    linked = linked_list.LinkedList()
+    head = None
+    for value in range(COUNT):
+        head = node_class(value, head)
+    linked.head = head
+    return linked
+
+
+def build_double(node_class: type) -> double_linked_list.DoubleLinkedList:
+    dll = double_linked_list.DoubleLinkedList()
+    for value in range(COUNT):
+        dll.insert_at_tail(node_class(value))
+    return dll
+
+
+def build_tree(node_class: type) -> binary_tree.BinaryTree:
+    nodes = [node_class(value) for value in range(COUNT)]
+    for index in range(1, COUNT):
+        parent = nodes[(index - 1) // 2]
+        node = nodes[index]
+        node.parent = parent
+        if index % 2:
+            parent.left = node
+        else:
+            parent.right = node
+    tree = binary_tree.BinaryTree()
+    tree._root = nodes[0]
+    return tree
+
+
+def walk_public_linked(linked: linked_list.LinkedList) -> None:
+    current = linked.head
+    while current is not None:
+        id(current.data)
+        current = current.next
+
+
+def walk_public_double(dll: double_linked_list.DoubleLinkedList) -> None:
+    result = []
+    current = dll.head
+    while current is not None:
+        result.append(current.data)
+        current = current.next
+
+
+def walk_public_tree(tree: binary_tree.BinaryTree) -> None:
+    nodes = []
+    queue = Deque()
+    queue.append(tree.root)
+    while not queue.is_empty():
+        node = queue.pop_left()
+        nodes.append(node)
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+
+def main() -> None:
+    structures = (
+        ("LinkedList", build_linked, linked_list.Node, DictLinkedNode,
+         lambda linked: linked.traversal(id), walk_public_linked),
+        ("DoubleLinkedList", build_double, double_linked_list.Node, DictDoubleNode,
+         lambda dll: dll.traversal_forward(), walk_public_double),
+        ("BinaryTree", build_tree, binary_tree.Node, DictTreeNode,
+         lambda tree: tree.bfs(), walk_public_tree),
+    )
+    for name, build, slotted, with_dict, traverse, walk_public in structures:
+        print(f"{name}, {COUNT} nodes")
+        for label, node_class in (("__dict__ nodes", with_dict), ("__slots__ nodes", slotted)):
+            size = retained_memory(lambda: build(node_class))
+            print(f"{'memory, ' + label:<48} {size / 2**20:>10.1f} MiB")
+        baseline = best_of(lambda: build(with_dict), repeat=1)
+        report("build, __dict__ nodes", baseline)
+        report("build, __slots__ nodes", best_of(lambda: build(slotted), repeat=1), baseline)
+        structure = build(slotted)
+        baseline = best_of(lambda: walk_public(structure))
+        report("traversal through public properties", baseline)
+        report("traversal, internal fast path", best_of(lambda: traverse(structure)), baseline)
+        print()
+
+
+if __name__ == "__main__":
+    main()
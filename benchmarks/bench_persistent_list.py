@@ -0,0 +1,58 @@
+"""
+Memory benchmark of keeping K versions of an N-element history.
+
+Each version adds one value in front of the previous one. The baseline copies
+the previous LinkedList for every version (deep-copying is recursive on a
+linked chain and fails on long lists, so a node-by-node copy is used); the
+PersistentList versions share every cell but the new one.
+
+Usage:
+    python -m benchmarks.bench_persistent_list
+"""
+from benchmarks.common import best_of, report, retained_memory
+from data_structures.linked_list import LinkedList
+from data_structures.persistent_list import PersistentList
+
+SIZE = 10_000
+VERSIONS = 200
+
+
+def copied_versions() -> list:
+    current = LinkedList()
+    current.extend(range(SIZE))
+    versions = [current]
+    for value in range(VERSIONS):
+        current = LinkedList()
+        current.extend(versions[-1])
+        current.insert(value)
+        versions.append(current)
+    return versions
+
+
+def persistent_versions() -> list:
+    current = PersistentList.from_iterable(range(SIZE))
+    versions = [current]
+    for value in range(VERSIONS):
+        current = current.prepend(value)
+        versions.append(current)
+    return versions
+
+
+def main() -> None:
+    print(f"{VERSIONS} versions of a {SIZE}-element list")
+    for label, build in (("LinkedList copy per version", copied_versions),
+                         ("PersistentList.prepend", persistent_versions)):
+        size = retained_memory(build)
+        print(f"{'memory, ' + label:<48} {size / 2**20:>10.1f} MiB")
+    baseline = best_of(copied_versions)
+    report("build, LinkedList copy per version", baseline)
+    report("build, PersistentList.prepend", best_of(persistent_versions), baseline)
+    linked = copied_versions()[-1]
+    persistent = persistent_versions()[-1]
+    baseline = best_of(lambda: sum(linked))
+    report("iteration, LinkedList", baseline)
+    report("iteration, PersistentList", best_of(lambda: sum(persistent)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark of the compact serialization format against default pickling.
+
+Default pickling is reproduced with a Pickler whose `reducer_override` saves
+the structures by their `__dict__`, as pickle did before they defined
+`__reduce__`: it recurses through every node, so linked structures longer
+than a few hundred nodes raise RecursionError and are only measured with
+the compact format. Dump time, load time and output size are reported.
+
+Usage:
+    python -m benchmarks.bench_serialization
+"""
+import copyreg
+import io
+import pickle
+
+from benchmarks.common import best_of, report
+from data_structures.binary_tree import BinaryTree
+from data_structures.deque_list import Deque
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+from data_structures.queue_list import Queue
+from data_structures.serialization import dumps, loads
+from data_structures.stack_list import Stack
+
+SHORT = 200
+LONG = 1_000_000
+TREE = 100_000
+STRUCTURES = (LinkedList, DoubleLinkedList, Deque, Stack, Queue, BinaryTree)
+
+
+class DefaultPickler(pickle.Pickler):
+    def reducer_override(self, obj):
+        if type(obj) in STRUCTURES:
+            return copyreg.__newobj__, (type(obj),), obj.__dict__
+        return NotImplemented
+
+
+def default_dumps(structure) -> bytes:
+    buffer = io.BytesIO()
+    DefaultPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(structure)
+    return buffer.getvalue()
+
+
+def linked_list(values) -> LinkedList:
+    structure = LinkedList()
+    structure.extend(values)
+    return structure
+
+
+def double_linked_list(values) -> DoubleLinkedList:
+    structure = DoubleLinkedList()
+    for value in values:
+        structure.insert_at_tail(structure.new_node(value))
+    return structure
+
+
+def deque(values) -> Deque:
+    structure = Deque()
+    for value in values:
+        structure.append(value)
+    return structure
+
+
+def stack(values) -> Stack:
+    structure = Stack()
+    for value in values:
+        structure.push(value)
+    return structure
+
+
+def tree(values, array_backed: bool) -> BinaryTree:
+    structure = BinaryTree(array_backed=True)
+    for value in values:
+        structure.insert_node(value)
+    if not array_backed:
+        # Same nodes, without the level-order array.
+        structure._nodes = None
+    return structure
+
+
+def measure(label: str, structure) -> None:
+    try:
+        data = default_dumps(structure)
+        baseline_dump = best_of(lambda: default_dumps(structure))
+        baseline_load = best_of(lambda: pickle.loads(data))
+        report(f"{label}: dump, default pickle", baseline_dump)
+        report(f"{label}: load, default pickle", baseline_load)
+        baseline_size = len(data)
+    except RecursionError:
+        print(f"{label + ': default pickle':<48} RecursionError")
+        baseline_dump = baseline_load = baseline_size = None
+    compact = dumps(structure)
+    report(f"{label}: dump, compact", best_of(lambda: dumps(structure)), baseline_dump)
+    report(f"{label}: load, compact", best_of(lambda: loads(compact)), baseline_load)
+    sizes = f"{len(compact) / 1024:>10.1f} KiB"
+    if baseline_size:
+        sizes += f"   x{baseline_size / len(compact):.1f} smaller than {baseline_size / 1024:.1f} KiB"
+    print(f"{'  size':<48} {sizes}")
+
+
+def main() -> None:
+    measure(f"LinkedList of {SHORT} ints", linked_list(range(SHORT)))
+    measure(f"DoubleLinkedList of {SHORT} ints", double_linked_list(range(SHORT)))
+    measure(f"LinkedList of {SHORT} strings", linked_list(str(value) for value in range(SHORT)))
+    measure(f"LinkedList of {LONG} ints", linked_list(range(LONG)))
+    measure(f"DoubleLinkedList of {LONG} floats", double_linked_list(float(value) for value in range(LONG)))
+    measure(f"Deque of {LONG} ints", deque(range(LONG)))
+    measure(f"Stack of {LONG} ints", stack(range(LONG)))
+    measure(f"Stack of {LONG} floats", stack(float(value) for value in range(LONG)))
+    measure(f"Stack of {LONG} strings", stack(str(value) for value in range(LONG)))
+    measure(f"BinaryTree of {TREE} ints, linked", tree(range(TREE), False))
+    measure(f"BinaryTree of {TREE} ints, array-backed", tree(range(TREE), True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark of SkipList against a sorted Python list with `bisect` and the linked lists.
+
+Measures bulk building, membership search, random inserts and deletes, range
+scans and positional access.
+
+Usage:
+    python -m benchmarks.bench_skip_list
+"""
+import bisect
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.double_linked_list import DoubleLinkedList, Node
+from data_structures.linked_list import LinkedList
+from data_structures.skip_list import SkipList
+
+COUNT = 200_000
+QUERIES = 2_000
+LINEAR_QUERIES = 50
+
+
+def main() -> None:
+    rng = random.Random(0)
+    values = sorted(rng.randrange(10 * COUNT) for _ in range(COUNT))
+    queries = [rng.randrange(10 * COUNT) for _ in range(QUERIES)]
+
+    print(f"{COUNT} sorted values")
+    report("SkipList.from_sorted", best_of(lambda: SkipList.from_sorted(values)))
+    skip_list = SkipList.from_sorted(values)
+    sorted_list = list(values)
+    linked = LinkedList()
+    linked.extend(values)
+    dll = DoubleLinkedList()
+    for value in values:
+        dll.insert_at_tail(Node(value))
+    print()
+
+    print(f"search ({QUERIES} queries, linear lists scaled from {LINEAR_QUERIES})")
+
+    def bisect_search() -> None:
+        for query in queries:
+            index = bisect.bisect_left(sorted_list, query)
+            index < len(sorted_list) and sorted_list[index] == query
+
+    baseline = best_of(bisect_search)
+    report("sorted list + bisect", baseline)
+    report("SkipList.find", best_of(lambda: [skip_list.find(query) for query in queries]), baseline)
+    scale = QUERIES / LINEAR_QUERIES
+    report("LinkedList.find",
+           best_of(lambda: [linked.find(query) for query in queries[:LINEAR_QUERIES]], repeat=1) * scale,
+           baseline)
+    report("DoubleLinkedList.find",
+           best_of(lambda: [dll.find(query) for query in queries[:LINEAR_QUERIES]], repeat=1) * scale,
+           baseline)
+    print()
+
+    print(f"{QUERIES} inserts then {QUERIES} deletes")
+
+    def bisect_updates() -> None:
+        for query in queries:
+            bisect.insort(sorted_list, query)
+        for query in queries:
+            del sorted_list[bisect.bisect_left(sorted_list, query)]
+
+    def skip_updates() -> None:
+        for query in queries:
+            skip_list.insert(query)
+        for query in queries:
+            skip_list.delete(query)
+
+    baseline = best_of(bisect_updates)
+    report("sorted list + insort / del", baseline)
+    report("SkipList.insert / delete", best_of(skip_updates), baseline)
+    print()
+
+    print(f"{QUERIES} range scans of ~100 values and positional reads")
+
+    def bisect_ranges() -> None:
+        for query in queries:
+            sorted_list[bisect.bisect_left(sorted_list, query):bisect.bisect_left(sorted_list, query + 1000)]
+
+    baseline = best_of(bisect_ranges)
+    report("sorted list slices", baseline)
+    report("SkipList.range",
+           best_of(lambda: [list(skip_list.range(query, query + 1000)) for query in queries]), baseline)
+    positions = [rng.randrange(COUNT) for _ in range(QUERIES)]
+    baseline = best_of(lambda: [sorted_list[position] for position in positions])
+    report("sorted list indexing", baseline)
+    report("SkipList indexing", best_of(lambda: [skip_list[position] for position in positions]), baseline)
+
+
+if __name__ == "__main__":
+    main()
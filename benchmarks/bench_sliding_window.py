@@ -0,0 +1,66 @@
+"""
+Benchmark of SlidingWindow against naive recomputation and `pandas.rolling`.
+
+Each run pushes a stream of random floats through a count-based window and
+reads the minimum and maximum after every value.
+
+Usage:
+    python -m benchmarks.bench_sliding_window
+"""
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.sliding_window import SlidingWindow
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = pd = None
+
+STREAM_LENGTH = 20_000
+WINDOW_SIZES = (16, 256, 4096)
+
+
+def streaming(values: list[float], size: int) -> None:
+    window = SlidingWindow(size=size)
+    for value in values:
+        window.push(value)
+        window.min()
+        window.max()
+
+
+def naive(values: list[float], size: int) -> None:
+    for end in range(1, len(values) + 1):
+        recent = values[max(0, end - size):end]
+        min(recent)
+        max(recent)
+
+
+def rolling(series: "pd.Series", size: int) -> None:
+    rolled = series.rolling(size, min_periods=1)
+    rolled.min()
+    rolled.max()
+
+
+def main() -> None:
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(STREAM_LENGTH)]
+    for size in WINDOW_SIZES:
+        print(f"window size {size}, {STREAM_LENGTH} values")
+        baseline = best_of(lambda: naive(values, size), repeat=1)
+        report("naive recomputation", baseline)
+        report("SlidingWindow.push + min/max", best_of(lambda: streaming(values, size)), baseline)
+        if pd is not None:
+            series = pd.Series(np.array(values))
+            report("pandas rolling min/max (vectorized)", best_of(lambda: rolling(series, size)), baseline)
+            array = np.array(values)
+            report("SlidingWindow.push_many(ndarray)",
+                   best_of(lambda: SlidingWindow(size=size).push_many(array)))
+        else:
+            print("pandas/numpy not installed, skipping pandas.rolling")
+        print()
+
+
+if __name__ == "__main__":
+    main()
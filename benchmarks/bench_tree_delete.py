@@ -0,0 +1,60 @@
+"""
+Delete-heavy workload on a BinaryTree with and without a value index.
+
+The tree is filled with COUNT distinct values, then DELETES random values are
+deleted and re-inserted. Without an index, each delete is a full scan in
+`find`; the linked mode also scans level order for `last_node`. With an
+index, `find` is a dict lookup, so an indexed array-backed tree deletes in
+O(1), while an indexed linked tree still walks once to the last node, and
+its re-inserts still search for the first free slot.
+
+Usage:
+    python -m benchmarks.bench_tree_delete
+"""
+import random
+
+from benchmarks.common import best_of, report, retained_memory
+from data_structures.binary_tree import BinaryTree
+
+COUNT = 100_000
+DELETES = 200
+
+
+def build(array_backed: bool, indexed: bool) -> BinaryTree:
+    tree = BinaryTree(array_backed=True, indexed=indexed)
+    for value in range(COUNT):
+        tree.insert_node(value)
+    if not array_backed:
+        # Reuse the O(1) array-backed build, then drop the array.
+        tree._nodes = None
+    return tree
+
+
+def churn(tree: BinaryTree, targets: list[int], deletes: int) -> None:
+    for value in targets[:deletes]:
+        tree.delete_node(value)
+        tree.insert_node(value)
+
+
+def main() -> None:
+    targets = random.Random(1).sample(range(COUNT), DELETES)
+    print(f"{COUNT} values")
+    for array_backed in (False, True):
+        mode = "array-backed" if array_backed else "linked"
+        baseline = None
+        for indexed in (False, True):
+            # The slow variants run a quarter of the operations, scaled to DELETES.
+            deletes = DELETES if indexed and array_backed else DELETES // 4
+            tree = build(array_backed, indexed)
+            seconds = best_of(lambda: churn(tree, targets, deletes), repeat=1) * DELETES / deletes
+            label = f"{mode}{', indexed' if indexed else ''}: {DELETES} delete + insert"
+            report(label, seconds, baseline)
+            baseline = baseline or seconds
+        for indexed in (False, True):
+            memory = retained_memory(lambda: build(array_backed, indexed))
+            print(f"{'memory, ' + mode + (', indexed' if indexed else ''):<48} "
+                  f"{memory / 2**20:>10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of BinaryTree.find on a large linked tree.
+
+The baseline is the previous `find`, which built the whole `bfs()` list and
+then scanned it. The current `find` walks `iter_bfs()` and stops at the first
+match, so its cost depends on how deep the target is rather than on the size
+of the tree. Latency and peak memory are measured for a target near the root,
+one in the middle of the level order and a missing one.
+
+Usage:
+    python -m benchmarks.bench_tree_find
+"""
+from benchmarks.common import best_of, peak_memory, report
+from data_structures.binary_tree import BinaryTree, Node
+from data_structures.deque_list import Deque
+
+COUNT = 1_000_000
+
+
+def build() -> BinaryTree:
+    # Build through the array-backed mode, whose insert is O(1), then expose the
+    # same nodes through a linked tree.
+    array_tree = BinaryTree(array_backed=True)
+    for value in range(COUNT):
+        array_tree.insert_node(value)
+    tree = BinaryTree()
+    tree._root = array_tree.root
+    return tree
+
+
+def materialized_find(tree: BinaryTree, target: any) -> Node | None:
+    nodes = []
+    traversal_queue = Deque()
+    traversal_queue.append(tree.root)
+    while not traversal_queue.is_empty():
+        current = traversal_queue.pop_left()
+        nodes.append(current)
+        if current._left:
+            traversal_queue.append(current._left)
+        if current._right:
+            traversal_queue.append(current._right)
+    for node in nodes:
+        if node._value == target:
+            return node
+    return None
+
+
+def main() -> None:
+    tree = build()
+    print(f"{COUNT} nodes")
+    for label, target in (("near root", 5), ("middle", COUNT // 2), ("missing", -1)):
+        baseline = best_of(lambda: materialized_find(tree, target))
+        report(f"find {label}, materialized bfs()", baseline)
+        report(f"find {label}, iter_bfs()", best_of(lambda: tree.find(target)), baseline)
+        for name, func in (("materialized bfs()", materialized_find), ("iter_bfs()", BinaryTree.find)):
+            peak = peak_memory(lambda: func(tree, target))
+            print(f"{'  peak memory, ' + name:<48} {peak / 2**20:>10.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of the recursive, iterative and Morris traversals of BinaryTree.
+
+Times the three depth-first orders with every method on a balanced tree and
+on skewed chains. The chain of 900 nodes stays under the default recursion
+limit; the deep chain only runs the iterative and Morris methods, since the
+recursive one raises RecursionError there. Peak memory is reported for the
+in-order traversal of the deep chain, where the iterative stack holds every
+node while Morris only holds the result list.
+
+Usage:
+    python -m benchmarks.bench_tree_traversals
+"""
+from benchmarks.common import best_of, peak_memory, report
+from data_structures.binary_tree import BinaryTree, Node
+
+BALANCED = 2**18 - 1
+SHALLOW_CHAIN = 900
+DEEP_CHAIN = 200_000
+ORDERS = ("pre", "in", "post")
+
+
+def balanced_tree() -> BinaryTree:
+    tree = BinaryTree(array_backed=True)
+    for value in range(BALANCED):
+        tree.insert_node(value)
+    return tree
+
+
+def chain(count: int) -> BinaryTree:
+    # A left-skewed chain, the worst case for the iterative stack.
+    tree = BinaryTree()
+    tree._root = current = Node(0)
+    for value in range(1, count):
+        current.left = Node(value, parent=current)
+        current = current.left
+    return tree
+
+
+def main() -> None:
+    shapes = ((f"balanced {BALANCED}", balanced_tree(), ("recursive", "iterative", "morris")),
+              (f"chain {SHALLOW_CHAIN}", chain(SHALLOW_CHAIN), ("recursive", "iterative", "morris")),
+              (f"chain {DEEP_CHAIN}", chain(DEEP_CHAIN), ("iterative", "morris")))
+    for label, tree, methods in shapes:
+        for order in ORDERS:
+            traversal = getattr(tree, f"{order}_order_traversal")
+            baseline = None
+            for method in methods:
+                seconds = best_of(lambda: traversal(method))
+                report(f"{label}, {order}-order, {method}", seconds, baseline)
+                baseline = baseline or seconds
+    tree = shapes[-1][1]
+    for method in ("iterative", "morris"):
+        peak = peak_memory(lambda: tree.in_order_traversal(method))
+        print(f"{'peak memory, deep chain in-order, ' + method:<48} {peak / 2**20:>10.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
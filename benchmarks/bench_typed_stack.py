@@ -0,0 +1,65 @@
+"""
+Benchmark of TypedStack against the list-backed Stack.
+
+Measures the memory held by a stack of one million floats and the throughput
+of element-by-element and batch push/pop.
+
+Usage:
+    python -m benchmarks.bench_typed_stack
+"""
+from array import array
+
+from benchmarks.common import best_of, report, retained_memory
+from data_structures.stack_list import Stack
+from data_structures.typed_stack import TypedStack
+
+COUNT = 1_000_000
+BATCH = 1_000
+
+
+def fill_stack(values: any) -> Stack:
+    stack = Stack()
+    for value in values:
+        stack.push(value)
+    return stack
+
+
+def fill_typed(values: any) -> TypedStack:
+    stack = TypedStack('d')
+    for value in values:
+        stack.push(value)
+    return stack
+
+
+def drain(stack) -> None:
+    while not stack.is_empty():
+        stack.pop()
+
+
+def batch_typed(values: array) -> None:
+    stack = TypedStack('d')
+    for start in range(0, len(values), BATCH):
+        stack.push_many(values[start:start + BATCH])
+    while not stack.is_empty():
+        stack.pop_many(BATCH)
+
+
+def main() -> None:
+    values = [index * 0.5 for index in range(COUNT)]
+    packed = array('d', values)
+
+    print(f"memory held by {COUNT} freshly computed floats")
+    for name, fill in (("Stack", fill_stack), ("TypedStack", fill_typed)):
+        size = retained_memory(lambda: fill(value + 0.25 for value in values))
+        print(f"{name:<48} {size / 2**20:>10.1f} MiB")
+    print()
+
+    print(f"throughput for {COUNT} floats")
+    baseline = best_of(lambda: drain(fill_stack(values)))
+    report("Stack push + pop", baseline)
+    report("TypedStack push + pop", best_of(lambda: drain(fill_typed(values))), baseline)
+    report(f"TypedStack push_many + pop_many ({BATCH})", best_of(lambda: batch_typed(packed)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of UnrolledLinkedList against DoubleLinkedList and LinkedList.
+
+Measures full scans (traversal and an unsuccessful find) and random positional
+inserts and deletes.
+
+Usage:
+    python -m benchmarks.bench_unrolled_list
+"""
+import random
+
+from benchmarks.common import best_of, report
+from data_structures.double_linked_list import DoubleLinkedList, Node
+from data_structures.linked_list import LinkedList
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+COUNT = 200_000
+POSITIONAL = 500
+
+
+def main() -> None:
+    linked = LinkedList()
+    linked.extend(range(COUNT))
+    dll = DoubleLinkedList()
+    for value in range(COUNT):
+        dll.insert_at_tail(Node(value))
+    unrolled = {}
+    for capacity in (16, 64):
+        unrolled[capacity] = UnrolledLinkedList(capacity)
+        for value in range(COUNT):
+            unrolled[capacity].insert_at_tail(value)
+
+    print(f"scans over {COUNT} values")
+    baseline = best_of(lambda: dll.traversal_forward())
+    report("DoubleLinkedList.traversal_forward", baseline)
+    report("LinkedList list(iter)", best_of(lambda: list(linked)), baseline)
+    for capacity, structure in unrolled.items():
+        report(f"UnrolledLinkedList({capacity}).traversal_forward",
+               best_of(structure.traversal_forward), baseline)
+    baseline = best_of(lambda: dll.find(-1))
+    report("DoubleLinkedList.find (missing value)", baseline)
+    report("LinkedList.find (missing value)", best_of(lambda: linked.find(-1)), baseline)
+    for capacity, structure in unrolled.items():
+        report(f"UnrolledLinkedList({capacity}).find (missing value)",
+               best_of(lambda: structure.find(-1)), baseline)
+    print()
+
+    rng = random.Random(0)
+    positions = [rng.randrange(COUNT) for _ in range(POSITIONAL)]
+    print(f"{POSITIONAL} random inserts + deletes at a position")
+
+    def positional(structure, make) -> None:
+        for position in positions:
+            structure.insert_at_position(make(position), position)
+            structure.delete_from_position(position)
+
+    baseline = best_of(lambda: positional(dll, Node), repeat=1)
+    report("DoubleLinkedList", baseline)
+    for capacity, structure in unrolled.items():
+        report(f"UnrolledLinkedList({capacity})",
+               best_of(lambda: positional(structure, int), repeat=1), baseline)
+
+
+if __name__ == "__main__":
+    main()
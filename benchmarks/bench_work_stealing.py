@@ -0,0 +1,114 @@
+"""
+Benchmark of WorkStealingPool against a pool that shares a single FIFO queue.
+
+Both pools run the same fork-join workloads: summing a BinaryTree by forking
+on each subtree, and a parallel merge sort. Under the GIL the threads do not
+run Python code in parallel, so the numbers mostly reflect scheduling overhead;
+run on a free-threaded build to see scaling.
+
+Usage:
+    python -m benchmarks.bench_work_stealing
+"""
+import random
+import sys
+
+from benchmarks.common import best_of, report
+from data_structures.binary_tree import BinaryTree, Node
+from data_structures.work_stealing import WorkStealingDeque, WorkStealingPool
+
+TREE_SIZE = 2**15 - 1
+SORT_SIZE = 200_000
+CUTOFF = 2_000
+WORKERS = (1, 2, 4)
+
+
+class SharedQueuePool(WorkStealingPool):
+    """Same scheduler, but every worker takes the oldest task from one shared queue."""
+    def __init__(self, workers: int) -> None:
+        self._shared = WorkStealingDeque()
+        super().__init__(workers)
+        self._deques = [self._shared] * workers
+
+    def _find_task(self, index: int):
+        return self._shared.steal()
+
+
+def build_tree(size: int) -> BinaryTree:
+    nodes = [Node(value) for value in range(size)]
+    for index, node in enumerate(nodes[1:], 1):
+        parent = nodes[(index - 1) // 2]
+        node.parent = parent
+        if index % 2:
+            parent.left = node
+        else:
+            parent.right = node
+    tree = BinaryTree()
+    tree._root = nodes[0]
+    return tree
+
+
+def subtree_sum(node) -> int:
+    total = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            total += node.value
+            stack.append(node.left)
+            stack.append(node.right)
+    return total
+
+
+def tree_sum(pool, node, depth: int = 0) -> int:
+    if node is None:
+        return 0
+    if depth >= 6:
+        return subtree_sum(node)
+    left = pool.submit(tree_sum, pool, node.left, depth + 1)
+    right = tree_sum(pool, node.right, depth + 1)
+    return node.value + right + pool.join(left)
+
+
+def merge_sort(pool, values: list) -> list:
+    if len(values) <= CUTOFF:
+        return sorted(values)
+    middle = len(values) // 2
+    left = pool.submit(merge_sort, pool, values[:middle])
+    right = merge_sort(pool, values[middle:])
+    left = pool.join(left)
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    tree = build_tree(TREE_SIZE)
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(SORT_SIZE)]
+    for workers in WORKERS:
+        print(f"{workers} worker(s)")
+        for name, pool_class in (("shared queue", SharedQueuePool), ("work stealing", WorkStealingPool)):
+            pool = pool_class(workers)
+            try:
+                report(f"tree sum ({TREE_SIZE} nodes), {name}",
+                       best_of(lambda: pool.run(tree_sum, pool, tree.root)))
+                report(f"merge sort ({SORT_SIZE} floats), {name}",
+                       best_of(lambda: pool.run(merge_sort, pool, values)))
+            finally:
+                pool.shutdown()
+        print()
+
+
+if __name__ == "__main__":
+    main()
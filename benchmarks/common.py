@@ -0,0 +1,95 @@
+"""
+common.py
+=========
+
+Small helpers shared by the benchmark scripts in this folder.
+
+Every benchmark is a plain script that only needs the standard library:
+    python -m benchmarks.bench_sliding_window
+
+Functions:
+    - best_of: Runs a callable several times and returns the fastest wall time.
+    - peak_memory: Returns the peak number of bytes allocated by a callable.
+    - retained_memory: Returns the number of bytes still held by what a callable returns.
+    - report: Prints one aligned result line, optionally relative to a baseline.
+"""
+import gc
+import time
+import tracemalloc
+
+
+def best_of(func: callable, repeat: int = 3) -> float:
+    """
+    Runs a callable several times and returns the fastest run.
+
+    Args:
+        func (callable): The function to time. It is called without arguments.
+        repeat (int): How many times the function is run.
+
+    Returns:
+        float: The fastest wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func: callable) -> int:
+    """
+    Measures the peak memory allocated while a callable runs.
+
+    Args:
+        func (callable): The function to measure. It is called without arguments.
+
+    Returns:
+        int: The peak number of bytes traced by `tracemalloc`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def retained_memory(func: callable) -> int:
+    """
+    Measures the memory kept alive by the object a callable returns.
+
+    Args:
+        func (callable): The function building the object. It is called without arguments.
+
+    Returns:
+        int: The number of traced bytes still allocated once the function returned.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def report(name: str, seconds: float, baseline: float | None = None) -> None:
+    """
+    Prints a benchmark result.
+
+    Args:
+        name (str): The label of the measured operation.
+        seconds (float): The measured time in seconds.
+        baseline (float, optional): A reference time used to print a speedup.
+    """
+    line = f"{name:<48} {seconds * 1000:>10.2f} ms"
+    if baseline is not None and seconds > 0:
+        line += f"   x{baseline / seconds:.1f}"
+    print(line)
@@ -0,0 +1,656 @@
+"""
+array_linked_list.py
+====================
+
+This module implements a doubly linked list stored in parallel arrays.
+
+Instead of one node object per value, the list keeps three growable arrays:
+the data of each slot, and the slot numbers of its next and previous
+neighbours. A slot number is the handle of a value, and -1 stands for "no
+slot". Links are plain integers in `array('q')` buffers, so the list holds no
+reference cycles and the garbage collector only ever sees one list of data
+instead of millions of nodes. Freed slots are chained on a free list through
+the `next` array and reused by later inserts.
+
+Classes:
+    - ArrayDoubleLinkedList: Provides the operations of `DoubleLinkedList`,
+      working with values and integer handles instead of nodes.
+
+Usage:
+    dll = ArrayDoubleLinkedList()
+    first = dll.insert_at_tail(10)
+    dll.insert_at_tail(20)
+    dll.insert_at_head(5)
+    dll.traversal_forward()          # Output: [5, 10, 20]
+    dll.get(first)                   # Output: 10
+    dll.delete(first)                # Output: 10
+    list(reversed(dll))              # Output: [20, 5]
+"""
+from array import array
+from heapq import merge
+
+NULL = -1
+FREE = -2
+
+
+class ArrayDoubleLinkedList:
+    """
+    A doubly linked list whose links are integer handles into parallel arrays.
+
+    Handles stay valid until their value is deleted; a freed handle may be
+    handed out again by a later insert.
+
+    Attributes:
+        _data (list): The data of each slot, None for free slots.
+        _next (array): The handle of the next slot, NULL at the tail. Free slots
+            link to the next free slot instead.
+        _previous (array): The handle of the previous slot, NULL at the head and
+            FREE for free slots.
+        _head (int): The handle of the first value, or NULL.
+        _tail (int): The handle of the last value, or NULL.
+        _free (int): The first slot of the free list, or NULL.
+        _size (int): The number of values in the list.
+        _version (int): Incremented by every change to the links, so iterators
+            can detect that the list changed under them.
+    """
+
+    def __init__(self, values: any = None) -> None:
+        """
+        Initializes a list, optionally holding the values of an iterable.
+
+        Args:
+            values (iterable, optional): The initial values, from head to tail.
+        """
+        self._version = 0
+        self.clear()
+        if values is not None:
+            for value in values:
+                self.insert_at_tail(value)
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._size == 0
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the number of allocated slots, used or free.
+
+        Returns:
+            int: The length of the parallel arrays.
+        """
+        return len(self._data)
+
+    @property
+    def head(self) -> int | None:
+        """
+        Returns the handle of the first value.
+
+        Returns:
+            int | None: The head handle, or None if the list is empty.
+        """
+        return None if self._head == NULL else self._head
+
+    @property
+    def tail(self) -> int | None:
+        """
+        Returns the handle of the last value.
+
+        Returns:
+            int | None: The tail handle, or None if the list is empty.
+        """
+        return None if self._tail == NULL else self._tail
+
+    def get(self, handle: int) -> any:
+        """
+        Returns the value stored under a handle.
+
+        Args:
+            handle (int): A handle of this list.
+
+        Returns:
+            any: The value of the slot.
+
+        Raises:
+            ValueError: If the handle is not in use.
+        """
+        self._check(handle)
+        return self._data[handle]
+
+    def next_of(self, handle: int) -> int | None:
+        """
+        Returns the handle following a handle.
+
+        Args:
+            handle (int): A handle of this list.
+
+        Returns:
+            int | None: The next handle, or None at the tail.
+
+        Raises:
+            ValueError: If the handle is not in use.
+        """
+        self._check(handle)
+        following = self._next[handle]
+        return None if following == NULL else following
+
+    def previous_of(self, handle: int) -> int | None:
+        """
+        Returns the handle preceding a handle.
+
+        Args:
+            handle (int): A handle of this list.
+
+        Returns:
+            int | None: The previous handle, or None at the head.
+
+        Raises:
+            ValueError: If the handle is not in use.
+        """
+        self._check(handle)
+        preceding = self._previous[handle]
+        return None if preceding == NULL else preceding
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is in the list.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            bool: True if the value is found, False otherwise.
+        """
+        return self.find(value) is not None
+
+    def __iter__(self):
+        """
+        Lazily yields the values from head to tail.
+
+        Yields:
+            any: Each value of the list.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        return self._iterate(self._head, self._next, True, self._version)
+
+    def __reversed__(self):
+        """
+        Lazily yields the values from tail to head.
+
+        Yields:
+            any: Each value of the list.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        return self._iterate(self._tail, self._previous, True, self._version)
+
+    def iter_handles(self, reverse: bool = False):
+        """
+        Lazily yields the handles of the list.
+
+        Args:
+            reverse (bool): Whether to walk from tail to head. Defaults to False.
+
+        Yields:
+            int: Each handle of the list.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        if reverse:
+            return self._iterate(self._tail, self._previous, False, self._version)
+        return self._iterate(self._head, self._next, False, self._version)
+
+    def _iterate(self, handle: int, links: array, values: bool, version: int):
+        """
+        Walks the list from a slot, failing fast if the list changes.
+
+        The caller passes the version of the list when the iterator is created,
+        so a change made before the first `next()` is caught too.
+
+        Args:
+            handle (int): The first handle, or NULL.
+            links (array): The `_next` or `_previous` array to follow.
+            values (bool): Whether to yield the values instead of the handles.
+            version (int): The version of the list when iteration began.
+
+        Yields:
+            any: Each handle, or its value.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        if self._version != version:
+            raise RuntimeError("ArrayDoubleLinkedList changed during iteration")
+        data = self._data
+        while handle != NULL:
+            yield data[handle] if values else handle
+            if self._version != version:
+                raise RuntimeError("ArrayDoubleLinkedList changed during iteration")
+            handle = links[handle]
+
+    def insert_at_head(self, data: any) -> int:
+        """
+        Inserts a value at the beginning of the list.
+
+        Args:
+            data (any): The value to be inserted.
+
+        Returns:
+            int: The handle of the new value.
+        """
+        handle = self._allocate(data)
+        self._next[handle] = self._head
+        self._previous[handle] = NULL
+        if self._head == NULL:
+            self._tail = handle
+        else:
+            self._previous[self._head] = handle
+        self._head = handle
+        self._size += 1
+        self._version += 1
+        return handle
+
+    def insert_at_tail(self, data: any) -> int:
+        """
+        Inserts a value at the end of the list.
+
+        Args:
+            data (any): The value to be inserted.
+
+        Returns:
+            int: The handle of the new value.
+        """
+        handle = self._allocate(data)
+        self._next[handle] = NULL
+        self._previous[handle] = self._tail
+        if self._tail == NULL:
+            self._head = handle
+        else:
+            self._next[self._tail] = handle
+        self._tail = handle
+        self._size += 1
+        self._version += 1
+        return handle
+
+    def insert_at_position(self, data: any, position: int) -> int:
+        """
+        Inserts a value at a specific position in the list.
+
+        Args:
+            data (any): The value to be inserted.
+            position (int): The position where the value should be inserted.
+
+        Returns:
+            int: The handle of the new value.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0 or position > self._size:
+            raise IndexError("Position must be a valid index")
+        if position == 0:
+            return self.insert_at_head(data)
+        if position == self._size:
+            return self.insert_at_tail(data)
+        current = self._handle_at(position)
+        preceding = self._previous[current]
+        handle = self._allocate(data)
+        self._previous[handle] = preceding
+        self._next[handle] = current
+        self._next[preceding] = handle
+        self._previous[current] = handle
+        self._size += 1
+        self._version += 1
+        return handle
+
+    def delete(self, handle: int) -> any:
+        """
+        Deletes the value stored under a handle in O(1).
+
+        Args:
+            handle (int): A handle of this list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            ValueError: If the handle is not in use.
+        """
+        self._check(handle)
+        following, preceding = self._next[handle], self._previous[handle]
+        if preceding == NULL:
+            self._head = following
+        else:
+            self._next[preceding] = following
+        if following == NULL:
+            self._tail = preceding
+        else:
+            self._previous[following] = preceding
+        self._size -= 1
+        self._version += 1
+        data = self._data[handle]
+        self._data[handle] = None
+        self._previous[handle] = FREE
+        self._next[handle] = self._free
+        self._free = handle
+        return data
+
+    def delete_from_head(self) -> any:
+        """
+        Deletes the value at the beginning of the list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+        return self.delete(self._head)
+
+    def delete_from_tail(self) -> any:
+        """
+        Deletes the value at the end of the list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+        return self.delete(self._tail)
+
+    def delete_from_position(self, position: int) -> any:
+        """
+        Deletes the value at a specific position.
+
+        Args:
+            position (int): The position of the value to be deleted.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position out of bounds, must be between 0 and {self._size - 1}")
+        return self.delete(self._handle_at(position))
+
+    def remove(self, value: any) -> None:
+        """
+        Deletes the first occurrence of a value.
+
+        Args:
+            value (any): The value to delete.
+
+        Raises:
+            ValueError: If the value is not found.
+        """
+        handle = self.find(value)
+        if handle is None:
+            raise ValueError(f"Node with data {value} not found in the list.")
+        self.delete(handle)
+
+    def handle_at(self, position: int) -> int:
+        """
+        Returns the handle of the value at a specific position.
+
+        Args:
+            position (int): The position of the value.
+
+        Returns:
+            int: The handle at the position.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position out of bounds, must be between 0 and {self._size - 1}")
+        return self._handle_at(position)
+
+    def find(self, value: any) -> int | None:
+        """
+        Finds the handle of the first occurrence of a value.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            int | None: The handle of the value, or None if not found.
+        """
+        data, links = self._data, self._next
+        handle = self._head
+        while handle != NULL:
+            if data[handle] == value:
+                return handle
+            handle = links[handle]
+        return None
+
+    def update_node(self, old_data: any, new_data: any) -> None:
+        """
+        Replaces the first occurrence of a value.
+
+        Args:
+            old_data (any): The value to search for.
+            new_data (any): The value that replaces it.
+
+        Raises:
+            IndexError: If the list is empty.
+            ValueError: If the value is not found.
+        """
+        if self.is_empty():
+            raise IndexError("Cannot update empty list.")
+        handle = self.find(old_data)
+        if handle is None:
+            raise ValueError(f"Node with data {old_data} not found in the list.")
+        self._data[handle] = new_data
+
+    def traversal_forward(self) -> list:
+        """
+        Returns the values of the list from head to tail.
+
+        Returns:
+            list: The values from head to tail.
+        """
+        return list(self)
+
+    def traversal_backward(self) -> list:
+        """
+        Returns the values of the list from tail to head.
+
+        Returns:
+            list: The values from tail to head.
+        """
+        return list(reversed(self))
+
+    def sort(self, key=None, reverse=False) -> None:
+        """
+        Sorts the list in place with a stable sort, keeping every handle.
+
+        Args:
+            key (callable, optional): Function extracting the comparison key from
+                each value. Defaults to the value itself.
+            reverse (bool): Whether to sort in descending order. Defaults to False.
+        """
+        data = self._data
+        handles = list(self.iter_handles())
+        if key is None:
+            handles.sort(key=data.__getitem__, reverse=reverse)
+        else:
+            handles.sort(key=lambda handle: key(data[handle]), reverse=reverse)
+        self._relink(handles)
+
+    def merge_sorted(self, other: 'ArrayDoubleLinkedList', key=None, reverse=False) -> None:
+        """
+        Merges another sorted list into this sorted list in O(n + m).
+
+        Both lists must already be sorted with the same key and order. The
+        values of `other` are copied into new slots of this list, which leaves
+        `other` empty. The merge is stable: on ties, the values of this list
+        come first.
+
+        Args:
+            other (ArrayDoubleLinkedList): The sorted list to merge into this one.
+            key (callable, optional): Function extracting the comparison key from
+                each value. Defaults to the value itself.
+            reverse (bool): Whether the lists are sorted in descending order.
+
+        Raises:
+            TypeError: If other is not an ArrayDoubleLinkedList.
+            ValueError: If other is this list.
+        """
+        if not isinstance(other, ArrayDoubleLinkedList):
+            raise TypeError("Can only merge another ArrayDoubleLinkedList")
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        data = self._data
+        own = ((data[handle], handle) for handle in self.iter_handles())
+        incoming = ((value, NULL) for value in list(other))
+        extract = (lambda item: item[0]) if key is None else (lambda item: key(item[0]))
+        handles = [handle if handle != NULL else self._allocate(value)
+                   for value, handle in merge(own, incoming, key=extract, reverse=reverse)]
+        self._relink(handles)
+        other.clear()
+
+    def concat(self, other: 'ArrayDoubleLinkedList') -> None:
+        """
+        Moves the values of another list to the end of this list.
+
+        Both lists have their own arrays, so the values are copied into new
+        slots of this list in O(m), which leaves `other` empty.
+
+        Args:
+            other (ArrayDoubleLinkedList): The list to append to this one.
+
+        Raises:
+            TypeError: If other is not an ArrayDoubleLinkedList.
+            ValueError: If other is this list.
+        """
+        if not isinstance(other, ArrayDoubleLinkedList):
+            raise TypeError("Can only concatenate another ArrayDoubleLinkedList")
+        if other is self:
+            raise ValueError("Cannot concatenate a list to itself")
+        for value in other:
+            self.insert_at_tail(value)
+        other.clear()
+
+    def clear(self) -> None:
+        """
+        Clears all values from the list in O(1), dropping the arrays.
+
+        Every handle becomes invalid.
+        """
+        self._data = []
+        self._next = array("q")
+        self._previous = array("q")
+        self._head = self._tail = self._free = NULL
+        self._size = 0
+        self._version += 1
+
+    def _allocate(self, data: any) -> int:
+        """
+        Takes a slot from the free list, or grows the arrays by one slot.
+
+        The links of the returned slot must be set by the caller.
+
+        Args:
+            data (any): The value to store in the slot.
+
+        Returns:
+            int: The handle of the slot.
+        """
+        if self._free != NULL:
+            handle = self._free
+            self._free = self._next[handle]
+            self._data[handle] = data
+            return handle
+        self._data.append(data)
+        self._next.append(NULL)
+        self._previous.append(NULL)
+        return len(self._data) - 1
+
+    def _check(self, handle: int) -> None:
+        """
+        Verifies that a handle refers to a value of the list.
+
+        Args:
+            handle (int): The handle to check.
+
+        Raises:
+            ValueError: If the handle is out of range or its slot is free.
+        """
+        if not 0 <= handle < len(self._data) or self._previous[handle] == FREE:
+            raise ValueError(f"Handle {handle} is not in use")
+
+    def _handle_at(self, position: int) -> int:
+        """
+        Walks to a valid position from the closer end of the list.
+
+        Args:
+            position (int): The position, between 0 and size - 1.
+
+        Returns:
+            int: The handle at the position.
+        """
+        if position <= self._size - 1 - position:
+            handle, links, steps = self._head, self._next, position
+        else:
+            handle, links, steps = self._tail, self._previous, self._size - 1 - position
+        for _ in range(steps):
+            handle = links[handle]
+        return handle
+
+    def _relink(self, handles: list) -> None:
+        """
+        Links every slot of a list of handles in order, replacing the current order.
+
+        Args:
+            handles (list): The handles of every value, from head to tail.
+        """
+        following, preceding = self._next, self._previous
+        last = NULL
+        for handle in handles:
+            preceding[handle] = last
+            if last != NULL:
+                following[last] = handle
+            last = handle
+        if last != NULL:
+            following[last] = NULL
+        self._head = handles[0] if handles else NULL
+        self._tail = last
+        self._size = len(handles)
+        self._version += 1
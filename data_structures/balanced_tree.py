@@ -0,0 +1,779 @@
+"""
+balanced_tree.py
+================
+
+This module implements ordered maps on self-balancing binary search trees.
+
+Two balancing schemes share one interface:
+
+- AVL trees keep the heights of the two subtrees of every node within one of
+  each other. They are the more rigidly balanced, which makes searches a bit
+  shorter.
+- Red-black trees (as in CLRS, with parent pointers) colour every node so that
+  no red node has a red child and every path from a node down to a missing
+  child crosses the same number of black nodes. They rotate less on updates.
+
+Both keep the height in O(log n), so insertion, search and deletion run in
+O(log n). Every node also stores the size of its subtree, which gives rank and
+select (order statistics) in O(log n). Nodes reuse the parent/left/right shape
+of `binary_tree.Node`, with the mapped value in `value`.
+
+Classes:
+    - BalancedNode: A node of a balanced tree, holding a key, a value and its subtree size.
+    - AVLNode: A node of an AVL tree, which also stores its height.
+    - RedBlackNode: A node of a red-black tree, which also stores its colour.
+    - AVLTree: An ordered map balanced as an AVL tree.
+    - RedBlackTree: An ordered map balanced as a red-black tree.
+
+Usage:
+    tree = RedBlackTree.from_sorted([10, 20, 30], ["a", "b", "c"])
+    tree.insert_node(25, "d")
+    tree.get(20)                           # Output: 'b'
+    tree.floor(27).key                     # Output: 25
+    [node.key for node in tree.range(15, 30)]   # Output: [20, 25]
+    tree.rank(30)                          # Output: 3
+    tree.select(0).key                     # Output: 10
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from data_structures.binary_tree import Node
+
+
+class BalancedNode(Node):
+    """
+    Represents a node of a balanced binary search tree.
+
+    Attributes:
+        key (any): The key the tree is ordered by.
+        value (any): The value mapped to the key.
+        _size (int): The number of nodes in the subtree rooted at this node.
+    """
+    __slots__ = ("_key", "_size")
+
+    def __init__(self, key: any, value: any = None, parent: BalancedNode | None = None) -> None:
+        """
+        Initializes a leaf node.
+
+        Args:
+            key (any): The key of the node.
+            value (any, optional): The value mapped to the key.
+            parent (BalancedNode, optional): The parent of the node.
+        """
+        super().__init__(value, parent=parent)
+        self._key = key
+        self._size = 1
+
+    @property
+    def key(self) -> any:
+        """
+        Retrieves the key of the node.
+
+        Returns:
+            any: The key of the node.
+        """
+        return self._key
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(key={self._key!r}, value={self._value!r})"
+
+
+class AVLNode(BalancedNode):
+    """
+    Represents a node of an AVL tree.
+
+    Attributes:
+        _height (int): The number of nodes on the longest path down to a leaf.
+    """
+    __slots__ = ("_height",)
+
+    def __init__(self, key: any, value: any = None, parent: AVLNode | None = None) -> None:
+        super().__init__(key, value, parent)
+        self._height = 1
+
+
+class RedBlackNode(BalancedNode):
+    """
+    Represents a node of a red-black tree.
+
+    Attributes:
+        _red (bool): True for a red node, False for a black one. New nodes are red.
+    """
+    __slots__ = ("_red",)
+
+    def __init__(self, key: any, value: any = None, parent: RedBlackNode | None = None) -> None:
+        super().__init__(key, value, parent)
+        self._red = True
+
+
+def _size(node: BalancedNode | None) -> int:
+    return node._size if node is not None else 0
+
+
+def _height(node: AVLNode | None) -> int:
+    return node._height if node is not None else 0
+
+
+def _is_red(node: RedBlackNode | None) -> bool:
+    return node is not None and node._red
+
+
+def _minimum(node: BalancedNode) -> BalancedNode:
+    while node._left is not None:
+        node = node._left
+    return node
+
+
+def _successor(node: BalancedNode) -> BalancedNode | None:
+    if node._right is not None:
+        return _minimum(node._right)
+    while node._parent is not None and node is node._parent._right:
+        node = node._parent
+    return node._parent
+
+
+class _BalancedTree(ABC):
+    """
+    The ordered map operations shared by AVL and red-black trees.
+
+    Keys must be comparable with each other; each key is held at most once.
+    Subclasses set `_node_type` and implement the balancing in `insert_node`'s
+    `_insert_fixup` hook and in `_delete`.
+    """
+    _node_type = BalancedNode
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty tree.
+        """
+        self._root = None
+
+    @classmethod
+    def from_sorted(cls, keys: any, values: any = None) -> _BalancedTree:
+        """
+        Builds a balanced tree from sorted keys in O(n).
+
+        The middle key becomes the root and each half is built the same way, so
+        all missing children sit on the last two levels.
+
+        Args:
+            keys (iterable): The keys in strictly increasing order.
+            values (iterable, optional): The value of each key. Defaults to None values.
+
+        Returns:
+            The tree holding the keys.
+
+        Raises:
+            ValueError: If the keys are not strictly increasing, or if there are
+                not as many values as keys.
+        """
+        keys = list(keys)
+        values = [None] * len(keys) if values is None else list(values)
+        if len(values) != len(keys):
+            raise ValueError("There must be one value per key")
+        for index in range(1, len(keys)):
+            if not keys[index - 1] < keys[index]:
+                raise ValueError("Keys must be sorted and unique")
+
+        tree = cls()
+        max_depth = len(keys).bit_length() - 1
+        node_type = tree._node_type
+
+        def build(start: int, stop: int, parent: BalancedNode | None, depth: int) -> BalancedNode | None:
+            if start >= stop:
+                return None
+            middle = (start + stop) // 2
+            node = node_type(keys[middle], values[middle], parent)
+            node._left = build(start, middle, node, depth + 1)
+            node._right = build(middle + 1, stop, node, depth + 1)
+            tree._built(node, depth, max_depth)
+            return node
+
+        tree._root = build(0, len(keys), None, 0)
+        return tree
+
+    @property
+    def root(self) -> BalancedNode | None:
+        """
+        Retrieves the root of the tree.
+
+        Returns:
+            BalancedNode | None: The root node, or None if the tree is empty.
+        """
+        return self._root
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the tree is empty.
+
+        Returns:
+            bool: True if the tree is empty, False otherwise.
+        """
+        return self._root is None
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of keys in the tree.
+
+        Returns:
+            int: The size of the tree.
+        """
+        return _size(self._root)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys in the tree.
+
+        Returns:
+            int: The size of the tree.
+        """
+        return _size(self._root)
+
+    def __iter__(self):
+        """
+        Lazily yields the keys in sorted order.
+
+        Yields:
+            any: Each key of the tree.
+        """
+        for node in self.range():
+            yield node._key
+
+    def items(self):
+        """
+        Lazily yields the key-value pairs in key order.
+
+        Yields:
+            tuple: Each (key, value) pair of the tree.
+        """
+        for node in self.range():
+            yield node._key, node._value
+
+    def __contains__(self, key: any) -> bool:
+        """
+        Checks whether a key is in the tree in O(log n).
+
+        Returns:
+            bool: True if the key is found, False otherwise.
+        """
+        return self.find(key) is not None
+
+    def find(self, key: any) -> BalancedNode | None:
+        """
+        Finds the node holding a key in O(log n).
+
+        Args:
+            key (any): The key to search for.
+
+        Returns:
+            BalancedNode | None: The node holding the key, or None if not found.
+        """
+        node = self._root
+        while node is not None:
+            if key < node._key:
+                node = node._left
+            elif node._key < key:
+                node = node._right
+            else:
+                return node
+        return None
+
+    def get(self, key: any, default: any = None) -> any:
+        """
+        Returns the value mapped to a key in O(log n).
+
+        Args:
+            key (any): The key to search for.
+            default (any, optional): The value returned when the key is missing.
+
+        Returns:
+            any: The value of the key, or `default` if the key is not found.
+        """
+        node = self.find(key)
+        return default if node is None else node._value
+
+    def floor(self, key: any) -> BalancedNode | None:
+        """
+        Finds the node with the largest key less than or equal to a key.
+
+        Args:
+            key (any): The key to compare with.
+
+        Returns:
+            BalancedNode | None: The node, or None if every key is larger.
+        """
+        node, best = self._root, None
+        while node is not None:
+            if key < node._key:
+                node = node._left
+            else:
+                best = node
+                node = node._right
+        return best
+
+    def ceiling(self, key: any) -> BalancedNode | None:
+        """
+        Finds the node with the smallest key greater than or equal to a key.
+
+        Args:
+            key (any): The key to compare with.
+
+        Returns:
+            BalancedNode | None: The node, or None if every key is smaller.
+        """
+        node, best = self._root, None
+        while node is not None:
+            if node._key < key:
+                node = node._right
+            else:
+                best = node
+                node = node._left
+        return best
+
+    def range(self, start: any = None, stop: any = None):
+        """
+        Lazily yields the nodes whose keys k satisfy start <= k < stop, in key order.
+
+        Finding the first node takes O(log n); each following node is found in
+        amortized O(1).
+
+        Args:
+            start (any, optional): The inclusive lower bound. Defaults to the smallest key.
+            stop (any, optional): The exclusive upper bound. Defaults to no bound.
+
+        Yields:
+            BalancedNode: Each node in the range.
+        """
+        if start is None:
+            node = _minimum(self._root) if self._root is not None else None
+        else:
+            node = self.ceiling(start)
+        while node is not None and (stop is None or node._key < stop):
+            yield node
+            node = _successor(node)
+
+    def rank(self, key: any) -> int:
+        """
+        Counts the keys strictly smaller than a key in O(log n).
+
+        This is also the position the key has, or would have, in sorted order.
+
+        Args:
+            key (any): The key to rank.
+
+        Returns:
+            int: The number of smaller keys.
+        """
+        node, position = self._root, 0
+        while node is not None:
+            if node._key < key:
+                position += _size(node._left) + 1
+                node = node._right
+            else:
+                node = node._left
+        return position
+
+    def select(self, position: int) -> BalancedNode:
+        """
+        Returns the node at a position in key order in O(log n).
+
+        Args:
+            position (int): The position of the node. Negative positions count
+                from the end.
+
+        Returns:
+            BalancedNode: The node holding the key of that rank.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        size = _size(self._root)
+        if position < 0:
+            position += size
+        if position < 0 or position >= size:
+            raise IndexError("Balanced tree index out of range")
+        node = self._root
+        while True:
+            left = _size(node._left)
+            if position < left:
+                node = node._left
+            elif position == left:
+                return node
+            else:
+                position -= left + 1
+                node = node._right
+
+    def height(self) -> int:
+        """
+        Returns the number of nodes on the longest path from the root to a leaf.
+
+        Returns:
+            int: The height of the tree, 0 when it is empty.
+        """
+        longest, level = 0, [self._root] if self._root is not None else []
+        while level:
+            longest += 1
+            level = [child for node in level for child in (node._left, node._right) if child]
+        return longest
+
+    def insert_node(self, key: any, value: any = None) -> None:
+        """
+        Maps a key to a value in O(log n), replacing the value of an existing key.
+
+        Args:
+            key (any): The key to insert.
+            value (any, optional): The value mapped to the key.
+        """
+        parent, node = None, self._root
+        while node is not None:
+            parent = node
+            if key < node._key:
+                node = node._left
+            elif node._key < key:
+                node = node._right
+            else:
+                node._value = value
+                return
+        node = self._node_type(key, value, parent)
+        if parent is None:
+            self._root = node
+        elif key < parent._key:
+            parent._left = node
+        else:
+            parent._right = node
+        self._insert_fixup(node)
+
+    def delete_node(self, key: any) -> None:
+        """
+        Deletes a key and its value in O(log n).
+
+        Args:
+            key (any): The key to delete.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        node = self.find(key)
+        if node is None:
+            raise KeyError(key)
+        self._delete(node)
+        node._parent, node._left, node._right = None, None, None
+
+    def clear(self) -> None:
+        """
+        Removes every key from the tree.
+        """
+        self._root = None
+
+    @abstractmethod
+    def _insert_fixup(self, node: BalancedNode) -> None:
+        """
+        Restores the subtree sizes and the balance after linking a new leaf.
+
+        Args:
+            node (BalancedNode): The new leaf.
+        """
+
+    @abstractmethod
+    def _delete(self, node: BalancedNode) -> None:
+        """
+        Unlinks a node and restores the subtree sizes and the balance.
+
+        Args:
+            node (BalancedNode): The node to unlink.
+        """
+
+    def _built(self, node: BalancedNode, depth: int, max_depth: int) -> None:
+        """
+        Sets the bookkeeping of a node built by `from_sorted`, once its children are built.
+
+        Args:
+            node (BalancedNode): The node.
+            depth (int): The depth of the node, 0 for the root.
+            max_depth (int): The depth of the deepest nodes of the tree.
+        """
+        self._update(node)
+
+    def _update(self, node: BalancedNode) -> None:
+        """
+        Recomputes the subtree size of a node from its children.
+
+        Args:
+            node (BalancedNode): The node to update.
+        """
+        node._size = _size(node._left) + _size(node._right) + 1
+
+    def _transplant(self, node: BalancedNode, replacement: BalancedNode | None) -> None:
+        """
+        Puts a subtree in the place of another one under the same parent.
+
+        Args:
+            node (BalancedNode): The root of the subtree to replace.
+            replacement (BalancedNode | None): The root of the subtree taking its place.
+        """
+        parent = node._parent
+        if parent is None:
+            self._root = replacement
+        elif node is parent._left:
+            parent._left = replacement
+        else:
+            parent._right = replacement
+        if replacement is not None:
+            replacement._parent = parent
+
+    def _rotate_left(self, node: BalancedNode) -> BalancedNode:
+        """
+        Rotates a node down to the left, its right child taking its place.
+
+        Args:
+            node (BalancedNode): The node to rotate down. It must have a right child.
+
+        Returns:
+            BalancedNode: The new root of the subtree.
+        """
+        pivot = node._right
+        node._right = pivot._left
+        if pivot._left is not None:
+            pivot._left._parent = node
+        self._transplant(node, pivot)
+        pivot._left = node
+        node._parent = pivot
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: BalancedNode) -> BalancedNode:
+        """
+        Rotates a node down to the right, its left child taking its place.
+
+        Args:
+            node (BalancedNode): The node to rotate down. It must have a left child.
+
+        Returns:
+            BalancedNode: The new root of the subtree.
+        """
+        pivot = node._left
+        node._left = pivot._right
+        if pivot._right is not None:
+            pivot._right._parent = node
+        self._transplant(node, pivot)
+        pivot._right = node
+        node._parent = pivot
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _splice_out(self, node: BalancedNode) -> tuple[BalancedNode | None, BalancedNode | None, BalancedNode]:
+        """
+        Unlinks a node as in a plain binary search tree.
+
+        A node with two children is replaced by its successor, which takes its
+        place, children and (for red-black trees, through the caller) colour.
+
+        Args:
+            node (BalancedNode): The node to unlink.
+
+        Returns:
+            tuple: The node that moved into the place left empty (possibly None),
+                its parent, and the node removed from its position (`node` itself
+                or its successor).
+        """
+        if node._left is None or node._right is None:
+            child = node._left if node._left is not None else node._right
+            parent = node._parent
+            self._transplant(node, child)
+            return child, parent, node
+        successor = _minimum(node._right)
+        child = successor._right
+        if successor._parent is node:
+            parent = successor
+        else:
+            parent = successor._parent
+            self._transplant(successor, child)
+            successor._right = node._right
+            successor._right._parent = successor
+        self._transplant(node, successor)
+        successor._left = node._left
+        successor._left._parent = successor
+        return child, parent, successor
+
+
+class AVLTree(_BalancedTree):
+    """
+    An ordered map balanced as an AVL tree.
+
+    The heights of the two subtrees of every node differ by at most one, so
+    the height of the tree stays below 1.44 log2(n + 2).
+    """
+    _node_type = AVLNode
+
+    def _update(self, node: AVLNode) -> None:
+        node._size = _size(node._left) + _size(node._right) + 1
+        node._height = max(_height(node._left), _height(node._right)) + 1
+
+    def _insert_fixup(self, node: AVLNode) -> None:
+        self._rebalance(node._parent, 1)
+
+    def _delete(self, node: AVLNode) -> None:
+        _, parent, moved = self._splice_out(node)
+        if moved is not node:
+            moved._size, moved._height = node._size, node._height
+        self._rebalance(parent, -1)
+
+    def _rebalance(self, node: AVLNode | None, delta: int) -> None:
+        """
+        Walks from `node` up to the root, rotating unbalanced nodes.
+
+        Once a balanced node keeps its height, no ancestor can change height
+        either, and only their sizes are left to adjust.
+
+        Args:
+            node (AVLNode | None): The lowest node whose subtree changed.
+            delta (int): How many nodes the subtrees on the path gained (1) or lost (-1).
+        """
+        while node is not None:
+            left_height, right_height = _height(node._left), _height(node._right)
+            if left_height - right_height > 1:
+                if _height(node._left._left) < _height(node._left._right):
+                    self._rotate_left(node._left)
+                node = self._rotate_right(node)
+            elif right_height - left_height > 1:
+                if _height(node._right._right) < _height(node._right._left):
+                    self._rotate_right(node._right)
+                node = self._rotate_left(node)
+            else:
+                height = max(left_height, right_height) + 1
+                if height == node._height:
+                    while node is not None:
+                        node._size += delta
+                        node = node._parent
+                    return
+                node._height = height
+                node._size += delta
+            node = node._parent
+
+
+class RedBlackTree(_BalancedTree):
+    """
+    An ordered map balanced as a red-black tree, following CLRS.
+
+    The root is black, a red node has no red child, and every path from a
+    node down to a missing child crosses the same number of black nodes, so
+    the height of the tree stays below 2 log2(n + 1). Missing children are
+    None rather than a shared sentinel, so the deletion fixup tracks the
+    parent of the possibly missing node it works on.
+    """
+    _node_type = RedBlackNode
+
+    def _built(self, node: RedBlackNode, depth: int, max_depth: int) -> None:
+        # Every missing child sits on the last two levels: colouring the deepest
+        # level red gives every path the same number of black nodes.
+        self._update(node)
+        node._red = 0 < depth == max_depth
+
+    def _insert_fixup(self, node: RedBlackNode) -> None:
+        ancestor = node._parent
+        while ancestor is not None:
+            ancestor._size += 1
+            ancestor = ancestor._parent
+
+        while _is_red(node._parent):
+            parent = node._parent
+            grandparent = parent._parent
+            if parent is grandparent._left:
+                uncle = grandparent._right
+                if _is_red(uncle):
+                    parent._red = uncle._red = False
+                    grandparent._red = True
+                    node = grandparent
+                    continue
+                if node is parent._right:
+                    node = parent
+                    self._rotate_left(node)
+                    parent = node._parent
+                parent._red = False
+                grandparent._red = True
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent._left
+                if _is_red(uncle):
+                    parent._red = uncle._red = False
+                    grandparent._red = True
+                    node = grandparent
+                    continue
+                if node is parent._left:
+                    node = parent
+                    self._rotate_right(node)
+                    parent = node._parent
+                parent._red = False
+                grandparent._red = True
+                self._rotate_left(grandparent)
+        self._root._red = False
+
+    def _delete(self, node: RedBlackNode) -> None:
+        removed_red = node._red if node._left is None or node._right is None \
+            else _minimum(node._right)._red
+        child, parent, moved = self._splice_out(node)
+        if moved is not node:
+            moved._red, moved._size = node._red, node._size
+        ancestor = parent
+        while ancestor is not None:
+            ancestor._size -= 1
+            ancestor = ancestor._parent
+        if not removed_red:
+            self._delete_fixup(child, parent)
+
+    def _delete_fixup(self, node: RedBlackNode | None, parent: RedBlackNode | None) -> None:
+        """
+        Restores the red-black properties after a black node was removed.
+
+        Args:
+            node (RedBlackNode | None): The node carrying the extra black, possibly None.
+            parent (RedBlackNode | None): The parent of that node.
+        """
+        while node is not self._root and not _is_red(node):
+            if node is parent._left:
+                sibling = parent._right
+                if sibling._red:
+                    sibling._red = False
+                    parent._red = True
+                    self._rotate_left(parent)
+                    sibling = parent._right
+                if not _is_red(sibling._left) and not _is_red(sibling._right):
+                    sibling._red = True
+                    node, parent = parent, parent._parent
+                    continue
+                if not _is_red(sibling._right):
+                    sibling._left._red = False
+                    sibling._red = True
+                    self._rotate_right(sibling)
+                    sibling = parent._right
+                sibling._red = parent._red
+                parent._red = False
+                sibling._right._red = False
+                self._rotate_left(parent)
+            else:
+                sibling = parent._left
+                if sibling._red:
+                    sibling._red = False
+                    parent._red = True
+                    self._rotate_right(parent)
+                    sibling = parent._left
+                if not _is_red(sibling._left) and not _is_red(sibling._right):
+                    sibling._red = True
+                    node, parent = parent, parent._parent
+                    continue
+                if not _is_red(sibling._left):
+                    sibling._right._red = False
+                    sibling._red = True
+                    self._rotate_left(sibling)
+                    sibling = parent._left
+                sibling._red = parent._red
+                parent._red = False
+                sibling._left._red = False
+                self._rotate_right(parent)
+            node = self._root
+        if node is not None:
+            node._red = False
@@ -1,12 +1,17 @@
 from __future__ import annotations
 from data_structures.deque_list import Deque
+from data_structures.linked_list import _index_add, _index_discard
 
 class Node:
+    __slots__ = ("_value", "_left", "_right", "_parent", "_position")
+
     def __init__(self, value: any, left: Node | None = None, right: Node | None = None, parent: Node | None = None) -> None:
         self._value = value
         self._left = left
         self._right = right
         self._parent = parent
+        # Level-order index of the node in an array-backed tree, -1 otherwise.
+        self._position = -1
     
     @property
     def value(self) -> any:
@@ -37,46 +42,123 @@ class Node:
         self._right = node
 
 class BinaryTree:
-    def __init__(self) -> None:
+    def __init__(self, array_backed: bool = False, indexed: bool = False) -> None:
         self._root = None
+        # Array-backed trees also keep their nodes in level order, so the node at
+        # index i has its parent at (i - 1) // 2 and its children at 2i + 1 and 2i + 2.
+        self._nodes = [] if array_backed else None
+        # Indexed trees map each value to its node, or to a dict of its nodes when
+        # several hold it. Their values must be hashable.
+        self._index = {} if indexed else None
 
     @property
     def root(self) -> Node | None:
         return self._root
 
+    @property
+    def array_backed(self) -> bool:
+        return self._nodes is not None
+
+    @property
+    def indexed(self) -> bool:
+        return self._index is not None
+
+    def __contains__(self, value: any) -> bool:
+        return self.find(value) is not None
+
+    def __reduce__(self) -> tuple:
+        # Pickle the values without recursing through the nodes; the
+        # serialization module imports this one.
+        from data_structures.serialization import _reduce
+        return _reduce(self)
+
     def print_tree_bfs(self) -> str:
-        nodes = self.bfs()
-        values = [node.value for node in nodes]
-        level = 1
-        start = 0
-        end = 1
         message = []
-        while start < len(values):
-            end = min(end, len(values))
-            message.append(f'Level {level}: {values[start:end]}')
-            start = end
-            end = start + 2**level
-            level += 1
+        for level, nodes in enumerate(self.iter_levels(), 1):
+            message.append(f'Level {level}: {[node._value for node in nodes]}')
         return ("\n".join(message))
 
-    def bfs(self) -> list[Node] | None:
-        nodes = []
+    def bfs(self) -> list[Node]:
+        return list(self.iter_bfs())
+
+    def iter_bfs(self):
+        if self._nodes is not None:
+            yield from self._nodes
+            return
+        if self._root is None:
+            return
         traversal_queue = Deque()
         traversal_queue.append(self._root)
 
         while not traversal_queue.is_empty():
             current = traversal_queue.pop_left()
-            nodes.append(current)
-            if current.left:
-                traversal_queue.append(current.left)
-
-            if current.right:
-                traversal_queue.append(current.right)
-
-        return nodes
+            yield current
+            if current._left:
+                traversal_queue.append(current._left)
+
+            if current._right:
+                traversal_queue.append(current._right)
+
+    def iter_levels(self):
+        # Yields one list of nodes per level, only holding the current level.
+        if self._nodes is not None:
+            start, width = 0, 1
+            while start < len(self._nodes):
+                yield self._nodes[start:start + width]
+                start += width
+                width *= 2
+            return
+        level = [self._root] if self._root else []
+        while level:
+            yield level
+            level = [child for node in level for child in (node._left, node._right) if child]
+
+    def iter_pre_order(self):
+        stack = [self._root] if self._root else []
+        while stack:
+            current = stack.pop()
+            yield current
+            if current._right:
+                stack.append(current._right)
+            if current._left:
+                stack.append(current._left)
+
+    def iter_in_order(self):
+        stack = []
+        current = self._root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current._left
+            current = stack.pop()
+            yield current
+            current = current._right
+
+    def iter_post_order(self):
+        stack = []
+        current = self._root
+        last_visited = None
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current._left
+            top = stack[-1]
+            right = top._right
+            # Visit the right subtree first, unless it was just yielded.
+            if right is not None and right is not last_visited:
+                current = right
+            else:
+                stack.pop()
+                yield top
+                last_visited = top
 
     def insert_node(self, value: any) -> None:
         new_node = Node(value)
+        if self._index is not None:
+            _index_add(self._index, new_node._value, new_node)
+        if self._nodes is not None:
+            self._append_node(new_node)
+            return
         if not self._root:
             self._root = new_node
             return
@@ -86,29 +168,56 @@ class BinaryTree:
 
         while traversal_queue:
             current = traversal_queue.pop_left()
-            if not current.left:
-                current.left = new_node
-                new_node.parent = current
+            if not current._left:
+                current._left = new_node
+                new_node._parent = current
                 return
-            traversal_queue.append(current.left)
+            traversal_queue.append(current._left)
 
-            if not current.right:
-                current.right = new_node
-                new_node.parent = current
+            if not current._right:
+                current._right = new_node
+                new_node._parent = current
                 return
-            traversal_queue.append(current.right)
+            traversal_queue.append(current._right)
+
+    def _append_node(self, node: Node) -> None:
+        # The first free slot of an array-backed tree is the end of the array.
+        position = len(self._nodes)
+        node._position = position
+        self._nodes.append(node)
+        if position == 0:
+            self._root = node
+            return
+        parent = self._nodes[(position - 1) // 2]
+        node._parent = parent
+        if position % 2:
+            parent._left = node
+        else:
+            parent._right = node
 
     def find(self, target: any) -> Node | None:
-        nodes = self.bfs()
-        for node in nodes:
-            if node.value == target:
+        if self._index is not None:
+            nodes = self._index.get(target)
+            if type(nodes) is not dict:
+                return nodes
+            # Several nodes hold the value: return the first one in level order.
+            if self._nodes is not None:
+                return min(nodes, key=lambda node: node._position)
+            for node in self.iter_bfs():
+                if node in nodes:
+                    return node
+        for node in self.iter_bfs():
+            if node._value == target:
                 return node
         return None
 
     def last_node(self) -> Node | None:
-        if not self._root:
-            return None
-        return self.bfs()[-1]
+        if self._nodes is not None:
+            return self._nodes[-1] if self._nodes else None
+        last_node = None
+        for last_node in self.iter_bfs():
+            pass
+        return last_node
 
     def is_empty(self) -> bool:
         return self._root is None
@@ -121,47 +230,54 @@ class BinaryTree:
         if target_node is None:
             return 'Target value not found in the binary tree'
 
+        if self._index is not None:
+            _index_discard(self._index, target_node._value, target_node)
+
+        if self._nodes is not None:
+            self._delete_array_node(target_node)
+            return None
+
         last_node = self.last_node()
 
         # Target node is not the last node
         if last_node is not target_node:
             # Unlink last node's parent from last_node
-            if last_node.parent.left is last_node:
-                last_node.parent.left = None
-            elif last_node.parent.right is last_node:
-                last_node.parent.right = None
+            if last_node._parent._left is last_node:
+                last_node._parent._left = None
+            elif last_node._parent._right is last_node:
+                last_node._parent._right = None
             # If target node is the root update the root reference to the last node
             if target_node is self._root:
                 self._root = last_node
-                last_node.parent = None
+                last_node._parent = None
             # Update last node's parent
             else:
-                last_node.parent = target_node.parent
+                last_node._parent = target_node._parent
 
             # Make last node inherit target_node children.
-            last_node.left = target_node.left if target_node.left is not last_node else None
-            last_node.right = target_node.right if target_node.right is not last_node else None
+            last_node._left = target_node._left if target_node._left is not last_node else None
+            last_node._right = target_node._right if target_node._right is not last_node else None
 
             # Update target node's children parent pointer.
-            if target_node.left and target_node.left is not last_node:
-                target_node.left.parent = last_node
-            if target_node.right and target_node.right is not last_node:
-                target_node.right.parent = last_node
+            if target_node._left and target_node._left is not last_node:
+                target_node._left._parent = last_node
+            if target_node._right and target_node._right is not last_node:
+                target_node._right._parent = last_node
 
             # Update target node's parent to point at last node.
-            if target_node.parent:
-                if target_node.parent.left is target_node:
-                    target_node.parent.left = last_node
-                elif target_node.parent.right is target_node:
-                    target_node.parent.right = last_node
+            if target_node._parent:
+                if target_node._parent._left is target_node:
+                    target_node._parent._left = last_node
+                elif target_node._parent._right is target_node:
+                    target_node._parent._right = last_node
 
             # Remove all links from target_node.
-            target_node.parent, target_node.right, target_node.left = None, None, None
+            target_node._parent, target_node._right, target_node._left = None, None, None
 
             # Keep tree structure.
-            if last_node.right is None and last_node.left is not None:
-                last_node.right = last_node.left
-                last_node.left = None
+            if last_node._right is None and last_node._left is not None:
+                last_node._right = last_node._left
+                last_node._left = None
 
         # Target node is the last node
         else:
@@ -171,56 +287,184 @@ class BinaryTree:
             # Target node is not the root.
             else:
                 # If target node is a right child, remove the downstream link
-                if target_node.parent.right is target_node:
-                    target_node.parent.right = None
+                if target_node._parent._right is target_node:
+                    target_node._parent._right = None
                 # If target node is a left child, remove the downstream link
                 else:
-                    target_node.parent.left = None
+                    target_node._parent._left = None
                 # Remove upstream link.
-                target_node.parent = None
+                target_node._parent = None
         return None
     
+    def _delete_array_node(self, target_node: Node) -> None:
+        # Detach the last node of the level order from its parent.
+        last_node = self._nodes.pop()
+        parent = last_node._parent
+        if parent is not None:
+            if parent._left is last_node:
+                parent._left = None
+            else:
+                parent._right = None
+            last_node._parent = None
+
+        # Move the last node into the slot of the target node.
+        if last_node is not target_node:
+            position = target_node._position
+            self._nodes[position] = last_node
+            last_node._position = position
+            last_node._parent = target_node._parent
+            last_node._left = target_node._left
+            last_node._right = target_node._right
+            if last_node._left:
+                last_node._left._parent = last_node
+            if last_node._right:
+                last_node._right._parent = last_node
+            if target_node._parent is None:
+                self._root = last_node
+            elif target_node._parent._left is target_node:
+                target_node._parent._left = last_node
+            else:
+                target_node._parent._right = last_node
+        elif target_node is self._root:
+            self._root = None
+
+        # Remove all links from target_node.
+        target_node._parent, target_node._right, target_node._left = None, None, None
+        target_node._position = -1
+
     def print_pre_order_traversal(self) -> str:
         nodes = self.pre_order_traversal()
-        values = [node.value for node in nodes]
+        values = [node._value for node in nodes]
         print(f"Pre-order: {values}")
 
-    def pre_order_traversal(self) -> list[Node]:
-        nodes = []
-        def traverse(node: Node | None) -> None:
-            if node:
-                nodes.append(node)
-                traverse(node.left)
-                traverse(node.right)
-        traverse(self._root)
-        return nodes
+    def pre_order_traversal(self, method: str = "iterative") -> list[Node]:
+        _check_traversal_method(method)
+        if method == "recursive":
+            nodes = []
+            def traverse(node: Node | None) -> None:
+                if node:
+                    nodes.append(node)
+                    traverse(node._left)
+                    traverse(node._right)
+            traverse(self._root)
+            return nodes
+        if method == "morris":
+            return self._morris_traversal(pre_order=True)
+        return list(self.iter_pre_order())
     
     def print_in_order_traversal(self) -> str:
         nodes = self.in_order_traversal()
-        values = [node.value for node in nodes]
+        values = [node._value for node in nodes]
         print(f"In-order traversal: {values}")
         
-    def in_order_traversal(self) -> list[Node]:
-        nodes = []
-        def traverse(node: Node | None) -> None:
-            if node:
-                traverse(node.left)
-                nodes.append(node)
-                traverse(node.right)
-        traverse(self._root)
-        return nodes
+    def in_order_traversal(self, method: str = "iterative") -> list[Node]:
+        _check_traversal_method(method)
+        if method == "recursive":
+            nodes = []
+            def traverse(node: Node | None) -> None:
+                if node:
+                    traverse(node._left)
+                    nodes.append(node)
+                    traverse(node._right)
+            traverse(self._root)
+            return nodes
+        if method == "morris":
+            return self._morris_traversal(pre_order=False)
+        return list(self.iter_in_order())
     
     def print_post_order_traversal(self) -> str:
         nodes = self.post_order_traversal()
-        values = [node.value for node in nodes]
+        values = [node._value for node in nodes]
         print(f"Post-order traversal: {values}")
     
-    def post_order_traversal(self) -> list[Node]:
+    def post_order_traversal(self, method: str = "iterative") -> list[Node]:
+        _check_traversal_method(method)
+        if method == "recursive":
+            nodes = []
+            def traverse(node: Node | None) -> None:
+                if node:
+                    traverse(node._left)
+                    traverse(node._right)
+                    nodes.append(node)
+            traverse(self._root)
+            return nodes
+        if method == "morris":
+            return self._morris_post_order()
+        return list(self.iter_post_order())
+
+    # Morris traversals thread the rightmost node of each left subtree back to its
+    # ancestor instead of keeping a stack, and remove every thread before returning.
+    # They temporarily modify the tree, so they run to completion and are not lazy.
+
+    def _morris_traversal(self, pre_order: bool) -> list[Node]:
+        nodes = []
+        current = self._root
+        while current:
+            if current._left is None:
+                nodes.append(current)
+                current = current._right
+                continue
+            predecessor = current._left
+            while predecessor._right and predecessor._right is not current:
+                predecessor = predecessor._right
+            # First visit: thread the predecessor back to current and go left.
+            if predecessor._right is None:
+                if pre_order:
+                    nodes.append(current)
+                predecessor._right = current
+                current = current._left
+            # Second visit: the left subtree is done, remove the thread.
+            else:
+                predecessor._right = None
+                if not pre_order:
+                    nodes.append(current)
+                current = current._right
+        return nodes
+
+    def _morris_post_order(self) -> list[Node]:
         nodes = []
-        def traverse(node: Node | None) -> None:
-            if node:
-                traverse(node.left)
-                traverse(node.right)
+        # A dummy parent makes the root the left child of a node with no right subtree.
+        dummy = Node(None, left=self._root)
+        current = dummy
+        while current:
+            if current._left is None:
+                current = current._right
+                continue
+            predecessor = current._left
+            while predecessor._right and predecessor._right is not current:
+                predecessor = predecessor._right
+            if predecessor._right is None:
+                predecessor._right = current
+                current = current._left
+                continue
+            # The left subtree is done: emit the right spine from current._left to the
+            # predecessor bottom-up, by reversing it in place and restoring it.
+            _reverse_right_chain(current._left, predecessor)
+            node = predecessor
+            nodes.append(node)
+            while node is not current._left:
+                node = node._right
                 nodes.append(node)
-        traverse(self._root)
+            _reverse_right_chain(predecessor, current._left)
+            predecessor._right = None
+            current = current._right
         return nodes
+
+
+_TRAVERSAL_METHODS = ("iterative", "recursive", "morris")
+
+
+def _check_traversal_method(method: str) -> None:
+    if method not in _TRAVERSAL_METHODS:
+        raise ValueError(f"Unknown traversal method {method!r}, expected one of {_TRAVERSAL_METHODS}")
+
+
+def _reverse_right_chain(start: Node, end: Node) -> None:
+    # Reverses the right links of the chain from start to end.
+    if start is end:
+        return
+    previous, current = start, start._right
+    while previous is not end:
+        following = current._right
+        current._right = previous
+        previous, current = current, following
@@ -0,0 +1,555 @@
+"""
+bplus_tree.py
+=============
+
+This module implements a disk-backed B+tree mapping 64-bit integer keys to
+64-bit integer values, for ordered datasets larger than memory.
+
+The tree lives in a file of fixed-size pages, read and written through `mmap`:
+
+- Page 0 is the header: a magic number, the page size, the root page, the
+  number of pages, keys and levels, and the first leaf.
+- Leaf pages hold sorted keys and their values, and link to the next leaf, so
+  range scans read the leaves sequentially.
+- Internal pages hold sorted separator keys and one more child page than
+  keys; the child left of a separator holds the smaller keys.
+
+With 4 KiB pages a leaf holds 255 entries and an internal page 255 children,
+so a lookup in 10^8 keys reads 4 pages. Decoded pages are kept in a bounded
+LRU cache; modified pages are written back when they are evicted, on
+`flush()` and on `close()`.
+
+Deletion is relaxed: keys are removed from their leaf, but pages are never
+merged or freed, so the tree never shrinks. This keeps deletes to a single
+page write and is the usual trade-off for workloads with few deletes.
+
+Classes:
+    - BPlusTree: A B+tree of int64 keys and values stored in a memory-mapped file.
+
+Usage:
+    with BPlusTree.from_sorted("index.db", range(0, 100, 10), range(10)) as tree:
+        tree.insert_node(55, 42)
+        tree.find(55)                      # Output: 42
+        list(tree.range(40, 70))           # Output: [(40, 4), (50, 5), (55, 42), (60, 6)]
+        tree.delete_node(55)
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+import mmap
+import operator
+import os
+import struct
+from array import array
+from collections import OrderedDict
+
+PAGE_SIZE = 4096
+MAGIC = b"BPTREE01"
+NULL_PAGE = -1
+
+# Header page: magic, page size, padding, root, page count, size, height, first leaf.
+_HEADER = struct.Struct("<8sII5q")
+# Every other page: leaf flag, padding, key count, padding, next leaf.
+_PAGE_HEADER = struct.Struct("<BxHxxxxq")
+
+
+class _Page:
+    """
+    A decoded page of the tree.
+
+    Attributes:
+        number (int): The page number in the file.
+        leaf (bool): Whether the page is a leaf.
+        keys (array): The sorted keys.
+        values (array): The values of a leaf, or the child pages of an internal page.
+        next (int): The next leaf, NULL_PAGE for the last leaf and internal pages.
+        dirty (bool): Whether the page changed since it was last written to the file.
+    """
+    __slots__ = ("number", "leaf", "keys", "values", "next", "dirty")
+
+    def __init__(self, number: int, leaf: bool, keys: array, values: array, next_leaf: int = NULL_PAGE) -> None:
+        self.number = number
+        self.leaf = leaf
+        self.keys = keys
+        self.values = values
+        self.next = next_leaf
+        self.dirty = False
+
+
+class BPlusTree:
+    """
+    A B+tree of int64 keys and values stored in a memory-mapped file.
+
+    Keys and values must fit in a signed 64-bit integer; others raise
+    OverflowError. Each key is held at most once.
+
+    Attributes:
+        path (str): The file holding the tree.
+        page_size (int): The size of a page in bytes.
+    """
+
+    def __init__(self, path: str, cache_pages: int = 1024, page_size: int = PAGE_SIZE) -> None:
+        """
+        Opens the tree stored in a file, creating an empty tree if the file
+        does not exist or is empty.
+
+        Args:
+            path (str): The file holding the tree.
+            cache_pages (int, optional): How many decoded pages to keep in memory.
+            page_size (int, optional): The page size of a new file, a multiple of 8
+                of at least 64 bytes. Existing files keep their own page size.
+
+        Raises:
+            ValueError: If the page size is invalid, or the file is not a B+tree.
+        """
+        if page_size < 64 or page_size % 8:
+            raise ValueError("Page size must be a multiple of 8 of at least 64 bytes")
+        self.path = path
+        # Every page of the path to a leaf, plus the pages a split creates,
+        # must fit in the cache while an operation runs.
+        self._cache_pages = max(cache_pages, 16)
+        self._cache = OrderedDict()
+        self._file = open(path, "a+b")
+        self._file.seek(0)
+        header = self._file.read(_HEADER.size)
+        if header:
+            magic, page_size, _, self._root, self._page_count, self._size, self._height, \
+                self._first_leaf = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a B+tree file")
+        else:
+            self._root, self._page_count, self._size, self._height, self._first_leaf = 1, 2, 0, 1, 1
+        self.page_size = page_size
+        self._leaf_capacity = (page_size - _PAGE_HEADER.size) // 16
+        self._internal_capacity = (page_size - _PAGE_HEADER.size - 8) // 16
+        size = os.fstat(self._file.fileno()).st_size
+        if size < 16 * page_size:
+            size = 16 * page_size
+            self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        if not header:
+            root = _Page(1, True, array("q"), array("q"))
+            root.dirty = True
+            self._cache[1] = root
+            self.flush()
+
+    @classmethod
+    def from_sorted(cls, path: str, keys: any, values: any, cache_pages: int = 1024,
+                    page_size: int = PAGE_SIZE) -> BPlusTree:
+        """
+        Builds a tree in a new file from sorted keys, writing every page once.
+
+        Leaves are filled completely and written left to right, then each level
+        of internal pages is built from the first keys of the level below.
+
+        Args:
+            path (str): The file to create. An existing file is overwritten.
+            keys (iterable): The keys in strictly increasing order.
+            values (iterable): The value of each key.
+            cache_pages (int, optional): How many decoded pages to keep in memory.
+            page_size (int, optional): The size of a page in bytes.
+
+        Returns:
+            BPlusTree: The open tree.
+
+        Raises:
+            ValueError: If the keys are not strictly increasing, or if there are
+                not as many values as keys.
+        """
+        with open(path, "wb"):
+            pass
+        tree = cls(path, cache_pages, page_size)
+        tree._bulk_load(iter(keys), iter(values))
+        return tree
+
+    def __enter__(self) -> BPlusTree:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys in the tree.
+
+        Returns:
+            int: The size of the tree.
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the tree is empty.
+
+        Returns:
+            bool: True if the tree is empty, False otherwise.
+        """
+        return self._size == 0
+
+    @property
+    def height(self) -> int:
+        """
+        Returns the number of levels, 1 when the root is a leaf.
+
+        Returns:
+            int: The height of the tree.
+        """
+        return self._height
+
+    def __iter__(self):
+        """
+        Lazily yields the keys in sorted order.
+
+        Yields:
+            int: Each key of the tree.
+        """
+        for key, _ in self.range():
+            yield key
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Checks whether a key is in the tree in O(log_B n) page reads.
+
+        Returns:
+            bool: True if the key is found, False otherwise.
+        """
+        leaf = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and leaf.keys[index] == key
+
+    def find(self, key: int) -> int | None:
+        """
+        Finds the value of a key in O(log_B n) page reads.
+
+        Args:
+            key (int): The key to search for.
+
+        Returns:
+            int | None: The value of the key, or None if not found.
+        """
+        leaf = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return None
+
+    def range(self, start: int | None = None, stop: int | None = None):
+        """
+        Lazily yields the entries whose keys k satisfy start <= k < stop, in key order.
+
+        Finding the first leaf takes O(log_B n) page reads; the scan then
+        follows the leaf links.
+
+        Args:
+            start (int, optional): The inclusive lower bound. Defaults to the smallest key.
+            stop (int, optional): The exclusive upper bound. Defaults to no bound.
+
+        Yields:
+            tuple: Each (key, value) pair in the range.
+        """
+        if start is None:
+            leaf, index = self._page(self._first_leaf), 0
+        else:
+            leaf = self._find_leaf(start)
+            index = bisect.bisect_left(leaf.keys, start)
+        while True:
+            keys, values = leaf.keys, leaf.values
+            end = len(keys) if stop is None else bisect.bisect_left(keys, stop, index)
+            for position in range(index, end):
+                yield keys[position], values[position]
+            if end < len(keys) or leaf.next == NULL_PAGE:
+                return
+            leaf, index = self._page(leaf.next), 0
+
+    def insert_node(self, key: int, value: int) -> None:
+        """
+        Maps a key to a value, replacing the value of an existing key.
+
+        Full pages are split in two, and a full root adds a level. Both numbers
+        are converted before any page changes, so a rejected pair leaves the
+        tree as it was.
+
+        Args:
+            key (int): The key to insert.
+            value (int): The value mapped to the key.
+
+        Raises:
+            OverflowError: If the key or the value does not fit in 64 bits.
+            TypeError: If the key or the value is not an int.
+        """
+        key, value = array("q", (key, value))
+        path = []
+        page = self._page(self._root)
+        while not page.leaf:
+            index = bisect.bisect_right(page.keys, key)
+            path.append((page, index))
+            page = self._page(page.values[index])
+
+        index = bisect.bisect_left(page.keys, key)
+        if index < len(page.keys) and page.keys[index] == key:
+            page.values[index] = value
+            self._touch(page)
+            return
+        page.keys.insert(index, key)
+        page.values.insert(index, value)
+        self._size += 1
+        self._touch(page)
+        if len(page.keys) <= self._leaf_capacity:
+            return
+
+        # Split the full pages from the leaf upwards.
+        separator, right = self._split_leaf(page)
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.values.insert(index + 1, right.number)
+            self._touch(parent)
+            if len(parent.keys) <= self._internal_capacity:
+                return
+            separator, right = self._split_internal(parent)
+        root = self._new_page(False, array("q", [separator]), array("q", [self._root, right.number]))
+        self._root = root.number
+        self._height += 1
+
+    def delete_node(self, key: int) -> None:
+        """
+        Deletes a key and its value from its leaf, without merging pages.
+
+        Args:
+            key (int): The key to delete.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        leaf = self._find_leaf(key)
+        index = bisect.bisect_left(leaf.keys, key)
+        if index == len(leaf.keys) or leaf.keys[index] != key:
+            raise KeyError(key)
+        del leaf.keys[index]
+        del leaf.values[index]
+        self._size -= 1
+        self._touch(leaf)
+
+    def flush(self) -> None:
+        """
+        Writes every modified page and the header to the file.
+        """
+        for page in self._cache.values():
+            if page.dirty:
+                self._write(page)
+        _HEADER.pack_into(self._mmap, 0, MAGIC, self.page_size, 0, self._root, self._page_count,
+                          self._size, self._height, self._first_leaf)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the tree and closes its file. The tree cannot be used afterwards.
+        """
+        if self._mmap.closed:
+            return
+        self.flush()
+        self._cache.clear()
+        self._mmap.close()
+        self._file.close()
+
+    def _find_leaf(self, key: int) -> _Page:
+        """
+        Walks from the root to the leaf that holds, or would hold, a key.
+
+        Args:
+            key (int): The key to search for.
+
+        Returns:
+            _Page: The leaf.
+        """
+        page = self._page(self._root)
+        while not page.leaf:
+            page = self._page(page.values[bisect.bisect_right(page.keys, key)])
+        return page
+
+    def _page(self, number: int) -> _Page:
+        """
+        Returns a page from the cache, decoding it from the file on a miss.
+
+        Args:
+            number (int): The page number.
+
+        Returns:
+            _Page: The decoded page.
+        """
+        page = self._cache.get(number)
+        if page is not None:
+            self._cache.move_to_end(number)
+            return page
+        offset = number * self.page_size
+        leaf, count, next_leaf = _PAGE_HEADER.unpack_from(self._mmap, offset)
+        offset += _PAGE_HEADER.size
+        keys = array("q", self._mmap[offset:offset + 8 * count])
+        capacity = self._leaf_capacity if leaf else self._internal_capacity
+        offset += 8 * capacity
+        values = array("q", self._mmap[offset:offset + 8 * (count + (not leaf))])
+        page = _Page(number, bool(leaf), keys, values, next_leaf)
+        self._cache[number] = page
+        self._evict()
+        return page
+
+    def _touch(self, page: _Page) -> None:
+        """
+        Marks a page as modified, putting it back in the cache if it was evicted.
+
+        Args:
+            page (_Page): The modified page.
+        """
+        page.dirty = True
+        if page.number not in self._cache:
+            self._cache[page.number] = page
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Drops the least recently used pages beyond the cache size, writing
+        modified ones back to the file.
+        """
+        while len(self._cache) > self._cache_pages:
+            _, page = self._cache.popitem(last=False)
+            if page.dirty:
+                self._write(page)
+
+    def _write(self, page: _Page) -> None:
+        """
+        Encodes a page into its slot of the file.
+
+        Args:
+            page (_Page): The page to write.
+        """
+        offset = page.number * self.page_size
+        _PAGE_HEADER.pack_into(self._mmap, offset, page.leaf, len(page.keys), page.next)
+        offset += _PAGE_HEADER.size
+        keys = page.keys.tobytes()
+        self._mmap[offset:offset + len(keys)] = keys
+        offset += 8 * (self._leaf_capacity if page.leaf else self._internal_capacity)
+        values = page.values.tobytes()
+        self._mmap[offset:offset + len(values)] = values
+        page.dirty = False
+
+    def _allocate(self) -> int:
+        """
+        Reserves a new page at the end of the file, growing the file by doubling.
+
+        Returns:
+            int: The number of the new page.
+        """
+        number = self._page_count
+        self._page_count += 1
+        needed = self._page_count * self.page_size
+        if needed > len(self._mmap):
+            self._mmap.resize(max(needed, 2 * len(self._mmap)))
+        return number
+
+    def _new_page(self, leaf: bool, keys: array, values: array, next_leaf: int = NULL_PAGE) -> _Page:
+        """
+        Creates a modified page in the cache.
+
+        Args:
+            leaf (bool): Whether the page is a leaf.
+            keys (array): The keys of the page.
+            values (array): The values or child pages of the page.
+            next_leaf (int, optional): The next leaf.
+
+        Returns:
+            _Page: The new page.
+        """
+        page = _Page(self._allocate(), leaf, keys, values, next_leaf)
+        self._touch(page)
+        return page
+
+    def _split_leaf(self, page: _Page) -> tuple[int, _Page]:
+        """
+        Moves the upper half of an overfull leaf to a new leaf linked after it.
+
+        Args:
+            page (_Page): The overfull leaf.
+
+        Returns:
+            tuple[int, _Page]: The first key of the new leaf and the new leaf.
+        """
+        middle = len(page.keys) // 2
+        right = self._new_page(True, page.keys[middle:], page.values[middle:], page.next)
+        del page.keys[middle:]
+        del page.values[middle:]
+        page.next = right.number
+        return right.keys[0], right
+
+    def _split_internal(self, page: _Page) -> tuple[int, _Page]:
+        """
+        Moves the upper half of an overfull internal page to a new page.
+
+        The middle key moves up to the parent rather than to either half.
+
+        Args:
+            page (_Page): The overfull internal page.
+
+        Returns:
+            tuple[int, _Page]: The separator for the parent and the new page.
+        """
+        middle = len(page.keys) // 2
+        separator = page.keys[middle]
+        right = self._new_page(False, page.keys[middle + 1:], page.values[middle + 1:])
+        del page.keys[middle:]
+        del page.values[middle + 1:]
+        return separator, right
+
+    def _bulk_load(self, keys, values) -> None:
+        """
+        Writes the leaves, then the internal levels, of an empty tree.
+
+        Args:
+            keys (iterator): The keys in strictly increasing order.
+            values (iterator): The value of each key.
+
+        Raises:
+            ValueError: If the keys are not strictly increasing, or if there are
+                not as many values as keys.
+        """
+        self._cache.clear()
+        self._page_count, self._size, self._height = 1, 0, 1
+        # The (first key, page number) pairs of the level being built upon.
+        level = []
+        leaf = None
+        while True:
+            chunk_keys = array("q", itertools.islice(keys, self._leaf_capacity))
+            if not chunk_keys and leaf is not None:
+                break
+            chunk_values = array("q", itertools.islice(values, len(chunk_keys)))
+            if len(chunk_values) != len(chunk_keys):
+                raise ValueError("There must be one value per key")
+            if any(map(operator.ge, chunk_keys, itertools.islice(chunk_keys, 1, None))) or \
+                    (chunk_keys and leaf is not None and not leaf.keys[-1] < chunk_keys[0]):
+                raise ValueError("Keys must be sorted and unique")
+            if leaf is not None:
+                leaf.next = self._page_count
+                self._write(leaf)
+            leaf = _Page(self._allocate(), True, chunk_keys, chunk_values)
+            level.append((chunk_keys[0] if chunk_keys else 0, leaf.number))
+            self._size += len(chunk_keys)
+        if next(values, None) is not None:
+            raise ValueError("There must be one value per key")
+        self._write(leaf)
+        self._first_leaf = level[0][1]
+
+        fanout = self._internal_capacity + 1
+        while len(level) > 1:
+            # Spread the children evenly, so every internal page is at least half full.
+            groups = -(-len(level) // fanout)
+            above = []
+            for group in range(groups):
+                children = level[group * len(level) // groups:(group + 1) * len(level) // groups]
+                page = _Page(self._allocate(), False, array("q", [key for key, _ in children[1:]]),
+                             array("q", [number for _, number in children]))
+                self._write(page)
+                above.append((children[0][0], page.number))
+            level = above
+            self._height += 1
+        self._root = level[0][1]
+        self.flush()
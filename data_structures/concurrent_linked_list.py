@@ -0,0 +1,507 @@
+"""
+concurrent_linked_list.py
+=========================
+
+This module implements a thread-safe doubly linked list with one lock per node.
+
+A single lock around a list serializes every operation, even a push at the
+tail and a pop at the head that touch different nodes. Here, the list is
+framed by two sentinel nodes and every node carries its own lock:
+
+- Changing `a.next` requires holding the lock of `a`; changing `b.previous`
+  requires holding the lock of `b`. Inserting between `a` and `b` locks both,
+  deleting `x` locks its predecessor, `x` and its successor.
+- Locks are always acquired from left to right, which rules out deadlocks.
+  Operations that find their nodes from the right (at the tail) lock them
+  left to right and then check that the links did not change, retrying if
+  they did.
+- Positional operations walk with hand-over-hand locking: the lock of the
+  next node is taken before the lock of the current node is released.
+- Iteration takes no lock. Deleted nodes keep their links and are flagged,
+  so an iterator standing on a deleted node still finds its way back to the
+  list. Iteration is weakly consistent: it never fails, yields every value
+  present for the whole iteration exactly once, and may or may not yield
+  values inserted or deleted meanwhile.
+
+Operations at the head and at the tail of a list with at least two values
+share no lock, so they proceed in parallel on free-threaded CPython builds.
+For the same reason, the size is kept in three counters, each guarded by a
+lock the operation already holds: one for head operations, one for tail
+operations and one, with its own lock, for everything else.
+
+Classes:
+    - Node: A node of the concurrent list, with its own lock.
+    - ConcurrentDoubleLinkedList: A thread-safe doubly linked list providing
+      the value-based operations of `DoubleLinkedList`.
+
+Usage:
+    work = ConcurrentDoubleLinkedList()
+    work.insert_at_tail("job-1")     # Producers append...
+    work.insert_at_tail("job-2")
+    work.delete_from_head()          # ...while consumers pop. Output: 'job-1'
+    list(work)                       # Output: ['job-2']
+"""
+import threading
+
+
+class Node:
+    """
+    Represents a node of a concurrent doubly linked list.
+
+    Attributes:
+        data (any): The data stored in the node.
+        _next (Node): The next node, the tail sentinel for the last value.
+        _previous (Node): The previous node, the head sentinel for the first value.
+        _lock (threading.Lock): Guards `_next`, `_previous` and `_data`.
+        _deleted (bool): Whether the node was unlinked from the list.
+    """
+    __slots__ = ("_data", "_next", "_previous", "_lock", "_deleted")
+
+    def __init__(self, data: any) -> None:
+        """
+        Initializes a detached node.
+
+        Args:
+            data (any): The data to store in the node.
+        """
+        self._data = data
+        self._next = None
+        self._previous = None
+        self._lock = threading.Lock()
+        self._deleted = False
+
+    @property
+    def data(self) -> any:
+        """
+        Retrieves the data stored in the node.
+
+        Returns:
+            any: The data stored in the node.
+        """
+        return self._data
+
+    def __repr__(self) -> str:
+        return f"Node(data={self._data})"
+
+
+class ConcurrentDoubleLinkedList:
+    """
+    A doubly linked list that can be shared between threads.
+
+    Attributes:
+        _head (Node): The sentinel before the first value.
+        _tail (Node): The sentinel after the last value.
+        _head_count (int): Values added minus values removed by head operations,
+            guarded by the lock of `_head`.
+        _tail_count (int): The same for tail operations, guarded by the lock of `_tail`.
+        _middle_count (int): The same for the other operations, guarded by `_size_lock`.
+    """
+
+    def __init__(self, values: any = None) -> None:
+        """
+        Initializes a list, optionally holding the values of an iterable.
+
+        Args:
+            values (iterable, optional): The initial values, from head to tail.
+        """
+        self._head = Node(None)
+        self._tail = Node(None)
+        self._head._next = self._tail
+        self._tail._previous = self._head
+        self._head_count = 0
+        self._tail_count = 0
+        self._middle_count = 0
+        self._size_lock = threading.Lock()
+        if values is not None:
+            for value in values:
+                self.insert_at_tail(value)
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the list is empty at this moment.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._head._next is self._tail
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        The counters are read without locking, so the result is exact when no
+        operation is in flight and may be off by the in-flight operations
+        otherwise.
+
+        Returns:
+            int: The size of the list.
+        """
+        return max(self._head_count + self._tail_count + self._middle_count, 0)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Lazily yields the values from head to tail, without locking.
+
+        Yields:
+            any: Each value of the list, weakly consistent with concurrent changes.
+        """
+        tail = self._tail
+        current = self._head._next
+        while current is not tail:
+            if not current._deleted:
+                yield current._data
+            current = current._next
+
+    def __reversed__(self):
+        """
+        Lazily yields the values from tail to head, without locking.
+
+        Yields:
+            any: Each value of the list, weakly consistent with concurrent changes.
+        """
+        head = self._head
+        current = self._tail._previous
+        while current is not head:
+            if not current._deleted:
+                yield current._data
+            current = current._previous
+
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is in the list, without locking.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            bool: True if the value was found.
+        """
+        return self.find(value) is not None
+
+    def find(self, value: any) -> Node | None:
+        """
+        Finds the first node holding a value, without locking.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            Node | None: The node holding the value, or None if not found.
+        """
+        tail = self._tail
+        current = self._head._next
+        while current is not tail:
+            if not current._deleted and current._data == value:
+                return current
+            current = current._next
+        return None
+
+    def insert_at_head(self, data: any) -> None:
+        """
+        Inserts a value at the beginning of the list.
+
+        Args:
+            data (any): The value to be inserted.
+        """
+        node = Node(data)
+        head = self._head
+        with head._lock:
+            following = head._next
+            with following._lock:
+                self._link(node, head, following)
+            self._head_count += 1
+
+    def insert_at_tail(self, data: any) -> None:
+        """
+        Inserts a value at the end of the list.
+
+        Args:
+            data (any): The value to be inserted.
+        """
+        node = Node(data)
+        tail = self._tail
+        while True:
+            preceding = tail._previous
+            with preceding._lock:
+                with tail._lock:
+                    if preceding._next is tail and not preceding._deleted:
+                        self._link(node, preceding, tail)
+                        self._tail_count += 1
+                        return
+
+    def insert_at_position(self, data: any, position: int) -> None:
+        """
+        Inserts a value at a specific position, walking with hand-over-hand locking.
+
+        Args:
+            data (any): The value to be inserted.
+            position (int): The position where the value should be inserted.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0:
+            raise IndexError("Position must be a valid index")
+        node = Node(data)
+        preceding = self._walk_locked(position)
+        try:
+            following = preceding._next
+            with following._lock:
+                self._link(node, preceding, following)
+        finally:
+            preceding._lock.release()
+        with self._size_lock:
+            self._middle_count += 1
+
+    def delete_from_head(self) -> any:
+        """
+        Deletes the value at the beginning of the list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        head = self._head
+        with head._lock:
+            node = head._next
+            if node is self._tail:
+                raise IndexError("Cannot delete from an empty list")
+            with node._lock:
+                with node._next._lock:
+                    self._unlink(node)
+            self._head_count -= 1
+        return node._data
+
+    def delete_from_tail(self) -> any:
+        """
+        Deletes the value at the end of the list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        head, tail = self._head, self._tail
+        while True:
+            node = tail._previous
+            if node is head:
+                with head._lock:
+                    if head._next is tail:
+                        raise IndexError("Cannot delete from an empty list")
+                continue
+            preceding = node._previous
+            with preceding._lock:
+                with node._lock:
+                    with tail._lock:
+                        if (not preceding._deleted and preceding._next is node
+                                and node._next is tail):
+                            self._unlink(node)
+                            self._tail_count -= 1
+                            return node._data
+
+    def delete_from_position(self, position: int) -> any:
+        """
+        Deletes the value at a specific position, walking with hand-over-hand locking.
+
+        Args:
+            position (int): The position of the value to be deleted.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0:
+            raise IndexError("Position out of bounds")
+        preceding = self._walk_locked(position)
+        try:
+            node = preceding._next
+            if node is self._tail:
+                raise IndexError("Position out of bounds")
+            with node._lock:
+                with node._next._lock:
+                    self._unlink(node)
+        finally:
+            preceding._lock.release()
+        with self._size_lock:
+            self._middle_count -= 1
+        return node._data
+
+    def remove(self, value: any) -> None:
+        """
+        Deletes the first occurrence of a value.
+
+        Args:
+            value (any): The value to delete.
+
+        Raises:
+            ValueError: If the value is not found.
+        """
+        preceding, node = self._find_locked(value)
+        try:
+            with node._next._lock:
+                self._unlink(node)
+        finally:
+            node._lock.release()
+            preceding._lock.release()
+        with self._size_lock:
+            self._middle_count -= 1
+
+    def update_node(self, old_data: any, new_data: any) -> None:
+        """
+        Replaces the first occurrence of a value.
+
+        Args:
+            old_data (any): The value to search for.
+            new_data (any): The value that replaces it.
+
+        Raises:
+            ValueError: If the value is not found.
+        """
+        preceding, node = self._find_locked(old_data)
+        try:
+            node._data = new_data
+        finally:
+            node._lock.release()
+            preceding._lock.release()
+
+    def traversal_forward(self) -> list:
+        """
+        Returns the values of the list from head to tail.
+
+        Returns:
+            list: The values from head to tail.
+        """
+        return list(self)
+
+    def traversal_backward(self) -> list:
+        """
+        Returns the values of the list from tail to head.
+
+        Returns:
+            list: The values from tail to head.
+        """
+        return list(reversed(self))
+
+    def clear(self) -> None:
+        """
+        Deletes every value, locking the whole list from left to right.
+        """
+        locked = [self._head]
+        self._head._lock.acquire()
+        try:
+            current = self._head._next
+            while current is not None:
+                current._lock.acquire()
+                locked.append(current)
+                current = current._next
+            for node in locked[1:-1]:
+                node._deleted = True
+            self._head._next = self._tail
+            self._tail._previous = self._head
+            with self._size_lock:
+                self._head_count = self._tail_count = self._middle_count = 0
+        finally:
+            for node in reversed(locked):
+                node._lock.release()
+
+    def _link(self, node: Node, preceding: Node, following: Node) -> None:
+        """
+        Links a node between two adjacent nodes whose locks are held.
+
+        Args:
+            node (Node): The detached node to link.
+            preceding (Node): The node before the new one.
+            following (Node): The node after the new one.
+        """
+        node._previous = preceding
+        node._next = following
+        preceding._next = node
+        following._previous = node
+
+    def _unlink(self, node: Node) -> None:
+        """
+        Unlinks a node whose lock, and the locks of its neighbours, are held.
+
+        The node keeps its own links, so iterators standing on it can move on.
+
+        Args:
+            node (Node): The node to unlink.
+        """
+        node._deleted = True
+        node._previous._next = node._next
+        node._next._previous = node._previous
+
+    def _walk_locked(self, position: int) -> Node:
+        """
+        Walks to the node before a position with hand-over-hand locking.
+
+        Args:
+            position (int): The position, between 0 and the current size.
+
+        Returns:
+            Node: The node before the position, returned locked.
+
+        Raises:
+            IndexError: If the list is shorter than the position.
+        """
+        current = self._head
+        current._lock.acquire()
+        for _ in range(position):
+            following = current._next
+            if following is self._tail:
+                current._lock.release()
+                raise IndexError("Position out of bounds")
+            following._lock.acquire()
+            current._lock.release()
+            current = following
+        return current
+
+    def _find_locked(self, value: any) -> tuple[Node, Node]:
+        """
+        Finds the first node holding a value with hand-over-hand locking.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            tuple[Node, Node]: The node and its predecessor, both returned locked.
+
+        Raises:
+            ValueError: If the value is not found.
+            Exception: Whatever comparing a value raises; no lock is left held.
+        """
+        preceding = self._head
+        preceding._lock.acquire()
+        held = None
+        try:
+            while True:
+                node = preceding._next
+                if node is self._tail:
+                    raise ValueError(f"Node with data {value} not found in the list.")
+                node._lock.acquire()
+                held = node
+                if node._data == value:
+                    return preceding, node
+                released, preceding, held = preceding, node, None
+                released._lock.release()
+        except BaseException:
+            # A comparison that raises must not leave the list locked.
+            if held is not None:
+                held._lock.release()
+            preceding._lock.release()
+            raise
@@ -1,9 +1,58 @@
+from collections import deque
+from itertools import islice
+
+
 class Deque:
-    def __init__(self) -> None:
+    def __init__(self, indexed: bool = False) -> None:
         """
         Initializes an empty deque.
+
+        The values are kept in a `collections.deque`, so adding and removing
+        values at either end runs in O(1).
+
+        When `indexed` is True the deque also maintains a map from each value to
+        the slots it occupies, which makes `count` and membership checks O(1)
+        and lets `index` skip the scan. Slots are absolute positions offset by
+        `_base`, so appending or popping at either end only touches one entry.
+        Values must be hashable in this mode.
+
+        Args:
+            indexed (bool): Whether to maintain the value index. Defaults to False.
+        """
+        self._deque = deque()
+        self._positions = {} if indexed else None
+        self._base = 0
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the deque as a flat sequence of its values, through `serialization`.
+
+        Returns:
+            tuple: The rebuild function, its arguments and the state of a subclass.
+        """
+        # Imported here, since the serialization module imports this one.
+        from data_structures.serialization import _reduce
+        return _reduce(self)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the deque.
+
+        Returns:
+            int: The size of the deque.
+        """
+        return len(self._deque)
+
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is stored in the deque.
+
+        Returns:
+            bool: True if the value is in the deque, False otherwise.
         """
-        self._deque = []
+        if self._positions is not None:
+            return value in self._positions
+        return value in self._deque
 
     def size(self) -> int:
         """
@@ -30,6 +79,8 @@ class Deque:
         Args:
             value (any): The value to be appended to the deque.
         """
+        if self._positions is not None:
+            self._add_slot(value, self._base + len(self._deque))
         self._deque.append(value)
 
     def append_left(self, value: any) -> None:
@@ -39,7 +90,10 @@ class Deque:
         Args:
             value (any): The value to be added to the front of the deque.
         """
-        self._deque.insert(0, value)
+        if self._positions is not None:
+            self._base -= 1
+            self._add_slot(value, self._base)
+        self._deque.appendleft(value)
 
     def peek_left(self) -> any:
         """
@@ -86,7 +140,10 @@ class Deque:
         """
         if self.is_empty():
             raise IndexError("Pop from an empty deque")
-        return self._deque.pop()
+        value = self._deque.pop()
+        if self._positions is not None:
+            self._discard_slot(value, self._base + len(self._deque))
+        return value
 
     def pop_left(self) -> any:
         """
@@ -101,16 +158,24 @@ class Deque:
         """
         if self.is_empty():
             raise IndexError("Pop from an empty deque")
-        return self._deque.pop(0)
+        value = self._deque.popleft()
+        if self._positions is not None:
+            self._discard_slot(value, self._base)
+            self._base += 1
+        return value
 
     def index(self, value: any, beg: int = 0, end: int | None = None) -> set[int] | None:
         """
         Finds all indexes of a value within a specified range in the deque.
 
+        With the value index enabled, only the slots of the value are visited
+        instead of scanning the whole range.
+
         Args:
             value (any): The value to search for in the deque.
             beg (int): The starting index for the search.
-            end (int): The ending index for the search.
+            end (int): The ending index for the search (exclusive). Defaults to
+                the size of the deque.
 
         Returns:
             set[int] | None: A set of indexes where the value is found in the specified range, 
@@ -119,15 +184,19 @@ class Deque:
         Raises:
             IndexError: If the starting or ending index is out of bounds.
         """
-        if beg < 0 or end > len(self._deque) - 1:
+        if end is None:
+            end = len(self._deque)
+        if beg < 0 or end > len(self._deque):
             raise IndexError("Invalid start and/or end values")
         if beg > end:
             raise IndexError("Start index cannot be greater than end index")
-        if end is None:
-            end = len(self._deque)
+        if self._positions is not None:
+            slots = self._positions.get(value, ())
+            result = {slot - self._base for slot in slots if beg <= slot - self._base < end}
+            return result if result else None
         result = set()
-        for index in range(beg, end):
-            if self._deque[index] == value:
+        for index, item in enumerate(islice(self._deque, beg, end), beg):
+            if item == value:
                 result.add(index)
         return result if result else None
 
@@ -139,11 +208,14 @@ class Deque:
             value (any): The value to be inserted.
             index (int): The index where the value should be inserted.
         """
-        self.append(value)
-        for prev_index in range(self.size() - 2, index - 1, -1):
-            self._deque[prev_index], self._deque[prev_index+1] = (
-                self._deque[prev_index+1], self._deque[prev_index]
-                )
+        if index <= 0:
+            self.append_left(value)
+        elif index >= len(self._deque):
+            self.append(value)
+        else:
+            self._deque.insert(index, value)
+            if self._positions is not None:
+                self._reindex()
 
     def remove(self, value: any) -> str:
         """
@@ -156,25 +228,75 @@ class Deque:
             str: A message indicating whether the value was found and deleted, 
             or not found in the deque.
         """
+        if self._positions is not None:
+            slots = self._positions.get(value)
+            if not slots:
+                return "Value not in deque"
+            index = min(slots) - self._base
+            if index == 0:
+                self.pop_left()
+            elif index == len(self._deque) - 1:
+                self.pop()
+            else:
+                del self._deque[index]
+                self._reindex()
+            return f"Value deleted at index {index}"
         for index, values in enumerate(self._deque):
             if values == value:
                 del self._deque[index]
                 return f"Value deleted at index {index}"
         return "Value not in deque"
 
-    def count(self, value: any) -> str:
+    def count(self, value: any) -> int:
         """
         Counts the occurrences of a value in the deque.
 
+        Runs in O(1) when the value index is enabled.
+
         Args:
             value (any): The value to count in the deque.
 
         Returns:
-            str: A message indicating how many times the value appears in the deque.
+            int: How many times the value appears in the deque.
+        """
+        if self._positions is not None:
+            return len(self._positions.get(value, ()))
+        return self._deque.count(value)
+
+    def _add_slot(self, value: any, slot: int) -> None:
+        """
+        Records that a value occupies an absolute slot.
+
+        Args:
+            value (any): The stored value.
+            slot (int): The absolute slot of the value.
+        """
+        slots = self._positions.get(value)
+        if slots is None:
+            self._positions[value] = {slot}
+        else:
+            slots.add(slot)
+
+    def _discard_slot(self, value: any, slot: int) -> None:
+        """
+        Forgets that a value occupies an absolute slot.
+
+        Args:
+            value (any): The removed value.
+            slot (int): The absolute slot the value occupied.
+        """
+        slots = self._positions[value]
+        slots.discard(slot)
+        if not slots:
+            del self._positions[value]
+
+    def _reindex(self) -> None:
+        """
+        Rebuilds the value index after a value was inserted or removed in the middle.
         """
-        indexes = len(self.index(value))
-        count = len(indexes) if indexes else 0
-        return f"Value found {count} times"
+        self._positions = {}
+        for index, value in enumerate(self._deque):
+            self._add_slot(value, self._base + index)
 
     def display(self) -> None:
         """
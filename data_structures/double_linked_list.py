@@ -26,6 +26,10 @@ Usage:
     print(node1.next.data) # Output: 20
     print(node2.previous.data) # Output: 10
 """
+from data_structures.linked_list import (
+    _index_add, _index_discard, _index_first, _merge_chains, _sort_chain,
+)
+
 
 class InvalidArgument(Exception):
     """Custom exception raised when an invalid argument is provided."""
@@ -38,7 +42,11 @@ class Node:
         data (any): The data stored in the node.
         next (Node): The reference to the next node in the list.
         previous (Node): The reference to the previous node in the list.
+
+    Nodes use `__slots__`, as described in `data_structures.linked_list`.
     """
+    __slots__ = ("_data", "_next", "_previous")
+
     def __init__(self, data, next_node=None, previous=None) -> None:
         """
         Initializes a new node in the linked list.
@@ -124,6 +132,26 @@ class Node:
         else:
             raise InvalidArgument("Previous needs to be None or a Node object.")
 
+def _move_indexed(first: Node, source: dict | None, target: dict | None) -> None:
+    """
+    Moves the index entries of a chain of nodes from one list's index to another's.
+
+    Args:
+        first (Node): The first node of the chain, which must end with a None link.
+        source (dict | None): The index of the list the nodes come from, if indexed.
+        target (dict | None): The index of the list the nodes go to, if indexed.
+    """
+    if source is None and target is None:
+        return
+    current = first
+    while current is not None:
+        if source is not None:
+            _index_discard(source, current._data, current)
+        if target is not None:
+            _index_add(target, current._data, current)
+        current = current._next
+
+
 class DoubleLinkedList:
     """
     A class representing a doubly linked list.
@@ -132,11 +160,17 @@ class DoubleLinkedList:
         _head (Node | None): The first node in the list.
         _tail (Node | None): The last node in the list.
         _size (int): The number of nodes in the list.
+        _index (dict | None): Maps each value to the nodes holding it, when indexed.
+        _finger (Node | None): The last node accessed by position, when a finger is used.
+        _finger_position (int): The position of `_finger`.
+        _version (int): Incremented by every change to the links, so iterators
+            can detect that the list changed under them.
 
     Methods:
         is_empty(): Returns True if the list is empty, False otherwise.
         size(): Returns the number of nodes in the list.
         head(): Returns the first node of the list.
+        new_node(data: any): Returns a node for the data, recycled from the pool if any.
         insert_at_head(new_node: Node): Inserts a new node at the beginning of the list.
         insert_at_tail(new_node: Node): Inserts a new node at the end of the list.
         insert_at_position(new_node: Node, position: int): Inserts a new node at
@@ -144,23 +178,63 @@ class DoubleLinkedList:
         delete_from_head(): Deletes the node at the beginning of the list.
         delete_from_tail(): Deletes the node at the end of the list.
         delete_from_position(position: int): Deletes the node at a specific position.
+        node_at(position: int): Returns the node at a specific position.
         find(value: any): Finds and returns the first node with the specified data.
+        remove(value: any): Deletes the first node with the specified data.
         update_node(old_data: any, new_data: any): Updates the data of the node
             with the specified old data.
+        iter_from(node, reverse): Lazily yields the data from a node onwards.
+        iter_nodes(reverse): Lazily yields the nodes of the list.
         traversal_forward(): Returns a list of node data traversed from head to tail.
         traversal_backward(): Returns a list of node data traversed from tail to head.
+        sort(key, reverse): Sorts the list in place with a stable merge sort.
+        merge_sorted(other, key, reverse): Merges another sorted list into this one.
+        concat(other): Moves the nodes of another list to the end of this one.
+        splice(start_node, end_node, into, after_node, count): Moves a range of
+            nodes into a list, after a given node.
+        split_at(node): Moves a node and the nodes after it to a new list.
         clear(): Clears all nodes from the list.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, pool=None, indexed=False, finger=False) -> None:
         """
         Initializes an empty doubly linked list.
 
         Attributes are set to None for both head and tail, and the size is set to 0.
+
+        When a `NodePool` is given, `new_node` takes nodes from it and the delete
+        methods return the removed nodes to it. Deleted nodes are then reset and
+        reused, so callers must not keep references to them.
+
+        An indexed list keeps a dict from each value to the nodes holding it, so
+        `find`, `update_node`, `remove` and `in` run in O(1) when the value is
+        held by a single node. Its values must be hashable, and the data of its
+        nodes must only be changed through `update_node`.
+
+        Positional operations walk from the head, the tail or, with `finger`, the
+        last node accessed by position, whichever is closest. The finger makes
+        operations clustered around the same area run in O(distance).
+
+        Args:
+            pool (NodePool, optional): A pool of doubly linked list nodes. Defaults to None.
+            indexed (bool): Whether to keep a value-to-nodes index. Defaults to False.
+            finger (bool): Whether to cache the last node accessed by position.
+                Defaults to False.
+
+        Raises:
+            TypeError: If the pool does not hold doubly linked list nodes.
         """
+        if pool is not None and not issubclass(pool.node_class, Node):
+            raise TypeError("Pool must hold double_linked_list.Node instances")
         self._head = None
         self._tail = None
         self._size = 0
+        self._version = 0
+        self._pool = pool
+        self._index = {} if indexed else None
+        self._uses_finger = finger
+        self._finger = None
+        self._finger_position = 0
 
     def is_empty(self) -> bool:
         """
@@ -181,6 +255,135 @@ class DoubleLinkedList:
         """
         return self._size
 
+    @property
+    def indexed(self) -> bool:
+        """
+        Checks whether the list keeps a value-to-nodes index.
+
+        Returns:
+            bool: True if the list is indexed, False otherwise.
+        """
+        return self._index is not None
+
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is in the list, in O(1) when indexed.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            bool: True if a node holds the value, False otherwise.
+        """
+        return self.find(value) is not None
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the list as a flat sequence of its values, through `serialization`.
+
+        Returns:
+            tuple: The rebuild function, its arguments and the state of a subclass.
+        """
+        # Imported here, since the serialization module imports this one.
+        from data_structures.serialization import _reduce
+        return _reduce(self)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Lazily yields the node data from head to tail.
+
+        Yields:
+            any: The data of each node.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        return self._iterate(self._head, False, True, self._version)
+
+    def __reversed__(self):
+        """
+        Lazily yields the node data from tail to head.
+
+        Yields:
+            any: The data of each node.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        return self._iterate(self._tail, True, True, self._version)
+
+    def iter_from(self, node: Node, reverse: bool = False):
+        """
+        Lazily yields the node data starting at a node of this list.
+
+        Args:
+            node (Node): The first node to visit.
+            reverse (bool): Whether to walk towards the head. Defaults to False.
+
+        Yields:
+            any: The data of the node and of each node after it (or before it).
+
+        Raises:
+            TypeError: If node is not an instance of Node.
+            RuntimeError: If the list is modified during iteration.
+        """
+        if not isinstance(node, Node):
+            raise TypeError("node must be an instance of Node")
+        return self._iterate(node, reverse, True, self._version)
+
+    def iter_nodes(self, reverse: bool = False):
+        """
+        Lazily yields the nodes of the list.
+
+        Args:
+            reverse (bool): Whether to walk from tail to head. Defaults to False.
+
+        Yields:
+            Node: Each node of the list.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        return self._iterate(self._tail if reverse else self._head, reverse, False, self._version)
+
+    def _iterate(self, node: Node | None, reverse: bool, data: bool, version: int):
+        """
+        Walks the list from a node, failing fast if the list changes.
+
+        The caller passes the version of the list when the iterator is created,
+        since a generator body only starts at the first `next()`. The version is
+        checked before the first item and every time the consumer asks for the
+        next one, before following a link that may have been cleared.
+
+        Args:
+            node (Node | None): The first node to visit.
+            reverse (bool): Whether to follow the `previous` links.
+            data (bool): Whether to yield the node data instead of the nodes.
+            version (int): The version of the list when iteration began.
+
+        Yields:
+            any: Each node, or its data.
+
+        Raises:
+            RuntimeError: If the list is modified during iteration.
+        """
+        if self._version != version:
+            raise RuntimeError("DoubleLinkedList changed during iteration")
+        while node is not None:
+            yield node._data if data else node
+            if self._version != version:
+                raise RuntimeError("DoubleLinkedList changed during iteration")
+            node = node._previous if reverse else node._next
+
     @property
     def head(self):
         """
@@ -201,6 +404,20 @@ class DoubleLinkedList:
         """
         return self._tail
 
+    def new_node(self, data: any) -> Node:
+        """
+        Returns a detached node holding the data, ready to be inserted.
+
+        Args:
+            data (any): The data to store in the node.
+
+        Returns:
+            Node: A pooled node when a pool is configured, otherwise a new one.
+        """
+        if self._pool is None:
+            return Node(data)
+        return self._pool.acquire(data)
+
     def insert_at_head(self, new_node: Node) -> None:
         """
         Inserts a new node at the beginning of the list.
@@ -211,16 +428,21 @@ class DoubleLinkedList:
         Raises:
             TypeError: If the new node is not an instance of Node.
         """
-        if new_node is None or isinstance(new_node, Node):
+        if isinstance(new_node, Node):
             if self._head is None:
                 self._head, self._tail = new_node, new_node
             else:
-                new_node.next = self._head
+                new_node._next = self._head
+                self._head._previous = new_node
                 self._head = new_node
-                new_node.next.previous = self._head
             self._size += 1
+            self._version += 1
+            if self._finger is not None:
+                self._finger_position += 1
+            if self._index is not None:
+                _index_add(self._index, new_node._data, new_node)
         else:
-            raise TypeError("new_node must be an instance of Node or None")
+            raise TypeError("new_node must be an instance of Node")
 
     def insert_at_tail(self, new_node: Node) -> None:
         """
@@ -233,13 +455,16 @@ class DoubleLinkedList:
             TypeError: If the new node is not an instance of Node.
         """
         if isinstance(new_node, Node):
-            if self.is_empty():
+            if self._head is None:
                 self._head, self._tail = new_node, new_node
             else:
-                new_node.previous = self._tail
-                self._tail.next = new_node
+                new_node._previous = self._tail
+                self._tail._next = new_node
                 self._tail = new_node
             self._size += 1
+            self._version += 1
+            if self._index is not None:
+                _index_add(self._index, new_node._data, new_node)
         else:
             raise TypeError("new_node must be an instance of Node")
 
@@ -263,16 +488,17 @@ class DoubleLinkedList:
             elif position == self._size:
                 self.insert_at_tail(new_node)
             else:
-                current = self._head
-                count = 0
-                while count != position:
-                    current = current.next
-                    count += 1
-                new_node.previous = current.previous
-                new_node.next = current
-                current.previous.next = new_node
-                current.previous = new_node
+                current = self._node_at(position)
+                new_node._previous = current._previous
+                new_node._next = current
+                current._previous._next = new_node
+                current._previous = new_node
                 self._size += 1
+                self._version += 1
+                if self._uses_finger:
+                    self._finger = new_node
+                if self._index is not None:
+                    _index_add(self._index, new_node._data, new_node)
         else:
             raise TypeError("new_node must be an instance of Node")
 
@@ -285,12 +511,16 @@ class DoubleLinkedList:
         """
         if self._size == 0:
             raise IndexError("Cannot delete from an empty list")
+        removed = self._head
+        self._move_finger_off(removed, 0)
         if self._size == 1:
             self._head, self._tail = None, None
         else:
-            self._head = self._head.next
-            self._head.previous = None
+            self._head = self._head._next
+            self._head._previous = None
         self._size -= 1
+        self._version += 1
+        self._discard(removed)
 
     def delete_from_tail(self) -> None:
         """
@@ -301,12 +531,16 @@ class DoubleLinkedList:
         """
         if self._size == 0:
             raise IndexError("Cannot delete from an empty list")
+        removed = self._tail
+        self._move_finger_off(removed, self._size - 1)
         if self._size == 1:
             self._head, self._tail = None, None
         else:
-            self._tail = self._tail.previous
-            self._tail.next = None
+            self._tail = self._tail._previous
+            self._tail._next = None
         self._size -= 1
+        self._version += 1
+        self._discard(removed)
 
     def delete_from_position(self, position: int) -> None:
         """
@@ -327,30 +561,146 @@ class DoubleLinkedList:
         elif position == self._size - 1:
             self.delete_from_tail()
         else:
-            count = 0
-            current = self._head
-            while count != position:
-                current = current.next
-                count += 1
-            current.previous.next = current.next
-            current.next.previous = current.previous
+            current = self._node_at(position)
+            self._move_finger_off(current, position)
+            current._previous._next = current._next
+            current._next._previous = current._previous
             self._size -= 1
+            self._version += 1
+            self._discard(current)
+
+    def remove(self, value: any) -> None:
+        """
+        Deletes the first node with the specified value.
+
+        The node is found through `find` and unlinked directly, so an indexed
+        list deletes a value held by a single node in O(1).
+
+        Args:
+            value (any): The value to delete.
+
+        Raises:
+            ValueError: If no node holds the value.
+        """
+        node = self.find(value)
+        if node is None:
+            raise ValueError(f"Node with data {value} not found in the list.")
+        self._move_finger_off(node, None)
+        if node._previous is None:
+            self._head = node._next
+        else:
+            node._previous._next = node._next
+        if node._next is None:
+            self._tail = node._previous
+        else:
+            node._next._previous = node._previous
+        self._size -= 1
+        self._version += 1
+        self._discard(node)
+
+    def node_at(self, position: int) -> Node:
+        """
+        Returns the node at a specific position.
+
+        Args:
+            position (int): The position of the node.
+
+        Returns:
+            Node: The node at the position.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position out of bounds, must be between 0 and {self._size - 1}")
+        return self._node_at(position)
+
+    def _node_at(self, position: int) -> Node:
+        """
+        Walks to a valid position from the closest of the head, the tail and the finger.
+
+        Args:
+            position (int): The position of the node, between 0 and size - 1.
+
+        Returns:
+            Node: The node at the position, which becomes the finger if one is used.
+        """
+        if position <= self._size - 1 - position:
+            current, start = self._head, 0
+        else:
+            current, start = self._tail, self._size - 1
+        if self._finger is not None and abs(position - self._finger_position) < abs(position - start):
+            current, start = self._finger, self._finger_position
+        if start < position:
+            for _ in range(position - start):
+                current = current._next
+        else:
+            for _ in range(start - position):
+                current = current._previous
+        if self._uses_finger:
+            self._finger, self._finger_position = current, position
+        return current
+
+    def _move_finger_off(self, node: Node, position: int | None) -> None:
+        """
+        Keeps the finger valid before a node is unlinked.
+
+        A finger on the removed node moves to its successor, or to its
+        predecessor at the end of the list. A finger after the removed node
+        moves back one position. When the position of the removed node is
+        unknown, a finger on another node is dropped.
+
+        Args:
+            node (Node): The node about to be unlinked.
+            position (int | None): The position of the node, or None if unknown.
+        """
+        if self._finger is None:
+            return
+        if node is self._finger:
+            if node._next is not None:
+                self._finger = node._next
+            else:
+                self._finger = node._previous
+                self._finger_position -= 1
+        elif position is None:
+            self._finger = None
+        elif position < self._finger_position:
+            self._finger_position -= 1
+
+    def _discard(self, node: Node) -> None:
+        """
+        Detaches a removed node, drops it from the index and returns it to the
+        pool, if any.
+
+        Args:
+            node (Node): The node that was unlinked from the list.
+        """
+        node._next = node._previous = None
+        if self._index is not None:
+            _index_discard(self._index, node._data, node)
+        if self._pool is not None:
+            self._pool.release(node)
 
     def find(self, value: any) -> Node | None:
         """
         Finds and returns the first node with the specified value.
 
+        An indexed list answers in O(1) when the value is held by a single node;
+        otherwise the list is walked from the head.
+
         Args:
             value (any): The value to search for.
 
         Returns:
             Node | None: The node containing the specified value, or None if not found.
         """
+        if self._index is not None:
+            return _index_first(self._index, self._head, value)
         current = self._head
-        while current:
-            if current.data == value:
+        while current is not None:
+            if current._data == value:
                 return current
-            current = current.next
+            current = current._next
         return None
 
     def update_node(self, old_data: any, new_data: any) -> None:
@@ -367,12 +717,20 @@ class DoubleLinkedList:
         """
         if self.is_empty():
             raise IndexError("Cannot update empty list.")
+        if self._index is not None:
+            node = _index_first(self._index, self._head, old_data)
+            if node is None:
+                raise ValueError(f"Node with data {old_data} not found in the list.")
+            _index_discard(self._index, node._data, node)
+            node._data = new_data
+            _index_add(self._index, node._data, node)
+            return
         current = self._head
-        while current:
-            if current.data == old_data:
-                current.data = new_data
+        while current is not None:
+            if current._data == old_data:
+                current._data = new_data
                 return
-            current = current.next
+            current = current._next
         raise ValueError(f"Node with data {old_data} not found in the list.")
 
     def traversal_forward(self):
@@ -382,12 +740,7 @@ class DoubleLinkedList:
         Returns:
             list: A list of node data from head to tail.
         """
-        result = []
-        current = self._head
-        while current:
-            result.append(current.data)
-            current = current.next
-        return result
+        return list(self)
 
     def traversal_backward(self):
         """
@@ -396,13 +749,259 @@ class DoubleLinkedList:
         Returns:
             list: A list of node data from tail to head.
         """
-        result = []
-        current = self._tail
-        while current:
-            result.append(current.data)
-            current = current.previous
+        return list(reversed(self))
+
+    def sort(self, key=None, reverse=False) -> None:
+        """
+        Sorts the list in place with a stable bottom-up merge sort.
+
+        The existing nodes are relinked; no node is allocated or copied. The
+        `next` links are sorted first and the `previous` links are rebuilt in a
+        final pass.
+
+        Args:
+            key (callable, optional): Function extracting the comparison key from
+                each node's data. Defaults to the data itself.
+            reverse (bool): Whether to sort in descending order. Defaults to False.
+        """
+        self._head, self._tail = _sort_chain(self._head, self._size, Node(None), key, reverse)
+        self._relink_previous()
+        self._version += 1
+        self._finger = None
+
+    def merge_sorted(self, other: 'DoubleLinkedList', key=None, reverse=False) -> None:
+        """
+        Merges another sorted list into this sorted list in O(n + m).
+
+        Both lists must already be sorted with the same key and order. The nodes
+        of `other` are moved into this list, which leaves `other` empty. The merge
+        is stable: on ties, the nodes of this list come first. When this list is
+        indexed, the moved nodes are added to its index.
+
+        Args:
+            other (DoubleLinkedList): The sorted list to merge into this one.
+            key (callable, optional): Function extracting the comparison key from
+                each node's data. Defaults to the data itself.
+            reverse (bool): Whether the lists are sorted in descending order.
+
+        Raises:
+            TypeError: If other is not a DoubleLinkedList.
+            ValueError: If other is this list.
+        """
+        if not isinstance(other, DoubleLinkedList):
+            raise TypeError("Can only merge another DoubleLinkedList")
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        if other._head is None:
+            return
+        if self._index is not None:
+            current = other._head
+            while current is not None:
+                _index_add(self._index, current._data, current)
+                current = current._next
+        if self._head is None:
+            self._head, self._tail = other._head, other._tail
+        else:
+            anchor = Node(None)
+            self._tail = _merge_chains(self._head, other._head, anchor, key, reverse)
+            self._head = anchor._next
+            anchor._next = None
+            self._relink_previous()
+        self._size += other._size
+        self._version += 1
+        self._finger = None
+        other._head, other._tail, other._size = None, None, 0
+        other._version += 1
+        other._finger = None
+        if other._index is not None:
+            other._index.clear()
+
+    def concat(self, other: 'DoubleLinkedList') -> None:
+        """
+        Moves the nodes of another list to the end of this list in O(1).
+
+        The nodes are relinked, not copied, which leaves `other` empty. When this
+        list is indexed, the moved nodes are added to its index in O(m).
+
+        Args:
+            other (DoubleLinkedList): The list to append to this one.
+
+        Raises:
+            TypeError: If other is not a DoubleLinkedList.
+            ValueError: If other is this list.
+        """
+        if not isinstance(other, DoubleLinkedList):
+            raise TypeError("Can only concatenate another DoubleLinkedList")
+        if other is self:
+            raise ValueError("Cannot concatenate a list to itself")
+        if other._head is None:
+            return
+        _move_indexed(other._head, None, self._index)
+        if self._head is None:
+            self._head = other._head
+        else:
+            self._tail._next = other._head
+            other._head._previous = self._tail
+        self._tail = other._tail
+        self._size += other._size
+        self._version += 1
+        other._head, other._tail, other._size = None, None, 0
+        other._version += 1
+        other._finger = None
+        if other._index is not None:
+            other._index.clear()
+
+    def splice(self, start_node: Node, end_node: Node, into: 'DoubleLinkedList',
+               after_node: Node | None = None, count: int | None = None) -> None:
+        """
+        Moves the nodes from start_node to end_node, inclusive, into a list.
+
+        The range is unlinked from this list and linked into `into` after
+        `after_node`, or at its head when after_node is None. `into` may be this
+        list, as long as after_node is outside the range. The nodes are relinked
+        in O(1) when `count` is given; otherwise the range is walked once to
+        count it and check it. Indexed lists move the index entries of the
+        range in O(k).
+
+        start_node must belong to this list. Only the O(1) part of that is
+        checked: a range starting or ending at a list end must start at this
+        list's head or end at its tail, and start_node must be linked to its
+        predecessor. A range in the middle of another list is not detected.
+
+        Args:
+            start_node (Node): The first node of the range, in this list.
+            end_node (Node): The last node of the range, at or after start_node.
+            into (DoubleLinkedList): The list receiving the range.
+            after_node (Node, optional): The node of `into` to insert the range
+                after. Defaults to None, which inserts at the head.
+            count (int, optional): The number of nodes in the range, if known.
+
+        Raises:
+            TypeError: If the nodes or the target list have the wrong type.
+            ValueError: If the range is not in this list, end_node does not
+                follow start_node, or after_node is inside the range.
+        """
+        if not isinstance(into, DoubleLinkedList):
+            raise TypeError("Can only splice into a DoubleLinkedList")
+        if not (isinstance(start_node, Node) and isinstance(end_node, Node)):
+            raise TypeError("start_node and end_node must be instances of Node")
+        if after_node is not None and not isinstance(after_node, Node):
+            raise TypeError("after_node must be None or an instance of Node")
+        if (start_node is not self._head if start_node._previous is None
+                else start_node._previous._next is not start_node):
+            raise ValueError("start_node is not in this list")
+        if end_node._next is None and end_node is not self._tail:
+            raise ValueError("end_node is not in this list")
+        if count is None:
+            count = 1
+            current = start_node
+            while current is not end_node:
+                if current is None:
+                    raise ValueError("end_node does not follow start_node")
+                if current is after_node:
+                    raise ValueError("after_node cannot be inside the spliced range")
+                current = current._next
+                count += 1
+            if end_node is after_node:
+                raise ValueError("after_node cannot be inside the spliced range")
+
+        if start_node._previous is None:
+            self._head = end_node._next
+        else:
+            start_node._previous._next = end_node._next
+        if end_node._next is None:
+            self._tail = start_node._previous
+        else:
+            end_node._next._previous = start_node._previous
+        start_node._previous = end_node._next = None
+        self._size -= count
+        self._version += 1
+        self._finger = None
+        if into is not self:
+            _move_indexed(start_node, self._index, into._index)
+
+        if after_node is None:
+            end_node._next = into._head
+            if into._head is None:
+                into._tail = end_node
+            else:
+                into._head._previous = end_node
+            into._head = start_node
+        else:
+            end_node._next = after_node._next
+            if after_node._next is None:
+                into._tail = end_node
+            else:
+                after_node._next._previous = end_node
+            after_node._next = start_node
+            start_node._previous = after_node
+        into._size += count
+        into._version += 1
+        into._finger = None
+
+    def split_at(self, node: Node) -> 'DoubleLinkedList':
+        """
+        Moves a node and every node after it to a new list.
+
+        The sizes of both parts are found by walking from the node in both
+        directions at once, so the split costs O(min(k, n - k)). An indexed list
+        moves the index entries of the smaller part.
+
+        Args:
+            node (Node): A node of this list, which becomes the head of the new list.
+
+        Returns:
+            DoubleLinkedList: A list with the same settings as this one, holding
+            the node and the nodes after it.
+
+        Raises:
+            TypeError: If node is not an instance of Node.
+        """
+        if not isinstance(node, Node):
+            raise TypeError("node must be an instance of Node")
+        ahead, behind = node, node._previous
+        steps = 0
+        while ahead is not None and behind is not None:
+            ahead, behind = ahead._next, behind._previous
+            steps += 1
+        moved = steps if ahead is None else self._size - steps
+        kept = self._size - moved
+
+        result = type(self)(pool=self._pool, indexed=self._index is not None,
+                            finger=self._uses_finger)
+        result._head, result._tail, result._size = node, self._tail, moved
+        if node._previous is None:
+            self._head, self._tail = None, None
+        else:
+            self._tail = node._previous
+            self._tail._next = None
+            node._previous = None
+        self._size = kept
+        self._version += 1
+
+        if self._index is not None:
+            if moved <= kept:
+                _move_indexed(node, self._index, result._index)
+            else:
+                result._index, self._index = self._index, result._index
+                _move_indexed(self._head, result._index, self._index)
+        if self._finger is not None and self._finger_position >= kept:
+            result._finger = self._finger
+            result._finger_position = self._finger_position - kept
+            self._finger = None
         return result
 
+    def _relink_previous(self) -> None:
+        """
+        Rebuilds every `previous` link from the `next` links.
+        """
+        previous = None
+        current = self._head
+        while current is not None:
+            current._previous = previous
+            previous = current
+            current = current._next
+
     def clear(self):
         """
         Clears all nodes from the list, resetting the head, tail, and size.
@@ -410,9 +1009,13 @@ class DoubleLinkedList:
         After calling this method, the list will be empty.
         """
         if self._head != self._tail:
-            self._head.next, self._tail.previous = None, None
+            self._head._next, self._tail._previous = None, None
         self._head, self._tail = None, None
         self._size = 0
+        self._version += 1
+        self._finger = None
+        if self._index is not None:
+            self._index.clear()
 
 if __name__ == "__main__":
     dll = DoubleLinkedList()
@@ -7,13 +7,27 @@ This module implements a basic singly linked list data structure.
 Classes:
     - Node: Represents a node in the linked list.
     - LinkedList: Provides methods for managing a linked list, including
-      insertion, traversal, searching, and checking if the list is empty.
+      insertion at both ends, removal from the head or by value, iteration,
+      searching, in-place sorting, and checking if the list is empty.
+
+An optional value-to-nodes index (`LinkedList(indexed=True)`) answers `find`
+and membership checks in O(1) at the cost of one dict update per insert and
+delete. The index is shared with `DoubleLinkedList` and `BinaryTree` through
+the helpers below.
+
+The node classes of both lists declare `__slots__`, so a node carries no
+per-instance `__dict__`. Their public link setters validate their argument;
+list operations write the underscored links directly, since they only link
+nodes they have already checked.
 
 Usage:
     linked_list = LinkedList()
     linked_list.insert(10)
-    linked_list.insert(20)
+    linked_list.append(20)
     linked_list.traversal(print)  # Prints the linked list nodes.
+    list(linked_list)             # Output: [10, 20]
+    linked_list.find(20)          # Output: Node(data=20)
+    linked_list.index_of(20)      # Output: 1
 """
 class Node():
     """
@@ -22,7 +36,11 @@ class Node():
     Attributes:
         data (any): The data stored in the node.
         next (Node): The reference to the next node in the list.
+
+    Nodes use `__slots__`; see the module notes.
     """
+    __slots__ = ("_data", "_next")
+
     def __init__(self, data: any, next_node: 'Node' = None) -> None:
         """
         Initializes a new Node instance.
@@ -88,7 +106,7 @@ class Node():
         Returns:
             bool: True if the node is the last, False otherwise.
         """
-        return self.next is None
+        return self._next is None
 
     def __str__(self):
         """
@@ -109,18 +127,252 @@ class Node():
         return f"Node(data={self.data})"
 
 
+def _split_chain(head, count):
+    """
+    Cuts a chain of nodes after its first `count` nodes.
+
+    Args:
+        head (Node): The first node of the chain, or None.
+        count (int): How many nodes to keep in the first part.
+
+    Returns:
+        Node: The first node of the second part, or None.
+    """
+    for _ in range(count - 1):
+        if head is None:
+            return None
+        head = head._next
+    if head is None:
+        return None
+    rest = head._next
+    head._next = None
+    return rest
+
+
+def _merge_chains(left, right, tail, key, reverse):
+    """
+    Merges two sorted chains of nodes and links the result after `tail`.
+
+    Ties are taken from the left chain first, so the merge is stable. Nodes are
+    relinked through their `_next` attribute, so this works for any node class
+    of this package.
+
+    Args:
+        left (Node): The first node of the first chain, or None.
+        right (Node): The first node of the second chain, or None.
+        tail (Node): The node the merged chain is attached to.
+        key (callable): Function extracting the comparison key from the data, or None.
+        reverse (bool): Whether the chains are sorted in descending order.
+
+    Returns:
+        Node: The last node of the merged chain (`tail` if both chains are empty).
+    """
+    while left is not None and right is not None:
+        if key is None:
+            left_key, right_key = left._data, right._data
+        else:
+            left_key, right_key = key(left._data), key(right._data)
+        if (left_key < right_key) if reverse else (right_key < left_key):
+            tail._next = right
+            tail = right
+            right = right._next
+        else:
+            tail._next = left
+            tail = left
+            left = left._next
+    tail._next = left if left is not None else right
+    while tail._next is not None:
+        tail = tail._next
+    return tail
+
+
+def _sort_chain(head, length, anchor, key, reverse):
+    """
+    Sorts a chain of nodes with a bottom-up merge sort, relinking the nodes in place.
+
+    Runs in O(n log n) time and O(1) extra space; no node is copied or allocated.
+
+    Args:
+        head (Node): The first node of the chain, or None.
+        length (int): The number of nodes in the chain.
+        anchor (Node): A spare node used as a placeholder before the head.
+        key (callable): Function extracting the comparison key from the data, or None.
+        reverse (bool): Whether to sort in descending order.
+
+    Returns:
+        tuple: The new first and last nodes of the chain.
+    """
+    tail = head
+    anchor._next = head
+    width = 1
+    while width < length:
+        tail = anchor
+        current = anchor._next
+        while current is not None:
+            left = current
+            right = _split_chain(left, width)
+            current = _split_chain(right, width)
+            tail = _merge_chains(left, right, tail, key, reverse)
+        width *= 2
+    head = anchor._next
+    anchor._next = None
+    return head, tail
+
+
+def _index_add(index, value, node):
+    """
+    Adds a node to a value-to-nodes index.
+
+    A value held by one node maps to that node. Once a value is held by several
+    nodes, it maps to a dict used as an insertion-ordered set of them, so unique
+    values do not pay for a container each. The value is passed separately so
+    that any node type can be indexed; `BinaryTree` shares these helpers.
+
+    Args:
+        index (dict): The index to update.
+        value (any): The value the node holds.
+        node (any): The node to add.
+    """
+    nodes = index.get(value)
+    if nodes is None:
+        index[value] = node
+    elif type(nodes) is dict:
+        nodes[node] = None
+    else:
+        index[value] = {nodes: None, node: None}
+
+
+def _index_discard(index, value, node):
+    """
+    Removes a node from a value-to-nodes index.
+
+    Args:
+        index (dict): The index to update.
+        value (any): The value the node was indexed under.
+        node (any): The node to remove.
+    """
+    nodes = index[value]
+    if type(nodes) is not dict:
+        del index[value]
+        return
+    del nodes[node]
+    if len(nodes) == 1:
+        index[value] = next(iter(nodes))
+
+
+def _index_first(index, head, value):
+    """
+    Returns the first node, in list order, holding a value.
+
+    A value held by a single node is answered in O(1). With duplicates, the
+    chain is walked from `head` until the first node holding the value.
+
+    Args:
+        index (dict): The value-to-nodes index.
+        head (Node): The first node of the list.
+        value (any): The value to search for.
+
+    Returns:
+        Node: The first node holding the value, or None if not found.
+    """
+    nodes = index.get(value)
+    if type(nodes) is not dict:
+        return nodes
+    current = head
+    while current not in nodes:
+        current = current._next
+    return current
+
+
 class LinkedList():
     """
     Represents a singly linked list.
 
+    The list tracks its last node and its length, so appending and `len()`
+    run in O(1). An indexed list also keeps a dict from each value to the nodes
+    holding it, so `find` and `in` run in O(1); its values must be hashable.
+    Change the data of an indexed list's nodes only through the list, since
+    writing `node.data` directly leaves the index stale.
+
     Attributes:
         head (Node): The head (first node) of the linked list.
+        tail (Node): The tail (last node) of the linked list.
     """
-    def __init__(self):
+    def __init__(self, pool=None, indexed=False):
         """
         Initializes an empty linked list.
+
+        When a `NodePool` is given, inserts take their nodes from it and
+        `pop_head` returns removed nodes to it.
+
+        Args:
+            pool (NodePool, optional): A pool of linked list nodes. Defaults to None.
+            indexed (bool): Whether to keep a value-to-nodes index. Defaults to False.
+
+        Raises:
+            TypeError: If the pool does not hold linked list nodes.
         """
+        if pool is not None and not issubclass(pool.node_class, Node):
+            raise TypeError("Pool must hold linked_list.Node instances")
         self._head = None
+        self._tail = None
+        self._size = 0
+        self._pool = pool
+        self._index = {} if indexed else None
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the list as a flat sequence of its values, through `serialization`.
+
+        Returns:
+            tuple: The rebuild function, its arguments and the state of a subclass.
+        """
+        # Imported here, since the serialization module imports this one.
+        from data_structures.serialization import _reduce
+        return _reduce(self)
+
+    def __len__(self):
+        """
+        Returns the number of nodes in the linked list.
+
+        Returns:
+            int: The length of the list.
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Lazily yields the data of each node from head to tail.
+
+        Yields:
+            any: The data stored in each node.
+        """
+        current = self._head
+        while current is not None:
+            yield current._data
+            current = current._next
+
+    def __contains__(self, value):
+        """
+        Checks whether a value is in the linked list, in O(1) when indexed.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            bool: True if a node holds the value, False otherwise.
+        """
+        return self.find(value) is not None
+
+    @property
+    def indexed(self):
+        """
+        Checks whether the list keeps a value-to-nodes index.
+
+        Returns:
+            bool: True if the list is indexed, False otherwise.
+        """
+        return self._index is not None
 
     @property
     def head(self):
@@ -137,6 +389,9 @@ class LinkedList():
         """
         Sets the head of the linked list.
 
+        The chain starting at the new head is walked once to find its tail and
+        length, and to rebuild the index of an indexed list.
+
         Args:
             new_node (Node): The new head node, or None.
 
@@ -145,9 +400,30 @@ class LinkedList():
         """
         if new_node is None or isinstance(new_node, Node):
             self._head = new_node
+            self._tail = None
+            self._size = 0
+            if self._index is not None:
+                self._index.clear()
+            current = new_node
+            while current is not None:
+                self._tail = current
+                self._size += 1
+                if self._index is not None:
+                    _index_add(self._index, current._data, current)
+                current = current._next
         else:
             raise TypeError("First node must be None or a Node object.")
 
+    @property
+    def tail(self):
+        """
+        Retrieves the tail of the linked list.
+
+        Returns:
+            Node: The last node of the linked list, or None if the list is empty.
+        """
+        return self._tail
+
     def traversal(self, func=print):
         """
         Traverses the linked list and applies a function to each node's data.
@@ -155,10 +431,8 @@ class LinkedList():
         Args:
             func (callable): The function to apply to each node's data. Defaults to print.
         """
-        current = self.head
-        while current is not None:
-            func(current.data)
-            current = current.next
+        for data in self:
+            func(data)
 
     def insert(self, data):
         """
@@ -167,27 +441,213 @@ class LinkedList():
         Args:
             data (any): The data to insert into the new node.
         """
-        new_node = Node(data, self.head)
-        self.head = new_node
+        new_node = Node(data) if self._pool is None else self._pool.acquire(data)
+        new_node._next = self._head
+        self._head = new_node
+        if self._tail is None:
+            self._tail = self._head
+        self._size += 1
+        if self._index is not None:
+            _index_add(self._index, new_node._data, new_node)
+
+    def append(self, data):
+        """
+        Inserts a new node with the given data at the end of the linked list in O(1).
+
+        Args:
+            data (any): The data to insert into the new node.
+        """
+        new_node = Node(data) if self._pool is None else self._pool.acquire(data)
+        if self._tail is None:
+            self._head = new_node
+        else:
+            self._tail._next = new_node
+        self._tail = new_node
+        self._size += 1
+        if self._index is not None:
+            _index_add(self._index, new_node._data, new_node)
+
+    def extend(self, iterable):
+        """
+        Appends the items of an iterable at the end of the linked list, in order.
+
+        Args:
+            iterable (iterable): The data to append.
+        """
+        tail = self._tail
+        count = 0
+        make_node = Node if self._pool is None else self._pool.acquire
+        index = self._index
+        for data in iterable:
+            new_node = make_node(data)
+            if tail is None:
+                self._head = new_node
+            else:
+                tail._next = new_node
+            tail = new_node
+            count += 1
+            if index is not None:
+                _index_add(index, new_node._data, new_node)
+        self._tail = tail
+        self._size += count
+
+    def pop_head(self):
+        """
+        Removes the first node of the linked list and returns its data.
+
+        Returns:
+            any: The data stored in the removed node.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._head is None:
+            raise IndexError("Pop from an empty list")
+        node = self._head
+        self._head = node._next
+        if self._head is None:
+            self._tail = None
+        node._next = None
+        self._size -= 1
+        if self._index is not None:
+            _index_discard(self._index, node._data, node)
+        data = node._data
+        if self._pool is not None:
+            self._pool.release(node)
+        return data
+
+    def remove(self, value):
+        """
+        Deletes the first node with the specified value.
+
+        The node is found through `find`, so an indexed list rejects a missing
+        value in O(1). Unlinking still walks from the head to the node's
+        predecessor, which is O(n) on a singly linked list unless the node is
+        the head.
+
+        Args:
+            value (any): The value to delete.
+
+        Raises:
+            ValueError: If no node holds the value.
+        """
+        node = self.find(value)
+        if node is None:
+            raise ValueError(f"Node with data {value} not found in the list.")
+        if node is self._head:
+            self._head = node._next
+            previous = None
+        else:
+            previous = self._head
+            while previous._next is not node:
+                previous = previous._next
+            previous._next = node._next
+        if node is self._tail:
+            self._tail = previous
+        node._next = None
+        self._size -= 1
+        if self._index is not None:
+            _index_discard(self._index, node._data, node)
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the list in place with a stable bottom-up merge sort.
+
+        The existing nodes are relinked; no node is allocated or copied.
+
+        Args:
+            key (callable, optional): Function extracting the comparison key from
+                each node's data. Defaults to the data itself.
+            reverse (bool): Whether to sort in descending order. Defaults to False.
+        """
+        self._head, self._tail = _sort_chain(self._head, self._size, Node(None), key, reverse)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merges another sorted linked list into this sorted list in O(n + m).
+
+        Both lists must already be sorted with the same key and order. The nodes
+        of `other` are moved into this list, which leaves `other` empty. The merge
+        is stable: on ties, the nodes of this list come first. When this list is
+        indexed, the moved nodes are added to its index.
+
+        Args:
+            other (LinkedList): The sorted list to merge into this one.
+            key (callable, optional): Function extracting the comparison key from
+                each node's data. Defaults to the data itself.
+            reverse (bool): Whether the lists are sorted in descending order.
+
+        Raises:
+            TypeError: If other is not a LinkedList.
+            ValueError: If other is this list.
+        """
+        if not isinstance(other, LinkedList):
+            raise TypeError("Can only merge another LinkedList")
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        if other._head is None:
+            return
+        if self._index is not None:
+            current = other._head
+            while current is not None:
+                _index_add(self._index, current._data, current)
+                current = current._next
+        if self._head is None:
+            self._head, self._tail = other._head, other._tail
+        else:
+            anchor = Node(None)
+            self._tail = _merge_chains(self._head, other._head, anchor, key, reverse)
+            self._head = anchor._next
+            anchor._next = None
+        self._size += other._size
+        other._head, other._tail, other._size = None, None, 0
+        if other._index is not None:
+            other._index.clear()
 
     def find(self, value):
         """
-        Finds the first node with the specified value and its position in the list.
+        Finds the first node with the specified value.
+
+        An indexed list answers in O(1) when the value is held by a single node;
+        otherwise the list is walked from the head.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            Node | None: The first node holding the value, or None if not found.
+        """
+        if self._index is not None:
+            return _index_first(self._index, self._head, value)
+        current = self._head
+        while current is not None:
+            if current._data == value:
+                return current
+            current = current._next
+        return None
+
+    def index_of(self, value):
+        """
+        Finds the position of the first node with the specified value.
 
         Args:
             value (any): The value to search for.
 
         Returns:
-            tuple: A message and the position of the node if found, otherwise None and -1.
+            int: The position of the node, or -1 if not found.
         """
-        current = self.head
-        index = 0
+        if self._index is not None and value not in self._index:
+            return -1
+        current = self._head
+        position = 0
         while current is not None:
-            if current.data == value:
-                return f"Node with value {current.data} found at position {index}"
-            current = current.next
-            index += 1
-        return None, -1
+            if current._data == value:
+                return position
+            current = current._next
+            position += 1
+        return -1
 
     def is_empty(self):
         """
@@ -196,4 +656,4 @@ class LinkedList():
         Returns:
             bool: True if the list is empty, False otherwise.
         """
-        return self.head is None
+        return self._head is None
@@ -0,0 +1,197 @@
+"""
+min_max_stack.py
+================
+
+This module provides stacks that answer aggregate queries without scanning
+their contents.
+
+Classes:
+    - MinMaxStack: A `Stack` that keeps auxiliary stacks with the running
+      minimum, maximum and (optionally) sum, so `min()`, `max()` and `sum()`
+      run in O(1).
+    - MonotonicStack: A `Stack` whose values stay sorted from bottom to top.
+      Each push pops and returns the values it "resolves", which is the
+      building block for "next greater element" style streaming queries.
+
+Functions:
+    - next_greater: Returns, for each value, the next strictly greater value.
+
+Usage:
+    stack = MinMaxStack(track_sum=True)
+    for value in [5, 2, 8]:
+        stack.push(value)
+    stack.min(), stack.max(), stack.sum()  # Output: (2, 8, 15)
+
+    next_greater([2, 1, 3])  # Output: [3, 3, None]
+"""
+from data_structures.stack_list import Stack
+
+
+class MinMaxStack(Stack):
+    """
+    A stack with O(1) minimum, maximum and running sum queries.
+
+    For every value in the stack, the auxiliary stacks hold the minimum, the
+    maximum and the sum of that value and everything below it, so popping a
+    value restores the previous aggregates exactly.
+    """
+    def __init__(self, track_sum: bool = False) -> None:
+        """
+        Initializes an empty stack.
+
+        Args:
+            track_sum (bool): Whether to keep a running sum. Defaults to False.
+        """
+        super().__init__()
+        self._minimums = []
+        self._maximums = []
+        self._sums = [] if track_sum else None
+
+    def push(self, value: any) -> None:
+        """
+        Adds a value to the top of the stack and updates the aggregates.
+
+        Args:
+            value (any): The element to add to the stack. It must be comparable
+                with the other elements (and addable when the sum is tracked).
+        """
+        if self._stack:
+            minimum, maximum = self._minimums[-1], self._maximums[-1]
+            self._minimums.append(value if value < minimum else minimum)
+            self._maximums.append(value if value > maximum else maximum)
+            if self._sums is not None:
+                self._sums.append(self._sums[-1] + value)
+        else:
+            self._minimums.append(value)
+            self._maximums.append(value)
+            if self._sums is not None:
+                self._sums.append(value)
+        self._stack.append(value)
+
+    def pop(self) -> any:
+        """
+        Removes the value at the top of the stack and returns it.
+
+        Returns:
+            any: The element removed from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        value = super().pop()
+        self._minimums.pop()
+        self._maximums.pop()
+        if self._sums is not None:
+            self._sums.pop()
+        return value
+
+    def min(self) -> any:
+        """
+        Returns the smallest value in the stack in O(1).
+
+        Returns:
+            any: The minimum of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if self.is_empty():
+            raise IndexError("Min of an empty stack.")
+        return self._minimums[-1]
+
+    def max(self) -> any:
+        """
+        Returns the largest value in the stack in O(1).
+
+        Returns:
+            any: The maximum of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if self.is_empty():
+            raise IndexError("Max of an empty stack.")
+        return self._maximums[-1]
+
+    def sum(self) -> any:
+        """
+        Returns the sum of the values in the stack.
+
+        Runs in O(1) when the stack was created with `track_sum=True`, and
+        falls back to summing the stack otherwise.
+
+        Returns:
+            any: The sum of the stack, or 0 if it is empty.
+        """
+        if self._sums is None:
+            return sum(self._stack)
+        return self._sums[-1] if self._sums else 0
+
+
+class MonotonicStack(Stack):
+    """
+    A stack whose values are kept in monotonic order from bottom to top.
+
+    With `decreasing=True` (the default), pushing a value first pops every value
+    strictly smaller than it, so the popped values have found their "next
+    greater element". With `decreasing=False`, every strictly greater value is
+    popped instead ("next smaller element").
+    """
+    def __init__(self, decreasing: bool = True, key: callable = None) -> None:
+        """
+        Initializes an empty monotonic stack.
+
+        Args:
+            decreasing (bool): Keep values non-increasing from bottom to top.
+                Defaults to True.
+            key (callable, optional): Function extracting the comparison key
+                from each value. Defaults to the value itself.
+        """
+        super().__init__()
+        self._decreasing = decreasing
+        self._key = key
+
+    def push(self, value: any) -> list:
+        """
+        Pops the values resolved by `value`, then pushes it.
+
+        Args:
+            value (any): The element to add to the stack.
+
+        Returns:
+            list: The popped values, top of the stack first.
+        """
+        stack = self._stack
+        key = self._key
+        new_key = key(value) if key else value
+        resolved = []
+        if self._decreasing:
+            while stack and (key(stack[-1]) if key else stack[-1]) < new_key:
+                resolved.append(stack.pop())
+        else:
+            while stack and (key(stack[-1]) if key else stack[-1]) > new_key:
+                resolved.append(stack.pop())
+        stack.append(value)
+        return resolved
+
+
+def next_greater(values: any) -> list:
+    """
+    Finds the next strictly greater value to the right of each value.
+
+    Runs in O(n): every value is pushed to and popped from a monotonic stack
+    at most once.
+
+    Args:
+        values (iterable): The values to scan.
+
+    Returns:
+        list: For each value, the next greater value, or None if there is none.
+    """
+    result = []
+    stack = MonotonicStack(key=lambda item: item[1])
+    for index, value in enumerate(values):
+        result.append(None)
+        for resolved_index, _ in stack.push((index, value)):
+            result[resolved_index] = value
+    return result
@@ -0,0 +1,153 @@
+"""
+node_pool.py
+============
+
+This module provides a free-list allocator that recycles the nodes of the
+linked structures.
+
+Queue-like workloads that keep inserting at one end and deleting at the other
+allocate and free one node per operation. A `NodePool` keeps detached nodes on a
+free list instead, so later inserts can reuse them without going through the
+allocator. The pool is capped so a burst of deletes cannot pin an unbounded
+amount of memory.
+
+Classes:
+    - NodePool: A bounded free list of nodes of one class, with usage statistics.
+
+Usage:
+    pool = NodePool(Node, cap=1024)
+    dll = DoubleLinkedList(pool=pool)
+    dll.insert_at_tail(dll.new_node(10))  # Reuses a pooled node when available.
+    dll.delete_from_head()                # Returns the node to the pool.
+    pool.stats()
+"""
+
+
+class NodePool:
+    """
+    A bounded free list of reusable nodes.
+
+    Released nodes must already be unlinked from their neighbours; the pool
+    drops their data so they do not keep it alive. Once the pool holds `cap`
+    nodes, further released nodes are left to the garbage collector.
+
+    Attributes:
+        _node_class (type): The class of the pooled nodes.
+        _cap (int): The maximum number of nodes kept on the free list.
+        _free (list): The free list of nodes.
+    """
+    def __init__(self, node_class: type, cap: int = 1024) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            node_class (type): The class of the pooled nodes. Its constructor must
+                accept the node data as the only required argument.
+            cap (int): The maximum number of nodes kept on the free list. Defaults to 1024.
+
+        Raises:
+            ValueError: If the cap is negative.
+        """
+        if cap < 0:
+            raise ValueError("Pool cap cannot be negative")
+        self._node_class = node_class
+        self._cap = cap
+        self._free = []
+        self._hits = 0
+        self._misses = 0
+        self._released = 0
+        self._discarded = 0
+
+    @property
+    def node_class(self) -> type:
+        """
+        Returns the class of the pooled nodes.
+
+        Returns:
+            type: The node class.
+        """
+        return self._node_class
+
+    @property
+    def cap(self) -> int:
+        """
+        Returns the maximum number of nodes kept on the free list.
+
+        Returns:
+            int: The cap of the pool.
+        """
+        return self._cap
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes currently on the free list.
+
+        Returns:
+            int: The number of pooled nodes.
+        """
+        return len(self._free)
+
+    def acquire(self, data: any) -> any:
+        """
+        Returns a node holding `data`, reusing a pooled node when one is available.
+
+        Args:
+            data (any): The data to store in the node.
+
+        Returns:
+            Node: A detached node holding the data.
+        """
+        if self._free:
+            self._hits += 1
+            node = self._free.pop()
+            node._data = data
+            return node
+        self._misses += 1
+        return self._node_class(data)
+
+    def release(self, node: any) -> None:
+        """
+        Clears the data of a detached node and puts it on the free list if there is room.
+
+        The caller must not use the node afterwards, since it can be handed out
+        again by `acquire`.
+
+        Args:
+            node (Node): The node to recycle. Its links must already be None.
+
+        Raises:
+            TypeError: If the node is not an instance of the pool's node class.
+        """
+        if not isinstance(node, self._node_class):
+            raise TypeError(f"Pool only accepts {self._node_class.__name__} instances")
+        self._released += 1
+        node._data = None
+        if len(self._free) < self._cap:
+            self._free.append(node)
+        else:
+            self._discarded += 1
+
+    def clear(self) -> None:
+        """
+        Drops every pooled node.
+        """
+        self._free.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns usage statistics of the pool.
+
+        Returns:
+            dict: The number of pooled nodes ("size"), the "cap", the number of
+            acquisitions served from the pool ("hits") or by allocating ("misses"),
+            the number of "released" nodes and how many of them were "discarded"
+            because the pool was full.
+        """
+        return {
+            "size": len(self._free),
+            "cap": self._cap,
+            "hits": self._hits,
+            "misses": self._misses,
+            "released": self._released,
+            "discarded": self._discarded,
+        }
@@ -0,0 +1,215 @@
+"""
+persistent_list.py
+==================
+
+This module implements a persistent (immutable) singly linked list, also known
+as a cons list.
+
+A list is a cell holding its first value and a reference to the rest of the
+list, which is itself a list. Cells are never modified, so `prepend` and `tail`
+create or return lists in O(1) that share every other cell with the original.
+Keeping many versions of a history therefore costs one cell per change instead
+of one copy per version.
+
+Every operation walks the list with a loop, never with recursion, so lists of
+any length can be iterated, compared and printed.
+
+Classes:
+    - PersistentList: An immutable singly linked list with O(1) prepend, head,
+      tail and length.
+
+Usage:
+    history = PersistentList.from_iterable([2, 3])
+    version = history.prepend(1)
+    list(version)                    # Output: [1, 2, 3]
+    version.tail is history          # Output: True
+    len(history)                     # Output: 2
+"""
+
+
+class PersistentList:
+    """
+    An immutable singly linked list with structural sharing.
+
+    Attributes:
+        _head (any): The first value of the list, None for the empty list.
+        _tail (PersistentList | None): The rest of the list, None for the empty list.
+        _size (int): The number of values in the list.
+    """
+    __slots__ = ("_head", "_tail", "_size")
+
+    _empty = None
+
+    def __new__(cls) -> 'PersistentList':
+        """
+        Returns the shared empty list.
+
+        Returns:
+            PersistentList: The empty list.
+        """
+        if cls._empty is None:
+            empty = super().__new__(cls)
+            empty._head = None
+            empty._tail = None
+            empty._size = 0
+            cls._empty = empty
+        return cls._empty
+
+    @classmethod
+    def _cons(cls, value: any, rest: 'PersistentList') -> 'PersistentList':
+        """
+        Creates a list made of a value followed by an existing list.
+
+        Args:
+            value (any): The first value of the new list.
+            rest (PersistentList): The list that follows it, shared as is.
+
+        Returns:
+            PersistentList: The new list.
+        """
+        cell = object.__new__(cls)
+        cell._head = value
+        cell._tail = rest
+        cell._size = rest._size + 1
+        return cell
+
+    @classmethod
+    def from_iterable(cls, values: any) -> 'PersistentList':
+        """
+        Builds a list holding the values of an iterable, in order.
+
+        Args:
+            values (iterable): The values of the list.
+
+        Returns:
+            PersistentList: The new list.
+        """
+        result = cls()
+        for value in reversed(list(values)):
+            result = cls._cons(value, result)
+        return result
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._size == 0
+
+    @property
+    def head(self) -> any:
+        """
+        Returns the first value of the list.
+
+        Returns:
+            any: The first value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Empty list has no head")
+        return self._head
+
+    @property
+    def tail(self) -> 'PersistentList':
+        """
+        Returns the list without its first value, sharing all of its cells.
+
+        Returns:
+            PersistentList: The rest of the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Empty list has no tail")
+        return self._tail
+
+    def prepend(self, value: any) -> 'PersistentList':
+        """
+        Returns a new list with a value in front of this one, in O(1).
+
+        This list is left unchanged and becomes the tail of the new list.
+
+        Args:
+            value (any): The value to put first.
+
+        Returns:
+            PersistentList: The new list.
+        """
+        return self._cons(value, self)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Lazily yields the values from first to last.
+
+        Yields:
+            any: Each value of the list.
+        """
+        current = self
+        while current._tail is not None:
+            yield current._head
+            current = current._tail
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares two lists value by value.
+
+        The walk stops as soon as both lists reach a shared cell, so comparing
+        two versions of the same history only visits their differences.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if both lists hold equal values in the same order.
+        """
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        if self._size != other._size:
+            return False
+        left, right = self, other
+        while left is not right:
+            if left._head != right._head:
+                return False
+            left, right = left._tail, right._tail
+        return True
+
+    def __hash__(self) -> int:
+        """
+        Returns a hash of the values, consistent with equality.
+
+        Returns:
+            int: The hash of the list.
+        """
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the list as its values, so unpickling never alters the shared empty list.
+
+        Returns:
+            tuple: The constructor and its arguments.
+        """
+        return (type(self).from_iterable, (list(self),))
+
+    def __repr__(self) -> str:
+        """
+        Returns a detailed string representation of the list.
+
+        Returns:
+            str: A string in the format 'PersistentList([<values>])'.
+        """
+        return f"PersistentList({list(self)!r})"
@@ -66,6 +66,17 @@ class Queue:
             raise IndexError("Peek from an empty queue")
         return self._queue[0]
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the queue as a flat sequence of its values, through `serialization`.
+
+        Returns:
+            tuple: The rebuild function, its arguments and the state of a subclass.
+        """
+        # Imported here, since the serialization module imports this one.
+        from data_structures.serialization import _reduce
+        return _reduce(self)
+
     def is_empty(self) -> bool:
         """Check if the queue is empty.
 
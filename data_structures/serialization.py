@@ -0,0 +1,311 @@
+"""
+serialization.py
+================
+
+This module lets the node-based and list-based structures of this package be
+pickled without recursing through their nodes.
+
+`pickle` saves an object graph by recursing into every node, so a long linked
+list or a deep tree is slow to save, takes a lot of memory and can exceed the
+recursion limit. The structures define `__reduce__` through `_reduce` instead,
+which hands pickle a flat sequence of their values:
+
+- Sequences (LinkedList, DoubleLinkedList, Deque, Stack, Queue) give their
+  values from front to back.
+- A BinaryTree gives its values in level order, plus two bits per node telling
+  whether it has a left and a right child. Array-backed trees are complete, so
+  their bits are omitted.
+
+The values are handed over as a plain list: Stack and Queue give their backing
+list itself and Deque a list copy, so pickle's C code saves them as fast as any
+list. Narrowing ints or floats to an `array` was measured to cost several times
+the pickling time of the list for a size saving under 20%, so it is not done.
+The values are pickled by the outer pickler, so an object held by a structure
+and referenced elsewhere in the pickled graph is still saved once. The options
+of a structure (indexed, finger, array-backed) are kept; node pools are not,
+and restored structures allocate plain nodes.
+
+Subclasses are rebuilt as their own type, and any attributes they add are
+restored as pickle state. `copy.copy` stays shallow: the copy holds the same
+values, in new nodes. `copy.deepcopy` copies the values too.
+
+Functions:
+    - dumps: Pickles a structure to bytes.
+    - loads: Rebuilds a structure from bytes produced by `dumps`.
+
+Usage:
+    data = dumps(linked_list)
+    restored = loads(data)
+    restored = pickle.loads(pickle.dumps(linked_list))   # Same, through __reduce__.
+"""
+import pickle
+
+from data_structures.binary_tree import BinaryTree
+from data_structures.binary_tree import Node as TreeNode
+from data_structures.deque_list import Deque
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.double_linked_list import Node as DoubleNode
+from data_structures.linked_list import LinkedList, _index_add
+from data_structures.queue_list import Queue
+from data_structures.stack_list import Stack
+
+_STRUCTURES = (LinkedList, DoubleLinkedList, Deque, Stack, Queue, BinaryTree)
+
+# The attributes each structure sets up itself; a subclass's other attributes
+# are saved as pickle state.
+_BASE_ATTRIBUTES = {structure: frozenset(vars(structure())) for structure in _STRUCTURES}
+
+INDEXED = 1
+FINGER = 2
+ARRAY_BACKED = 4
+
+# The four child codes packed into each byte of a tree's shape bits.
+_UNPACK_CODES = [bytes((byte & 3, byte >> 2 & 3, byte >> 4 & 3, byte >> 6)) for byte in range(256)]
+
+
+def dumps(structure: any) -> bytes:
+    """
+    Pickles a structure to bytes.
+
+    Args:
+        structure: A LinkedList, DoubleLinkedList, Deque, Stack, Queue or
+            BinaryTree, or an instance of a subclass of one of them.
+
+    Returns:
+        bytes: The pickled structure.
+
+    Raises:
+        TypeError: If the structure is not one of the supported types.
+    """
+    if not isinstance(structure, _STRUCTURES):
+        raise TypeError(f"Cannot serialize {type(structure).__name__}")
+    return pickle.dumps(structure, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads(data: bytes) -> any:
+    """
+    Rebuilds a structure from bytes produced by `dumps`.
+
+    The data is unpickled, so it must come from a trusted source.
+
+    Args:
+        data (bytes): The pickled structure.
+
+    Returns:
+        The rebuilt structure, of the type that was pickled.
+
+    Raises:
+        ValueError: If the data is not a pickled structure.
+    """
+    try:
+        structure = pickle.loads(data)
+    except (pickle.UnpicklingError, EOFError) as error:
+        raise ValueError("Data is not a serialized structure") from error
+    if not isinstance(structure, _STRUCTURES):
+        raise ValueError("Data is not a serialized structure")
+    return structure
+
+
+def _base_type(structure_type: type) -> type | None:
+    """
+    Finds the supported structure a type is or derives from.
+
+    Args:
+        structure_type (type): The type of a structure.
+
+    Returns:
+        type | None: The supported structure, or None if there is none.
+    """
+    for base in _STRUCTURES:
+        if issubclass(structure_type, base):
+            return base
+    return None
+
+
+def _reduce(structure: any) -> tuple:
+    """
+    Implements `__reduce__` for the supported structures and their subclasses.
+
+    Args:
+        structure: The structure to pickle or copy.
+
+    Returns:
+        tuple: `_rebuild`, its arguments and the state of a subclass (or None).
+
+    Raises:
+        TypeError: If the structure is not one of the supported types.
+    """
+    base = _base_type(type(structure))
+    if base is None:
+        raise TypeError(f"Cannot serialize {type(structure).__name__}")
+    flags = 0
+    shape = b""
+    if base is LinkedList or base is DoubleLinkedList:
+        values = list(_chain_values(structure._head))
+        flags |= INDEXED if structure._index is not None else 0
+        if base is DoubleLinkedList and structure._uses_finger:
+            flags |= FINGER
+    elif base is Deque:
+        values = list(structure._deque)
+        flags |= INDEXED if structure._positions is not None else 0
+    elif base is Stack:
+        values = structure._stack
+    elif base is Queue:
+        values = structure._queue
+    else:
+        nodes = list(BinaryTree.iter_bfs(structure))
+        values = [node._value for node in nodes]
+        flags |= INDEXED if structure._index is not None else 0
+        if structure._nodes is not None:
+            flags |= ARRAY_BACKED
+        else:
+            shape = _pack_shape(nodes)
+    # Containers a subclass adds are copied, so that a shallow copy does not
+    # share them with the original while holding its own values.
+    state = {name: value.copy() if type(value) in (list, dict, set) else value
+             for name, value in vars(structure).items() if name not in _BASE_ATTRIBUTES[base]}
+    return _rebuild, (type(structure), flags, values, shape), state or None
+
+
+def _chain_values(head: any):
+    """
+    Yields the data of a chain of list nodes, without going through the
+    iterator of the list, which a subclass may override.
+
+    Args:
+        head (Node | None): The first node of the chain.
+
+    Yields:
+        any: The data of each node.
+    """
+    current = head
+    while current is not None:
+        yield current._data
+        current = current._next
+
+
+def _rebuild(structure_type: type, flags: int, values: list, shape: bytes) -> any:
+    """
+    Rebuilds a structure pickled by `_reduce`.
+
+    The instance is created without calling the constructor of a subclass; the
+    base structure is initialized with the saved options, and pickle then
+    restores the subclass's own attributes.
+
+    Args:
+        structure_type (type): The type of the structure.
+        flags (int): The option flags of the structure.
+        values (list): The values, in the order `_reduce` gave them.
+        shape (bytes): The packed child codes of a linked binary tree.
+
+    Returns:
+        The rebuilt structure.
+
+    Raises:
+        ValueError: If the type is not supported, or the child codes do not
+            describe a tree of the values.
+    """
+    base = _base_type(structure_type)
+    if base is None:
+        raise ValueError(f"Cannot rebuild {structure_type.__name__}")
+    structure = structure_type.__new__(structure_type)
+    if base is LinkedList:
+        LinkedList.__init__(structure, indexed=bool(flags & INDEXED))
+        LinkedList.extend(structure, values)
+    elif base is DoubleLinkedList:
+        DoubleLinkedList.__init__(structure, indexed=bool(flags & INDEXED), finger=bool(flags & FINGER))
+        _link_double_linked_list(structure, values)
+    elif base is Deque:
+        Deque.__init__(structure, indexed=bool(flags & INDEXED))
+        structure._deque.extend(values)
+        if flags & INDEXED:
+            structure._reindex()
+    elif base is Stack:
+        # Copied, since `copy.copy` passes the original's own list.
+        Stack.__init__(structure)
+        structure._stack = list(values)
+    elif base is Queue:
+        Queue.__init__(structure)
+        structure._queue = list(values)
+    else:
+        BinaryTree.__init__(structure, array_backed=bool(flags & ARRAY_BACKED), indexed=bool(flags & INDEXED))
+        _link_binary_tree(structure, values, shape)
+    return structure
+
+
+def _pack_shape(nodes: list) -> bytes:
+    """
+    Packs whether each node has a left (bit 0) and a right (bit 1) child,
+    four nodes per byte, in level order.
+
+    Args:
+        nodes (list): The nodes of a tree in level order.
+
+    Returns:
+        bytes: The packed child codes.
+    """
+    codes = bytes((node._left is not None) | (node._right is not None) << 1 for node in nodes)
+    codes += bytes(-len(codes) % 4)
+    return bytes(first | second << 2 | third << 4 | fourth << 6
+                 for first, second, third, fourth in zip(codes[0::4], codes[1::4], codes[2::4], codes[3::4]))
+
+
+def _link_double_linked_list(dll: DoubleLinkedList, values: list) -> None:
+    """
+    Links the values into an empty doubly linked list.
+
+    Args:
+        dll (DoubleLinkedList): The empty list.
+        values (list): The values from head to tail.
+    """
+    previous = None
+    for value in values:
+        node = DoubleNode(value, None, previous)
+        if previous is None:
+            dll._head = node
+        else:
+            previous._next = node
+        previous = node
+        if dll._index is not None:
+            _index_add(dll._index, value, node)
+    dll._tail = previous
+    dll._size = len(values)
+
+
+def _link_binary_tree(tree: BinaryTree, values: list, shape: bytes) -> None:
+    """
+    Links the level-order values into an empty binary tree.
+
+    Args:
+        tree (BinaryTree): The empty tree.
+        values (list): The values in level order.
+        shape (bytes): The packed child codes, empty for array-backed trees.
+
+    Raises:
+        ValueError: If the child codes do not describe a tree of the values.
+    """
+    if tree._nodes is not None:
+        for value in values:
+            BinaryTree.insert_node(tree, value)
+        return
+    nodes = [TreeNode(value) for value in values]
+    codes = b"".join(map(_UNPACK_CODES.__getitem__, shape))
+    following = 1
+    try:
+        for node, code in zip(nodes, codes):
+            if code & 1:
+                child = nodes[following]
+                node._left, child._parent = child, node
+                following += 1
+            if code & 2:
+                child = nodes[following]
+                node._right, child._parent = child, node
+                following += 1
+    except IndexError:
+        raise ValueError("Serialized tree shape does not match its values") from None
+    if following != max(len(nodes), 1):
+        raise ValueError("Serialized tree shape does not match its values")
+    tree._root = nodes[0] if nodes else None
+    if tree._index is not None:
+        for node in nodes:
+            _index_add(tree._index, node._value, node)
@@ -0,0 +1,392 @@
+"""
+skip_list.py
+============
+
+This module implements an indexable skip list: a sorted linked list in which
+every node also links forward on a random number of express levels.
+
+A node reaches level `k` with probability 2^-k, so searches skip about half of
+the remaining nodes at each level and run in O(log n) expected time. Every
+forward link also stores its width (how many level-0 steps it skips), which
+gives O(log n) access by position and O(log n) rank queries.
+
+Classes:
+    - SkipNode: A node of the skip list, holding its data, forward links and widths.
+    - SkipList: A sorted multiset with search, insert, delete, range iteration,
+      positional access and bulk building from sorted input.
+
+Usage:
+    skip_list = SkipList.from_sorted([1, 3, 5, 7])
+    skip_list.insert(4)
+    4 in skip_list                   # Output: True
+    skip_list[2]                     # Output: 4
+    skip_list.rank(5)                # Output: 3
+    list(skip_list.range(3, 7))      # Output: [3, 4, 5]
+"""
+import random
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """
+    Represents a node of a skip list.
+
+    Attributes:
+        data (any): The data stored in the node.
+        _next (list): The forward link of each level, None at the end of a level.
+        _width (list): How many level-0 steps each forward link skips.
+    """
+    __slots__ = ("_data", "_next", "_width")
+
+    def __init__(self, data: any, level: int) -> None:
+        """
+        Initializes a detached node.
+
+        Args:
+            data (any): The data to store in the node.
+            level (int): The number of levels the node takes part in.
+        """
+        self._data = data
+        self._next = [None] * level
+        self._width = [1] * level
+
+    @property
+    def data(self) -> any:
+        """
+        Retrieves the data stored in the node.
+
+        Returns:
+            any: The data stored in the node.
+        """
+        return self._data
+
+    @property
+    def next(self) -> 'SkipNode | None':
+        """
+        Retrieves the next node on the bottom level.
+
+        Returns:
+            SkipNode | None: The following node, or None if this is the last one.
+        """
+        return self._next[0]
+
+    @property
+    def level(self) -> int:
+        """
+        Returns the number of levels the node takes part in.
+
+        Returns:
+            int: The height of the node.
+        """
+        return len(self._next)
+
+    def __repr__(self) -> str:
+        return f"SkipNode(data={self._data}, level={len(self._next)})"
+
+
+class SkipList:
+    """
+    A sorted multiset backed by an indexable skip list.
+
+    Equal values are kept in insertion order. Values must be mutually comparable.
+
+    Attributes:
+        _head (SkipNode): A sentinel node that takes part in every level.
+        _level (int): The number of levels currently in use.
+        _size (int): The number of values in the list.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Initializes an empty skip list.
+
+        Args:
+            seed (int, optional): Seed for the random levels, for reproducible layouts.
+        """
+        self._random = random.Random(seed)
+        self._head = SkipNode(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+    @classmethod
+    def from_sorted(cls, values: any, seed: int | None = None) -> 'SkipList':
+        """
+        Builds a skip list from sorted values in O(n).
+
+        Args:
+            values (iterable): The values in non-decreasing order.
+            seed (int, optional): Seed for the random levels.
+
+        Returns:
+            SkipList: A skip list holding the values.
+
+        Raises:
+            ValueError: If the values are not sorted.
+        """
+        skip_list = cls(seed)
+        head = skip_list._head
+        last = [head] * MAX_LEVEL
+        last_position = [0] * MAX_LEVEL
+        position = 0
+        previous = None
+        for value in values:
+            if position and value < previous:
+                raise ValueError("Values must be sorted")
+            previous = value
+            position += 1
+            level = skip_list._random_level()
+            node = SkipNode(value, level)
+            for index in range(level):
+                last[index]._next[index] = node
+                last[index]._width[index] = position - last_position[index]
+                last[index] = node
+                last_position[index] = position
+            skip_list._level = max(skip_list._level, level)
+        for index in range(skip_list._level):
+            last[index]._width[index] = position + 1 - last_position[index]
+        skip_list._size = position
+        return skip_list
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the skip list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._size == 0
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of values in the skip list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the skip list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Lazily yields the values in sorted order.
+
+        Yields:
+            any: Each value of the list.
+        """
+        node = self._head._next[0]
+        while node is not None:
+            yield node._data
+            node = node._next[0]
+
+    def __contains__(self, value: any) -> bool:
+        """
+        Checks whether a value is in the skip list in O(log n).
+
+        Returns:
+            bool: True if the value is found, False otherwise.
+        """
+        return self.find(value) is not None
+
+    def __getitem__(self, position: int) -> any:
+        """
+        Returns the value at a position in sorted order in O(log n).
+
+        Args:
+            position (int): The position of the value. Negative positions count
+                from the end.
+
+        Returns:
+            any: The value at the position.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0:
+            position += self._size
+        if position < 0 or position >= self._size:
+            raise IndexError("Skip list index out of range")
+        return self._node_at(position)._data
+
+    def find(self, value: any) -> SkipNode | None:
+        """
+        Finds the first node holding a value in O(log n).
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            SkipNode | None: The node holding the value, or None if not found.
+        """
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node._next[level]
+            while following is not None and following._data < value:
+                node = following
+                following = node._next[level]
+        node = node._next[0]
+        if node is not None and node._data == value:
+            return node
+        return None
+
+    def rank(self, value: any) -> int:
+        """
+        Counts the values strictly smaller than a value in O(log n).
+
+        This is also the position the value has, or would have, in the list.
+
+        Args:
+            value (any): The value to rank.
+
+        Returns:
+            int: The number of smaller values.
+        """
+        node = self._head
+        position = 0
+        for level in range(self._level - 1, -1, -1):
+            following = node._next[level]
+            while following is not None and following._data < value:
+                position += node._width[level]
+                node = following
+                following = node._next[level]
+        return position
+
+    def insert(self, value: any) -> None:
+        """
+        Inserts a value in O(log n) expected time, after any equal values.
+
+        Args:
+            value (any): The value to insert.
+        """
+        chain = [None] * MAX_LEVEL
+        steps = [0] * MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node._next[level]
+            while following is not None and not value < following._data:
+                steps[level] += node._width[level]
+                node = following
+                following = node._next[level]
+            chain[level] = node
+
+        new_level = self._random_level()
+        for level in range(self._level, new_level):
+            chain[level] = self._head
+            self._head._next[level] = None
+            self._head._width[level] = self._size + 1
+        self._level = max(self._level, new_level)
+
+        new_node = SkipNode(value, new_level)
+        skipped = 0
+        for level in range(new_level):
+            previous = chain[level]
+            new_node._next[level] = previous._next[level]
+            previous._next[level] = new_node
+            new_node._width[level] = previous._width[level] - skipped
+            previous._width[level] = skipped + 1
+            skipped += steps[level]
+        for level in range(new_level, self._level):
+            chain[level]._width[level] += 1
+        self._size += 1
+
+    def delete(self, value: any) -> None:
+        """
+        Deletes the first occurrence of a value in O(log n) expected time.
+
+        Args:
+            value (any): The value to delete.
+
+        Raises:
+            ValueError: If the value is not in the list.
+        """
+        chain = [None] * self._level
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            following = node._next[level]
+            while following is not None and following._data < value:
+                node = following
+                following = node._next[level]
+            chain[level] = node
+
+        target = chain[0]._next[0]
+        if target is None or target._data != value:
+            raise ValueError(f"Value {value} not found in the skip list.")
+        for level in range(len(target._next)):
+            previous = chain[level]
+            previous._width[level] += target._width[level] - 1
+            previous._next[level] = target._next[level]
+        for level in range(len(target._next), self._level):
+            chain[level]._width[level] -= 1
+        while self._level > 1 and self._head._next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+
+    def range(self, start: any = None, stop: any = None):
+        """
+        Lazily yields the values v with start <= v < stop, in sorted order.
+
+        Finding the first value takes O(log n); each following value is one step.
+
+        Args:
+            start (any, optional): The inclusive lower bound. Defaults to the smallest value.
+            stop (any, optional): The exclusive upper bound. Defaults to no bound.
+
+        Yields:
+            any: Each value in the range.
+        """
+        node = self._head
+        if start is not None:
+            for level in range(self._level - 1, -1, -1):
+                following = node._next[level]
+                while following is not None and following._data < start:
+                    node = following
+                    following = node._next[level]
+        node = node._next[0]
+        while node is not None and (stop is None or node._data < stop):
+            yield node._data
+            node = node._next[0]
+
+    def clear(self) -> None:
+        """
+        Removes every value from the skip list.
+        """
+        self._head = SkipNode(None, MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+    def _node_at(self, position: int) -> SkipNode:
+        """
+        Finds the node at a valid position by following the link widths.
+
+        Args:
+            position (int): The position of the node, between 0 and size - 1.
+
+        Returns:
+            SkipNode: The node at the position.
+        """
+        node = self._head
+        remaining = position + 1
+        for level in range(self._level - 1, -1, -1):
+            while node._next[level] is not None and node._width[level] <= remaining:
+                remaining -= node._width[level]
+                node = node._next[level]
+        return node
+
+    def _random_level(self) -> int:
+        """
+        Draws the height of a new node: level k with probability 2^-k.
+
+        Returns:
+            int: A level between 1 and MAX_LEVEL.
+        """
+        bits = self._random.getrandbits(MAX_LEVEL)
+        return (bits & -bits).bit_length() or MAX_LEVEL
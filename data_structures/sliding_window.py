@@ -0,0 +1,275 @@
+"""
+sliding_window.py
+=================
+
+This module provides streaming aggregates (minimum, maximum, sum and mean) over
+a sliding window of values, built on top of the `Deque` class.
+
+The minimum and maximum are tracked with monotonic deques, so every value is
+appended and removed at most once and each query runs in O(1). The sum and the
+mean are kept as running totals that are updated when values enter or leave
+the window.
+
+Two kinds of windows are supported:
+    - Count-based windows keep the last `size` values.
+    - Time-based windows keep the values pushed during the last `duration`
+      seconds (or any other unit, as long as timestamps are consistent).
+
+Classes:
+    - SlidingWindow: Represents the window and provides methods for pushing
+      values and querying its aggregates.
+
+Usage:
+    window = SlidingWindow(size=3)
+    window.push_many([4, 1, 7, 3])
+    window.min()   # Output: 1
+    window.max()   # Output: 7
+    window.mean()  # Output: 3.666...
+"""
+import time
+
+from data_structures.deque_list import Deque
+
+
+class SlidingWindow:
+    """
+    Streaming min/max/sum/mean aggregates over a count-based or time-based window.
+
+    Attributes:
+        _size (int | None): Maximum number of values kept by a count-based window.
+        _duration (float | None): Time span covered by a time-based window.
+        _window (Deque): The (timestamp, value) pairs currently inside the window.
+        _minimums (Deque): (sequence, value) pairs with increasing values.
+        _maximums (Deque): (sequence, value) pairs with decreasing values.
+        _sum (any): Running sum of the values inside the window.
+    """
+    def __init__(self, size: int | None = None, duration: float | None = None) -> None:
+        """
+        Initializes an empty sliding window.
+
+        Exactly one of `size` or `duration` must be given.
+
+        Args:
+            size (int, optional): Number of most recent values kept in the window.
+            duration (float, optional): Time span of the values kept in the window.
+
+        Raises:
+            ValueError: If both or none of size and duration are given, or if
+                the given one is not positive.
+        """
+        if (size is None) == (duration is None):
+            raise ValueError("Exactly one of size or duration must be given")
+        if size is not None and size <= 0:
+            raise ValueError("Window size must be positive")
+        if duration is not None and duration <= 0:
+            raise ValueError("Window duration must be positive")
+        self._size = size
+        self._duration = duration
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Removes every value from the window.
+        """
+        self._window = Deque()
+        self._minimums = Deque()
+        self._maximums = Deque()
+        self._sum = 0
+        self._pushed = 0
+        self._evicted = 0
+        self._last_timestamp = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values currently inside the window.
+
+        Returns:
+            int: The number of values in the window.
+        """
+        return self._window.size()
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the window is empty.
+
+        Returns:
+            bool: True if the window holds no values, False otherwise.
+        """
+        return self._window.is_empty()
+
+    def push(self, value: any, timestamp: float | None = None) -> None:
+        """
+        Adds a value to the window and evicts the values that fall out of it.
+
+        For time-based windows the timestamp defaults to `time.monotonic()`.
+        Count-based windows ignore the timestamp.
+
+        Args:
+            value (any): The value to add. It must support comparison and addition.
+            timestamp (float, optional): The time at which the value was observed.
+
+        Raises:
+            ValueError: If the timestamp is older than the previous one.
+        """
+        if self._duration is not None:
+            if timestamp is None:
+                timestamp = time.monotonic()
+            if self._last_timestamp is not None and timestamp < self._last_timestamp:
+                raise ValueError("Timestamps must be non-decreasing")
+            self._last_timestamp = timestamp
+
+        sequence = self._pushed
+        self._pushed += 1
+        self._window.append((timestamp, value))
+        self._sum += value
+
+        minimums = self._minimums
+        while not minimums.is_empty() and minimums.peek_right()[1] > value:
+            minimums.pop()
+        minimums.append((sequence, value))
+
+        maximums = self._maximums
+        while not maximums.is_empty() and maximums.peek_right()[1] < value:
+            maximums.pop()
+        maximums.append((sequence, value))
+
+        self._evict(timestamp)
+
+    def push_many(self, values: any, timestamps: any = None) -> None:
+        """
+        Adds a batch of values to the window.
+
+        NumPy arrays (or any object with a `tolist` method) are converted to
+        Python scalars in a single call instead of one element at a time. For
+        count-based windows only the last `size` values of a large batch can
+        stay in the window, so the older ones are skipped entirely.
+
+        Args:
+            values (iterable): The values to add, oldest first.
+            timestamps (iterable, optional): One timestamp per value.
+
+        Raises:
+            ValueError: If values and timestamps have different lengths, or if
+                the timestamps are not non-decreasing.
+        """
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        push = self.push
+        if timestamps is None:
+            if self._size is not None and len(values) >= self._size:
+                self.clear()
+                values = values[-self._size:]
+            for value in values:
+                push(value)
+            return
+
+        timestamps = timestamps.tolist() if hasattr(timestamps, "tolist") else list(timestamps)
+        if len(values) != len(timestamps):
+            raise ValueError("values and timestamps must have the same length")
+        for value, timestamp in zip(values, timestamps):
+            push(value, timestamp)
+
+    def expire(self, timestamp: float | None = None) -> None:
+        """
+        Evicts the values of a time-based window that are older than `duration`.
+
+        Values are only evicted when new ones are pushed; call this method to
+        age out the window while the stream is idle.
+
+        Args:
+            timestamp (float, optional): The current time. Defaults to `time.monotonic()`.
+
+        Raises:
+            ValueError: If the window is count-based or the timestamp goes backwards.
+        """
+        if self._duration is None:
+            raise ValueError("Only time-based windows can expire values")
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._last_timestamp is not None and timestamp < self._last_timestamp:
+            raise ValueError("Timestamps must be non-decreasing")
+        self._last_timestamp = timestamp
+        self._evict(timestamp)
+
+    def _evict(self, now: float | None) -> None:
+        """
+        Removes the values that no longer belong to the window.
+
+        Args:
+            now (float | None): The timestamp of the latest value.
+        """
+        window = self._window
+        if self._size is not None:
+            while window.size() > self._size:
+                self._pop_oldest()
+        else:
+            cutoff = now - self._duration
+            while not window.is_empty() and window.peek_left()[0] <= cutoff:
+                self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        """
+        Removes the oldest value from the window and from the monotonic deques.
+        """
+        _, value = self._window.pop_left()
+        sequence = self._evicted
+        self._evicted += 1
+        if self._window.is_empty():
+            # Reset instead of subtracting so float rounding errors do not accumulate.
+            self._sum = 0
+        else:
+            self._sum -= value
+        if self._minimums.peek_left()[0] == sequence:
+            self._minimums.pop_left()
+        if self._maximums.peek_left()[0] == sequence:
+            self._maximums.pop_left()
+
+    def min(self) -> any:
+        """
+        Returns the smallest value inside the window in O(1).
+
+        Returns:
+            any: The minimum of the window.
+
+        Raises:
+            IndexError: If the window is empty.
+        """
+        if self._minimums.is_empty():
+            raise IndexError("Min of an empty window")
+        return self._minimums.peek_left()[1]
+
+    def max(self) -> any:
+        """
+        Returns the largest value inside the window in O(1).
+
+        Returns:
+            any: The maximum of the window.
+
+        Raises:
+            IndexError: If the window is empty.
+        """
+        if self._maximums.is_empty():
+            raise IndexError("Max of an empty window")
+        return self._maximums.peek_left()[1]
+
+    def sum(self) -> any:
+        """
+        Returns the sum of the values inside the window in O(1).
+
+        Returns:
+            any: The running sum, or 0 if the window is empty.
+        """
+        return self._sum
+
+    def mean(self) -> float:
+        """
+        Returns the mean of the values inside the window in O(1).
+
+        Returns:
+            float: The average of the window.
+
+        Raises:
+            IndexError: If the window is empty.
+        """
+        if self._window.is_empty():
+            raise IndexError("Mean of an empty window")
+        return self._sum / self._window.size()
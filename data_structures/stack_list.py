@@ -40,6 +40,17 @@ class Stack:
             raise IndexError("Peek from an empty stack.")
         return self._stack[-1]
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the stack as a flat sequence of its values, through `serialization`.
+
+        Returns:
+            tuple: The rebuild function, its arguments and the state of a subclass.
+        """
+        # Imported here, since the serialization module imports this one.
+        from data_structures.serialization import _reduce
+        return _reduce(self)
+
     def is_empty(self) -> bool:
         """
         Check if the stack is empty.
@@ -0,0 +1,338 @@
+"""
+typed_stack.py
+==============
+
+This module provides a stack of machine-typed numbers stored in one contiguous,
+growable buffer instead of a list of boxed Python objects.
+
+The buffer is an `array.array`, so a float stack uses 8 bytes per value instead
+of a list slot plus a float object. The buffer doubles its capacity when full;
+growing allocates a new buffer, so views handed out earlier stay valid and keep
+pointing at the old one.
+
+Classes:
+    - TypedStack: A stack with batch push/pop, zero-copy views of its top
+      values and support for the buffer protocol.
+
+Usage:
+    stack = TypedStack('d')
+    stack.push_many([1.0, 2.0, 3.0])
+    stack.peek_n(2).tolist()  # Output: [2.0, 3.0]
+    stack.pop()               # Output: 3.0
+
+    # Any library that understands the buffer protocol can read the stack
+    # without copying it, e.g. numpy.frombuffer(stack.view(), dtype=float).
+"""
+from array import array
+
+
+class TypedStack:
+    """
+    A stack of typed numbers backed by a growable `array.array` buffer.
+
+    Attributes:
+        _typecode (str): The `array` type code of the stored values.
+        _buffer (array): The storage; only the first `_size` slots are in use.
+        _size (int): The number of values in the stack.
+    """
+    def __init__(self, typecode: str = 'd', capacity: int = 16) -> None:
+        """
+        Initializes an empty typed stack.
+
+        Args:
+            typecode (str): An `array` type code such as 'd' (float) or 'q' (int64).
+                Defaults to 'd'.
+            capacity (int): The initial number of slots. Defaults to 16.
+
+        Raises:
+            ValueError: If the type code is not valid or the capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("Capacity cannot be negative")
+        self._typecode = typecode
+        self._buffer = self._allocate(max(capacity, 1))
+        self._size = 0
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns the `array` type code of the stored values.
+
+        Returns:
+            str: The type code.
+        """
+        return self._typecode
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the number of slots allocated in the buffer.
+
+        Returns:
+            int: The capacity of the stack.
+        """
+        return len(self._buffer)
+
+    def push(self, value: int | float) -> None:
+        """
+        Adds a value to the top of the stack.
+
+        Args:
+            value (int | float): The value to add.
+
+        Raises:
+            TypeError: If the value does not match the type code.
+            OverflowError: If the value does not fit in the type code.
+        """
+        if self._size == len(self._buffer):
+            self._reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def push_many(self, values: any) -> None:
+        """
+        Adds several values to the top of the stack, the last one ending on top.
+
+        Arrays with the same type code, and contiguous buffers (such as NumPy
+        arrays) with the same layout, are copied in one block.
+
+        Args:
+            values (iterable): The values to add.
+        """
+        chunk = self._as_array(values)
+        count = len(chunk)
+        end = self._size + count
+        if end > len(self._buffer):
+            self._reserve(end)
+        self._buffer[self._size:end] = chunk
+        self._size = end
+
+    def pop(self) -> int | float:
+        """
+        Removes the value at the top of the stack and returns it.
+
+        Returns:
+            int | float: The value removed from the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Pop from an empty stack.")
+        self._size -= 1
+        return self._buffer[self._size]
+
+    def pop_many(self, count: int) -> array:
+        """
+        Removes the top `count` values and returns them in push order.
+
+        Args:
+            count (int): How many values to remove.
+
+        Returns:
+            array: A copy of the removed values, the former top value last.
+
+        Raises:
+            ValueError: If count is negative.
+            IndexError: If the stack holds fewer than count values.
+        """
+        start = self._top_slice(count)
+        values = self._buffer[start:self._size]
+        self._size = start
+        return values
+
+    def peek(self) -> int | float:
+        """
+        Returns the value at the top of the stack without removing it.
+
+        Returns:
+            int | float: The value at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Peek from an empty stack.")
+        return self._buffer[self._size - 1]
+
+    def peek_n(self, count: int) -> memoryview:
+        """
+        Returns a read-only view of the top `count` values without copying them.
+
+        The view shares memory with the stack: popping and pushing again writes
+        over the slots it shows. Take a copy (e.g. with `tolist()`) to keep the
+        values.
+
+        Args:
+            count (int): How many values to view.
+
+        Returns:
+            memoryview: The top values in push order, the top value last.
+
+        Raises:
+            ValueError: If count is negative.
+            IndexError: If the stack holds fewer than count values.
+        """
+        start = self._top_slice(count)
+        return memoryview(self._buffer)[start:self._size].toreadonly()
+
+    def view(self) -> memoryview:
+        """
+        Returns a read-only view of the whole stack, bottom value first.
+
+        This is the same view exposed through the buffer protocol, for Python
+        versions that do not support `__buffer__`.
+
+        Returns:
+            memoryview: The values currently in the stack.
+        """
+        return memoryview(self._buffer)[:self._size].toreadonly()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the stack contents through the buffer protocol (Python 3.12+).
+
+        Args:
+            flags (int): The requested buffer flags.
+
+        Returns:
+            memoryview: A read-only view of the values in the stack.
+        """
+        return self.view()
+
+    def is_empty(self) -> bool:
+        """
+        Check if the stack is empty.
+
+        Returns:
+            bool: True if the stack is empty, False otherwise.
+        """
+        return self._size == 0
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the stack.
+
+        Returns:
+            int: The size of the stack.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the stack.
+
+        Returns:
+            int: The size of the stack.
+        """
+        return self._size
+
+    def _allocate(self, capacity: int) -> array:
+        """
+        Allocates a zero-filled buffer.
+
+        Args:
+            capacity (int): The number of slots.
+
+        Returns:
+            array: The new buffer.
+        """
+        itemsize = array(self._typecode).itemsize
+        return array(self._typecode, bytes(itemsize * capacity))
+
+    def _reserve(self, needed: int) -> None:
+        """
+        Grows the buffer, at least doubling it, so it holds `needed` values.
+
+        Args:
+            needed (int): The minimum number of slots required.
+        """
+        capacity = max(needed, 2 * len(self._buffer))
+        buffer = self._allocate(capacity)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def _as_array(self, values: any) -> array:
+        """
+        Converts a batch of values to an array with the stack's type code.
+
+        Args:
+            values (iterable): The values to convert.
+
+        Returns:
+            array: The values as an array.
+        """
+        if isinstance(values, array) and values.typecode == self._typecode:
+            return values
+        chunk = self._from_buffer(values)
+        if chunk is not None:
+            return chunk
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+        return array(self._typecode, values)
+
+    def _from_buffer(self, values: any) -> array | None:
+        """
+        Copies a contiguous buffer of values laid out like the stack's own in one block.
+
+        The layouts match when both are signed integers, both unsigned integers
+        or both floats, of the same native size. The format code itself may
+        differ: NumPy int64 and array('l') export 'l', which matches 'q' on
+        platforms where a C long has 8 bytes.
+
+        Args:
+            values (any): The values to convert.
+
+        Returns:
+            array | None: The values as an array, or None if they are not such a buffer.
+        """
+        try:
+            view = memoryview(values)
+        except TypeError:
+            return None
+        code = view.format.lstrip("@")
+        if (len(code) != 1 or _kind(code) is None or _kind(code) != _kind(self._typecode)
+                or view.itemsize != self._buffer.itemsize or view.ndim != 1 or not view.c_contiguous):
+            return None
+        chunk = array(self._typecode)
+        chunk.frombytes(view.cast("B"))
+        return chunk
+
+    def _top_slice(self, count: int) -> int:
+        """
+        Validates a batch size and returns the index where the top `count` values start.
+
+        Args:
+            count (int): How many values from the top.
+
+        Returns:
+            int: The index of the lowest of those values.
+
+        Raises:
+            ValueError: If count is negative.
+            IndexError: If the stack holds fewer than count values.
+        """
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+        if count > self._size:
+            raise IndexError(f"Cannot take {count} values from a stack of size {self._size}.")
+        return self._size - count
+
+
+def _kind(code: str) -> str | None:
+    """
+    Classifies a native format code as a signed integer, unsigned integer or float.
+
+    Args:
+        code (str): A `struct` or `array` format code.
+
+    Returns:
+        str | None: 'i', 'u' or 'f', or None for any other code.
+    """
+    if code in "bhilqn":
+        return "i"
+    if code in "BHILQN":
+        return "u"
+    if code in "fd":
+        return "f"
+    return None
@@ -0,0 +1,512 @@
+"""
+unrolled_linked_list.py
+=======================
+
+This module implements an unrolled doubly linked list: a doubly linked list of
+blocks in which every block holds a small array of up to `capacity` values.
+
+Compared with one node per value, an unrolled list chases one pointer per block,
+keeps neighbouring values next to each other in memory, and lets searches and
+traversals run over each block's array with the built-in list methods.
+
+Blocks are split in half when an insert overflows them. When a delete leaves a
+block less than half full, it borrows a value from the next block or merges
+with it, so positional operations walk O(n / capacity) blocks.
+
+Classes:
+    - Block: A node of the unrolled list, holding a list of values.
+    - UnrolledLinkedList: Provides the find/insert/delete-at-position/traversal
+      API of `DoubleLinkedList`, working with values instead of nodes.
+
+Usage:
+    unrolled = UnrolledLinkedList(capacity=4)
+    for value in range(10):
+        unrolled.insert_at_tail(value)
+    unrolled.insert_at_position(99, 5)
+    unrolled.find(99)                # Output: 5
+    unrolled.traversal_forward()[:6] # Output: [0, 1, 2, 3, 4, 99]
+"""
+
+
+class Block:
+    """
+    Represents a block of an unrolled linked list.
+
+    Attributes:
+        items (list): The values stored in the block, in list order.
+        next (Block): The next block in the list, or None.
+        previous (Block): The previous block in the list, or None.
+    """
+    __slots__ = ("_items", "_next", "_previous")
+
+    def __init__(self, items: list | None = None) -> None:
+        """
+        Initializes a detached block.
+
+        Args:
+            items (list, optional): The initial values of the block. Defaults to an empty list.
+        """
+        self._items = items if items is not None else []
+        self._next = None
+        self._previous = None
+
+    @property
+    def items(self) -> list:
+        """
+        Retrieves the values stored in the block.
+
+        Returns:
+            list: The values of the block.
+        """
+        return self._items
+
+    @property
+    def next(self) -> 'Block | None':
+        """
+        Retrieves the next block.
+
+        Returns:
+            Block | None: The next block, or None if this is the last one.
+        """
+        return self._next
+
+    @property
+    def previous(self) -> 'Block | None':
+        """
+        Retrieves the previous block.
+
+        Returns:
+            Block | None: The previous block, or None if this is the first one.
+        """
+        return self._previous
+
+
+class UnrolledLinkedList:
+    """
+    A doubly linked list of fixed-capacity blocks of values.
+
+    Attributes:
+        _head (Block | None): The first block of the list.
+        _tail (Block | None): The last block of the list.
+        _size (int): The number of values in the list.
+        _capacity (int): The maximum number of values per block.
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        """
+        Initializes an empty unrolled linked list.
+
+        Args:
+            capacity (int): The maximum number of values per block. Defaults to 32.
+
+        Raises:
+            ValueError: If the capacity is smaller than 2.
+        """
+        if capacity < 2:
+            raise ValueError("Block capacity must be at least 2")
+        self._capacity = capacity
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._size == 0
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the maximum number of values per block.
+
+        Returns:
+            int: The block capacity.
+        """
+        return self._capacity
+
+    @property
+    def head(self) -> Block | None:
+        """
+        Returns the first block of the list.
+
+        Returns:
+            Block | None: The head block, or None if the list is empty.
+        """
+        return self._head
+
+    @property
+    def tail(self) -> Block | None:
+        """
+        Returns the last block of the list.
+
+        Returns:
+            Block | None: The tail block, or None if the list is empty.
+        """
+        return self._tail
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the list.
+
+        Returns:
+            int: The size of the list.
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Lazily yields the values from head to tail.
+
+        Yields:
+            any: Each value of the list.
+        """
+        block = self._head
+        while block is not None:
+            yield from block._items
+            block = block._next
+
+    def __reversed__(self):
+        """
+        Lazily yields the values from tail to head.
+
+        Yields:
+            any: Each value of the list.
+        """
+        block = self._tail
+        while block is not None:
+            yield from reversed(block._items)
+            block = block._previous
+
+    def __getitem__(self, position: int) -> any:
+        """
+        Returns the value at a position.
+
+        Args:
+            position (int): The position of the value.
+
+        Returns:
+            any: The value at the position.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position out of bounds, must be between 0 and {self._size - 1}")
+        block, offset = self._locate(position)
+        return block._items[offset]
+
+    def insert_at_head(self, value: any) -> None:
+        """
+        Inserts a value at the beginning of the list.
+
+        Args:
+            value (any): The value to be inserted.
+        """
+        if self._head is None or len(self._head._items) >= self._capacity:
+            self._link_before(Block([value]), self._head)
+        else:
+            self._head._items.insert(0, value)
+        self._size += 1
+
+    def insert_at_tail(self, value: any) -> None:
+        """
+        Inserts a value at the end of the list.
+
+        A new block is started when the tail block is full, so lists built by
+        appending keep their blocks completely full.
+
+        Args:
+            value (any): The value to be inserted.
+        """
+        if self._tail is None or len(self._tail._items) >= self._capacity:
+            self._link_after(Block([value]), self._tail)
+        else:
+            self._tail._items.append(value)
+        self._size += 1
+
+    def insert_at_position(self, value: any, position: int) -> None:
+        """
+        Inserts a value at a specific position in the list.
+
+        Args:
+            value (any): The value to be inserted.
+            position (int): The position where the value should be inserted.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if position < 0 or position > self._size:
+            raise IndexError("Position must be a valid index")
+        if position == self._size:
+            self.insert_at_tail(value)
+            return
+        block, offset = self._locate(position)
+        items = block._items
+        if len(items) >= self._capacity:
+            half = len(items) // 2
+            new_block = Block(items[half:])
+            del items[half:]
+            self._link_after(new_block, block)
+            if offset > half:
+                block, offset = new_block, offset - half
+        block._items.insert(offset, value)
+        self._size += 1
+
+    def delete_from_head(self) -> any:
+        """
+        Deletes the value at the beginning of the list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+        return self._delete(self._head, 0)
+
+    def delete_from_tail(self) -> any:
+        """
+        Deletes the value at the end of the list.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+        return self._delete(self._tail, len(self._tail._items) - 1)
+
+    def delete_from_position(self, position: int) -> any:
+        """
+        Deletes the value at a specific position.
+
+        Args:
+            position (int): The position of the value to be deleted.
+
+        Returns:
+            any: The deleted value.
+
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot delete from an empty list")
+        if position < 0 or position >= self._size:
+            raise IndexError(f"Position out of bounds, must be between 0 and {self._size - 1}")
+        block, offset = self._locate(position)
+        return self._delete(block, offset)
+
+    def find(self, value: any) -> int | None:
+        """
+        Finds the position of the first occurrence of a value.
+
+        Each block is searched with `list.index`, so the scan runs over
+        contiguous arrays instead of one node at a time.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            int | None: The position of the value, or None if not found.
+        """
+        block, offset = self._find(value)
+        if block is None:
+            return None
+        position = offset
+        block = block._previous
+        while block is not None:
+            position += len(block._items)
+            block = block._previous
+        return position
+
+    def update_node(self, old_data: any, new_data: any) -> None:
+        """
+        Replaces the first occurrence of a value.
+
+        Args:
+            old_data (any): The value to search for.
+            new_data (any): The value that replaces it.
+
+        Raises:
+            IndexError: If the list is empty.
+            ValueError: If the value is not found.
+        """
+        if self.is_empty():
+            raise IndexError("Cannot update empty list.")
+        block, offset = self._find(old_data)
+        if block is None:
+            raise ValueError(f"Node with data {old_data} not found in the list.")
+        block._items[offset] = new_data
+
+    def traversal_forward(self) -> list:
+        """
+        Returns the values of the list from head to tail.
+
+        Returns:
+            list: The values from head to tail.
+        """
+        result = []
+        block = self._head
+        while block is not None:
+            result.extend(block._items)
+            block = block._next
+        return result
+
+    def traversal_backward(self) -> list:
+        """
+        Returns the values of the list from tail to head.
+
+        Returns:
+            list: The values from tail to head.
+        """
+        result = []
+        block = self._tail
+        while block is not None:
+            result.extend(reversed(block._items))
+            block = block._previous
+        return result
+
+    def clear(self) -> None:
+        """
+        Clears all values from the list.
+        """
+        self._head, self._tail = None, None
+        self._size = 0
+
+    def _locate(self, position: int) -> tuple[Block, int]:
+        """
+        Finds the block holding a position, walking from the closer end.
+
+        Args:
+            position (int): A valid position in the list.
+
+        Returns:
+            tuple[Block, int]: The block and the offset of the position inside it.
+        """
+        if position < self._size // 2:
+            block = self._head
+            while position >= len(block._items):
+                position -= len(block._items)
+                block = block._next
+            return block, position
+        remaining = self._size - position
+        block = self._tail
+        while remaining > len(block._items):
+            remaining -= len(block._items)
+            block = block._previous
+        return block, len(block._items) - remaining
+
+    def _find(self, value: any) -> tuple[Block | None, int]:
+        """
+        Finds the block and offset of the first occurrence of a value.
+
+        Args:
+            value (any): The value to search for.
+
+        Returns:
+            tuple[Block | None, int]: The block and offset, or (None, -1) if not found.
+        """
+        block = self._head
+        while block is not None:
+            if value in block._items:
+                return block, block._items.index(value)
+            block = block._next
+        return None, -1
+
+    def _delete(self, block: Block, offset: int) -> any:
+        """
+        Removes a value from a block and rebalances the block.
+
+        Args:
+            block (Block): The block holding the value.
+            offset (int): The offset of the value inside the block.
+
+        Returns:
+            any: The removed value.
+        """
+        items = block._items
+        value = items.pop(offset)
+        self._size -= 1
+        if not items:
+            self._unlink(block)
+        elif len(items) < self._capacity // 2 and block._next is not None:
+            following = block._next._items
+            if len(items) + len(following) <= self._capacity:
+                items.extend(following)
+                self._unlink(block._next)
+            else:
+                items.append(following.pop(0))
+        return value
+
+    def _link_after(self, block: Block, anchor: Block | None) -> None:
+        """
+        Links a block after another one, or as the only block if anchor is None.
+
+        Args:
+            block (Block): The detached block to link.
+            anchor (Block | None): The block to link after.
+        """
+        if anchor is None:
+            self._head = self._tail = block
+            return
+        block._previous = anchor
+        block._next = anchor._next
+        if anchor._next is None:
+            self._tail = block
+        else:
+            anchor._next._previous = block
+        anchor._next = block
+
+    def _link_before(self, block: Block, anchor: Block | None) -> None:
+        """
+        Links a block before another one, or as the only block if anchor is None.
+
+        Args:
+            block (Block): The detached block to link.
+            anchor (Block | None): The block to link before.
+        """
+        if anchor is None:
+            self._head = self._tail = block
+            return
+        block._next = anchor
+        block._previous = anchor._previous
+        if anchor._previous is None:
+            self._head = block
+        else:
+            anchor._previous._next = block
+        anchor._previous = block
+
+    def _unlink(self, block: Block) -> None:
+        """
+        Removes a block from the chain of blocks.
+
+        Args:
+            block (Block): The block to remove.
+        """
+        if block._previous is None:
+            self._head = block._next
+        else:
+            block._previous._next = block._next
+        if block._next is None:
+            self._tail = block._previous
+        else:
+            block._next._previous = block._previous
+        block._next = block._previous = None
@@ -0,0 +1,351 @@
+"""
+work_stealing.py
+================
+
+This module provides a work-stealing deque and a small fork-join thread pool
+built on top of the `Deque` class.
+
+Each worker thread owns one `WorkStealingDeque`. The owner pushes and pops tasks
+at the right end, so recently spawned (and usually smaller) tasks run first and
+stay hot in the cache. Idle workers steal from the left end of the other deques,
+which holds the oldest and usually largest pieces of work.
+
+Classes:
+    - WorkStealingDeque: A thread-safe deque with owner and thief ends.
+    - Task: A unit of work submitted to the pool, with its result or exception.
+    - WorkStealingPool: A fork-join scheduler with one deque per worker.
+
+Usage:
+    def tree_sum(pool, node):
+        if node is None:
+            return 0
+        left = pool.submit(tree_sum, pool, node.left)
+        right = tree_sum(pool, node.right)
+        return node.value + right + pool.join(left)
+
+    with WorkStealingPool(workers=4) as pool:
+        total = pool.run(tree_sum, pool, tree.root)
+"""
+import os
+import random
+import threading
+
+from data_structures.deque_list import Deque
+
+
+class WorkStealingDeque:
+    """
+    A deque shared by one owner thread and any number of thief threads.
+
+    The owner uses `push` and `pop` on the right end while thieves use `steal`
+    on the left end. A lock guards every operation, so the deque is safe to use
+    from several threads.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes an empty work-stealing deque.
+        """
+        self._deque = Deque()
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        """
+        Returns the number of items in the deque.
+
+        Returns:
+            int: The size of the deque.
+        """
+        return self._deque.size()
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the deque is empty.
+
+        Returns:
+            bool: True if the deque is empty, False otherwise.
+        """
+        return self._deque.is_empty()
+
+    def push(self, item: any) -> None:
+        """
+        Adds an item at the owner end of the deque.
+
+        Args:
+            item (any): The item to add. It must not be None.
+        """
+        with self._lock:
+            self._deque.append(item)
+
+    def pop(self) -> any:
+        """
+        Removes and returns the most recently pushed item (owner end).
+
+        Returns:
+            any: The newest item, or None if the deque is empty.
+        """
+        with self._lock:
+            if self._deque.is_empty():
+                return None
+            return self._deque.pop()
+
+    def steal(self) -> any:
+        """
+        Removes and returns the oldest item (thief end).
+
+        Returns:
+            any: The oldest item, or None if the deque is empty.
+        """
+        with self._lock:
+            if self._deque.is_empty():
+                return None
+            return self._deque.pop_left()
+
+
+class Task:
+    """
+    A function call scheduled on a `WorkStealingPool`.
+
+    Attributes:
+        _func (callable): The function to call.
+        _args (tuple): Positional arguments for the function.
+        _kwargs (dict): Keyword arguments for the function.
+        _done (threading.Event): Set once the task has finished.
+        _result (any): The return value of the function.
+        _exception (BaseException | None): The exception raised by the function, if any.
+    """
+    def __init__(self, func: callable, args: tuple, kwargs: dict) -> None:
+        """
+        Initializes a task that has not run yet.
+
+        Args:
+            func (callable): The function to call.
+            args (tuple): Positional arguments for the function.
+            kwargs (dict): Keyword arguments for the function.
+        """
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._done = threading.Event()
+        self._result = None
+        self._exception = None
+
+    def done(self) -> bool:
+        """
+        Checks whether the task has finished.
+
+        Returns:
+            bool: True if the task has run, False otherwise.
+        """
+        return self._done.is_set()
+
+    def result(self, timeout: float | None = None) -> any:
+        """
+        Waits for the task and returns its result.
+
+        Worker threads should call `WorkStealingPool.join` instead, which keeps
+        running other tasks while waiting.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait.
+
+        Returns:
+            any: The value returned by the task's function.
+
+        Raises:
+            TimeoutError: If the task did not finish in time.
+            Exception: Any exception raised by the task's function.
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("Task did not finish in time")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def _run(self) -> None:
+        """
+        Runs the task's function and records its outcome.
+        """
+        try:
+            self._result = self._func(*self._args, **self._kwargs)
+        except BaseException as error:  # pylint: disable=broad-except
+            self._exception = error
+        finally:
+            self._func = self._args = self._kwargs = None
+            self._done.set()
+
+
+class WorkStealingPool:
+    """
+    A fork-join thread pool with one work-stealing deque per worker.
+
+    Tasks submitted from a worker go to that worker's own deque; tasks submitted
+    from other threads are spread over the deques in round-robin order. A
+    worker waiting on `join` keeps running tasks instead of blocking, so nested
+    fork-join calls cannot deadlock the pool.
+    """
+    def __init__(self, workers: int | None = None) -> None:
+        """
+        Initializes the pool and starts its worker threads.
+
+        Args:
+            workers (int, optional): Number of worker threads. Defaults to `os.cpu_count()`.
+
+        Raises:
+            ValueError: If the number of workers is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Number of workers must be positive")
+        self._deques = [WorkStealingDeque() for _ in range(workers)]
+        self._local = threading.local()
+        self._wake = threading.Condition()
+        self._shutdown = False
+        self._next_deque = 0
+        self._threads = [
+            threading.Thread(target=self._worker, args=(index,), daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> 'WorkStealingPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @property
+    def workers(self) -> int:
+        """
+        Returns the number of worker threads.
+
+        Returns:
+            int: The number of workers.
+        """
+        return len(self._deques)
+
+    def submit(self, func: callable, *args, **kwargs) -> Task:
+        """
+        Schedules a function call on the pool.
+
+        Args:
+            func (callable): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Task: The scheduled task.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+        """
+        task = Task(func, args, kwargs)
+        index = getattr(self._local, "index", None)
+        # Checking the flag and pushing under the lock `shutdown` takes means a
+        # task is either rejected or pushed before the workers can exit.
+        with self._wake:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit tasks after shutdown")
+            if index is None:
+                index = self._next_deque
+                self._next_deque = (index + 1) % len(self._deques)
+            self._deques[index].push(task)
+            self._wake.notify()
+        return task
+
+    def join(self, task: Task) -> any:
+        """
+        Waits for a task and returns its result.
+
+        When called from a worker thread, the worker runs other pending tasks
+        (its own first, then stolen ones) until the task is done.
+
+        Args:
+            task (Task): The task to wait for.
+
+        Returns:
+            any: The value returned by the task's function.
+        """
+        index = getattr(self._local, "index", None)
+        if index is not None:
+            while not task.done():
+                other = self._find_task(index)
+                if other is not None:
+                    other._run()
+                else:
+                    task._done.wait(0.001)
+        return task.result()
+
+    def run(self, func: callable, *args, **kwargs) -> any:
+        """
+        Submits a function call and waits for its result.
+
+        Args:
+            func (callable): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            any: The value returned by the function.
+        """
+        return self.join(self.submit(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker threads once they run out of tasks.
+
+        Args:
+            wait (bool): Whether to wait for the worker threads to exit.
+        """
+        with self._wake:
+            self._shutdown = True
+            self._wake.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _find_task(self, index: int) -> Task | None:
+        """
+        Takes a task from the worker's own deque, or steals one from another worker.
+
+        Args:
+            index (int): The index of the worker looking for work.
+
+        Returns:
+            Task | None: A task to run, or None if every deque is empty.
+        """
+        task = self._deques[index].pop()
+        if task is not None:
+            return task
+        count = len(self._deques)
+        start = random.randrange(count)
+        for offset in range(count):
+            victim = (start + offset) % count
+            if victim != index:
+                task = self._deques[victim].steal()
+                if task is not None:
+                    return task
+        return None
+
+    def _worker(self, index: int) -> None:
+        """
+        Main loop of a worker thread.
+
+        Args:
+            index (int): The index of the worker and of the deque it owns.
+        """
+        self._local.index = index
+        while True:
+            task = self._find_task(index)
+            if task is None:
+                with self._wake:
+                    if not self._shutdown:
+                        self._wake.wait(0.01)
+                        continue
+                    # Look again under the lock: no task can be pushed after
+                    # this, so a worker only exits once every deque is empty.
+                    task = self._find_task(index)
+                    if task is None:
+                        return
+            task._run()
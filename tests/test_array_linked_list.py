@@ -0,0 +1,117 @@
+import random
+
+import pytest
+from data_structures.array_linked_list import ArrayDoubleLinkedList
+
+@pytest.fixture(name="adll")
+def array_linked_list_fixture():
+    return ArrayDoubleLinkedList([10, 20, 30])
+
+def test_inserts_return_handles(adll):
+    first = adll.insert_at_head(5)
+    last = adll.insert_at_tail(40)
+    middle = adll.insert_at_position(15, 2)
+    assert adll.traversal_forward() == [5, 10, 15, 20, 30, 40]
+    assert adll.traversal_backward() == [40, 30, 20, 15, 10, 5]
+    assert adll.get(first) == 5 and adll.get(last) == 40 and adll.get(middle) == 15
+    assert adll.head == first and adll.tail == last
+    assert adll.next_of(first) == adll.handle_at(1)
+    assert adll.previous_of(first) is None and adll.next_of(last) is None
+    assert len(adll) == adll.size == 6
+    with pytest.raises(IndexError):
+        adll.insert_at_position(1, 8)
+
+def test_deletes(adll):
+    assert adll.delete_from_head() == 10
+    assert adll.delete_from_tail() == 30
+    assert adll.traversal_forward() == [20]
+    assert adll.delete_from_position(0) == 20
+    assert adll.is_empty() and adll.head is None and adll.tail is None
+    with pytest.raises(IndexError):
+        adll.delete_from_head()
+    with pytest.raises(IndexError):
+        adll.delete_from_position(0)
+
+def test_handles_and_free_list(adll):
+    handle = adll.find(20)
+    assert adll.delete(handle) == 20
+    with pytest.raises(ValueError):
+        adll.get(handle)
+    with pytest.raises(ValueError):
+        adll.delete(handle)
+    assert adll.insert_at_tail(50) == handle  # The freed slot is reused.
+    assert adll.capacity == 3
+    assert adll.traversal_forward() == [10, 30, 50]
+
+def test_find_update_remove(adll):
+    assert adll.get(adll.find(30)) == 30
+    assert adll.find(99) is None
+    assert 20 in adll and 99 not in adll
+    adll.update_node(20, 25)
+    assert adll.traversal_forward() == [10, 25, 30]
+    adll.remove(10)
+    assert adll.traversal_forward() == [25, 30]
+    with pytest.raises(ValueError):
+        adll.remove(10)
+    with pytest.raises(ValueError):
+        adll.update_node(10, 1)
+    with pytest.raises(IndexError):
+        ArrayDoubleLinkedList().update_node(1, 2)
+
+def test_sort_keeps_handles():
+    pairs = [(3, 'a'), (1, 'b'), (3, 'c'), (2, 'd'), (1, 'e')]
+    adll = ArrayDoubleLinkedList(pairs)
+    handles = {pair: adll.find(pair) for pair in pairs}
+    adll.sort(key=lambda pair: pair[0])
+    assert adll.traversal_forward() == sorted(pairs, key=lambda pair: pair[0])
+    assert adll.traversal_backward() == sorted(pairs, key=lambda pair: pair[0])[::-1]
+    assert all(adll.get(handle) == pair for pair, handle in handles.items())
+    adll.sort(reverse=True)
+    assert adll.traversal_forward() == sorted(pairs, reverse=True)
+
+def test_merge_and_concat():
+    adll = ArrayDoubleLinkedList([1, 4, 6])
+    other = ArrayDoubleLinkedList([2, 3, 7])
+    adll.merge_sorted(other)
+    assert adll.traversal_forward() == [1, 2, 3, 4, 6, 7]
+    assert adll.traversal_backward() == [7, 6, 4, 3, 2, 1]
+    assert other.is_empty()
+    adll.concat(ArrayDoubleLinkedList([0]))
+    assert adll.traversal_forward() == [1, 2, 3, 4, 6, 7, 0]
+    with pytest.raises(ValueError):
+        adll.concat(adll)
+    with pytest.raises(TypeError):
+        adll.merge_sorted([1])
+
+def test_iteration_and_clear(adll):
+    assert list(adll) == [10, 20, 30]
+    assert list(reversed(adll)) == [30, 20, 10]
+    assert [adll.get(handle) for handle in adll.iter_handles(reverse=True)] == [30, 20, 10]
+    with pytest.raises(RuntimeError):
+        for value in adll:
+            adll.insert_at_tail(value)
+    adll.clear()
+    assert adll.is_empty() and adll.capacity == 0 and list(adll) == []
+
+def test_unstarted_iterator_fails_fast(adll):
+    iterators = [iter(adll), reversed(adll), adll.iter_handles(), adll.iter_handles(reverse=True)]
+    adll.delete_from_head()
+    for iterator in iterators:
+        with pytest.raises(RuntimeError):
+            next(iterator)
+    assert list(adll) == [20, 30]
+
+def test_matches_list():
+    rng = random.Random(42)
+    adll = ArrayDoubleLinkedList()
+    expected = []
+    for step in range(2000):
+        if rng.random() < 0.6 or not expected:
+            position = rng.randint(0, len(expected))
+            adll.insert_at_position(step, position)
+            expected.insert(position, step)
+        else:
+            position = rng.randrange(len(expected))
+            assert adll.delete_from_position(position) == expected.pop(position)
+    assert adll.traversal_forward() == expected
+    assert adll.traversal_backward() == expected[::-1]
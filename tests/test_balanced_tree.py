@@ -0,0 +1,152 @@
+import bisect
+import random
+
+import pytest
+from data_structures.balanced_tree import AVLTree, RedBlackTree
+from data_structures.binary_tree import Node
+
+TREES = [AVLTree, RedBlackTree]
+
+def check_invariants(tree):
+    # Checks links, order, sizes and the balancing rules; returns the keys in order.
+    keys = []
+    def walk(node, parent, low, high):
+        if node is None:
+            return 0, 0
+        assert node.parent is parent
+        assert (low is None or low < node.key) and (high is None or node.key < high)
+        left_height, left_black = walk(node.left, node, low, node.key)
+        keys.append(node.key)
+        right_height, right_black = walk(node.right, node, node.key, high)
+        assert node._size == (node.left._size if node.left else 0) + (node.right._size if node.right else 0) + 1
+        if isinstance(tree, AVLTree):
+            assert abs(left_height - right_height) <= 1
+            assert node._height == max(left_height, right_height) + 1
+        else:
+            assert left_black == right_black
+            if node._red:
+                assert not (node.left and node.left._red) and not (node.right and node.right._red)
+        return max(left_height, right_height) + 1, left_black + (not getattr(node, "_red", False))
+    walk(tree.root, None, None, None)
+    if isinstance(tree, RedBlackTree) and tree.root is not None:
+        assert not tree.root._red
+    assert len(tree) == len(keys)
+    return keys
+
+@pytest.fixture(name="tree", params=TREES)
+def tree_fixture(request):
+    tree = request.param()
+    for key in [50, 20, 80, 10, 30, 70, 90, 60]:
+        tree.insert_node(key, str(key))
+    return tree
+
+def test_insert_and_find(tree):
+    assert list(tree) == [10, 20, 30, 50, 60, 70, 80, 90]
+    assert isinstance(tree.root, Node)
+    assert tree.find(30).key == 30 and tree.find(30).value == "30"
+    assert tree.find(35) is None
+    assert 60 in tree and 65 not in tree
+    assert tree.get(70) == "70" and tree.get(75, "missing") == "missing"
+    tree.insert_node(30, "thirty")
+    assert tree.get(30) == "thirty" and len(tree) == 8
+    check_invariants(tree)
+
+def test_delete(tree):
+    tree.delete_node(50)
+    tree.delete_node(10)
+    assert list(tree) == [20, 30, 60, 70, 80, 90]
+    check_invariants(tree)
+    with pytest.raises(KeyError):
+        tree.delete_node(50)
+
+def test_floor_and_ceiling(tree):
+    assert tree.floor(55).key == 50 and tree.floor(50).key == 50
+    assert tree.floor(5) is None
+    assert tree.ceiling(55).key == 60 and tree.ceiling(60).key == 60
+    assert tree.ceiling(95) is None
+
+def test_range(tree):
+    assert [node.key for node in tree.range(20, 70)] == [20, 30, 50, 60]
+    assert [node.key for node in tree.range(25)] == [30, 50, 60, 70, 80, 90]
+    assert [node.key for node in tree.range(stop=30)] == [10, 20]
+    assert list(tree.range(91)) == []
+    assert list(tree.items())[:2] == [(10, "10"), (20, "20")]
+
+def test_rank_and_select(tree):
+    assert [tree.select(i).key for i in range(8)] == [10, 20, 30, 50, 60, 70, 80, 90]
+    assert tree.select(-1).key == 90
+    with pytest.raises(IndexError):
+        tree.select(8)
+    assert tree.rank(10) == 0 and tree.rank(55) == 4 and tree.rank(100) == 8
+
+@pytest.mark.parametrize("tree_type", TREES)
+def test_empty_tree(tree_type):
+    tree = tree_type()
+    assert tree.is_empty() and len(tree) == 0 and tree.height() == 0
+    assert list(tree) == [] and list(tree.range(1, 2)) == []
+    assert tree.floor(1) is None and tree.ceiling(1) is None and tree.rank(1) == 0
+    with pytest.raises(IndexError):
+        tree.select(0)
+
+@pytest.mark.parametrize("tree_type", TREES)
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 6, 7, 8, 100, 1000])
+def test_from_sorted(tree_type, count):
+    tree = tree_type.from_sorted(range(count), [str(key) for key in range(count)])
+    assert check_invariants(tree) == list(range(count))
+    assert tree.height() == count.bit_length()
+    if count:
+        assert tree.get(count - 1) == str(count - 1)
+    tree.insert_node(count)
+    tree.delete_node(0)
+    assert check_invariants(tree) == list(range(1, count + 1))
+
+@pytest.mark.parametrize("tree_type", TREES)
+def test_from_sorted_rejects_unsorted(tree_type):
+    with pytest.raises(ValueError):
+        tree_type.from_sorted([1, 3, 2])
+    with pytest.raises(ValueError):
+        tree_type.from_sorted([1, 1])
+    with pytest.raises(ValueError):
+        tree_type.from_sorted([1, 2], ["a"])
+
+@pytest.mark.parametrize("tree_type", TREES)
+@pytest.mark.parametrize("seed", range(4))
+def test_random_operations_match_sorted_list(tree_type, seed):
+    rng = random.Random(seed)
+    tree, keys = tree_type(), []
+    for _ in range(1500):
+        key = rng.randrange(300)
+        index = bisect.bisect_left(keys, key)
+        present = index < len(keys) and keys[index] == key
+        if rng.random() < 0.55:
+            tree.insert_node(key, -key)
+            if not present:
+                keys.insert(index, key)
+        elif present:
+            tree.delete_node(key)
+            del keys[index]
+        else:
+            with pytest.raises(KeyError):
+                tree.delete_node(key)
+    assert check_invariants(tree) == keys
+    assert tree.height() <= 2 * (len(keys) + 1).bit_length()
+    for query in range(-1, 302, 7):
+        assert tree.rank(query) == bisect.bisect_left(keys, query)
+        floor = tree.floor(query)
+        index = bisect.bisect_right(keys, query)
+        assert (floor.key if floor else None) == (keys[index - 1] if index else None)
+        assert [node.key for node in tree.range(query, query + 40)] == \
+            keys[bisect.bisect_left(keys, query):bisect.bisect_left(keys, query + 40)]
+    assert [tree.select(i).key for i in range(len(keys))] == keys
+    assert all(tree.get(key) == -key for key in keys)
+
+@pytest.mark.parametrize("tree_type", TREES)
+def test_sorted_inserts_stay_balanced(tree_type):
+    tree = tree_type()
+    for key in range(1024):
+        tree.insert_node(key)
+    check_invariants(tree)
+    assert tree.height() <= 2 * 11
+    for key in range(0, 1024, 2):
+        tree.delete_node(key)
+    assert check_invariants(tree) == list(range(1, 1024, 2))
@@ -1,5 +1,6 @@
+import random
 import pytest
-from data_structures.binary_tree import BinaryTree
+from data_structures.binary_tree import BinaryTree, Node
 
 @pytest.fixture(name="bt")
 def binary_tree_fixture():
@@ -64,3 +65,215 @@ def test_delete_level_3_node(bt):
     bt.delete_node(30)
     assert bt.find(30) is None
     assert bt.print_tree_bfs() == "Level 1: [0]\nLevel 2: [10, 20]\nLevel 3: [50, 40]"
+
+def test_node_uses_slots():
+    node = Node(1)
+    assert not hasattr(node, "__dict__")
+
+@pytest.fixture(name="abt")
+def array_backed_tree_fixture():
+    abt = BinaryTree(array_backed=True)
+    for value in [0, 10, 20, 30, 40, 50]:
+        abt.insert_node(value)
+    return abt
+
+def linked_bfs(tree):
+    # Level order following the node links rather than the array.
+    nodes, level = [], [tree.root] if tree.root else []
+    while level:
+        nodes.extend(level)
+        level = [child for node in level for child in (node.left, node.right) if child]
+    return nodes
+
+def test_array_backed_insert_node(abt):
+    assert abt.array_backed and not BinaryTree().array_backed
+    assert abt.root.value == 0
+    assert abt.root.left.value == 10 and abt.root.right.value == 20
+    assert abt.root.left.left.value == 30 and abt.root.left.right.value == 40
+    assert abt.root.right.left.value == 50 and abt.root.right.right is None
+    assert abt.root.right.left.parent is abt.root.right
+    assert abt.last_node().value == 50
+    assert [node.value for node in abt.bfs()] == [0, 10, 20, 30, 40, 50]
+    assert abt.find(40).value == 40 and abt.find('hello') is None
+
+@pytest.mark.parametrize("target, expected", [
+    (0, "Level 1: [50]\nLevel 2: [10, 20]\nLevel 3: [30, 40]"),
+    (20, "Level 1: [0]\nLevel 2: [10, 50]\nLevel 3: [30, 40]"),
+    (30, "Level 1: [0]\nLevel 2: [10, 20]\nLevel 3: [50, 40]"),
+    (50, "Level 1: [0]\nLevel 2: [10, 20]\nLevel 3: [30, 40]"),
+])
+def test_array_backed_delete_node(abt, target, expected):
+    assert abt.delete_node(target) is None
+    assert abt.find(target) is None
+    assert abt.print_tree_bfs() == expected
+    assert abt.bfs() == linked_bfs(abt)
+
+def test_array_backed_matches_links():
+    abt = BinaryTree(array_backed=True)
+    for value in range(50):
+        abt.insert_node(value)
+    for value in [0, 7, 49, 13, 2, 25, 1]:
+        abt.delete_node(value)
+        abt.insert_node(100 + value)
+    nodes = abt.bfs()
+    assert nodes[0] is abt.root and nodes == linked_bfs(abt)
+    for index, node in enumerate(nodes):
+        assert node._position == index
+        assert node.parent is (nodes[(index - 1) // 2] if index else None)
+    assert abt.delete_node('missing') == 'Target value not found in the binary tree'
+    while not abt.is_empty():
+        abt.delete_node(abt.root.value)
+    assert abt.last_node() is None and abt.bfs() == []
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_traversal_generators(array_backed):
+    tree = BinaryTree(array_backed=array_backed)
+    for value in range(7):
+        tree.insert_node(value)
+    def values(nodes):
+        return [node.value for node in nodes]
+    assert values(tree.iter_bfs()) == [0, 1, 2, 3, 4, 5, 6]
+    assert [values(level) for level in tree.iter_levels()] == [[0], [1, 2], [3, 4, 5, 6]]
+    assert values(tree.iter_pre_order()) == [0, 1, 3, 4, 2, 5, 6]
+    assert values(tree.iter_in_order()) == [3, 1, 4, 0, 5, 2, 6]
+    assert values(tree.iter_post_order()) == [3, 4, 1, 5, 6, 2, 0]
+    assert values(tree.pre_order_traversal()) == values(tree.iter_pre_order())
+    assert values(tree.in_order_traversal()) == values(tree.iter_in_order())
+    assert values(tree.post_order_traversal()) == values(tree.iter_post_order())
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_traversals_of_empty_tree(array_backed):
+    tree = BinaryTree(array_backed=array_backed)
+    assert tree.bfs() == []
+    assert tree.print_tree_bfs() == ""
+    for iterator in (tree.iter_bfs, tree.iter_levels, tree.iter_pre_order,
+                     tree.iter_in_order, tree.iter_post_order):
+        assert list(iterator()) == []
+
+def test_iter_bfs_is_lazy(bt):
+    nodes = bt.iter_bfs()
+    assert next(nodes) is bt.root
+    assert next(nodes) is bt.root.left
+    levels = bt.iter_levels()
+    assert next(levels) == [bt.root]
+
+def test_traversals_of_deep_tree():
+    # A left-skewed chain deeper than the recursion limit.
+    bt = BinaryTree()
+    bt._root = Node(0)
+    current = bt._root
+    for value in range(1, 5_000):
+        current.left = Node(value, parent=current)
+        current = current.left
+    assert [node.value for node in bt.iter_pre_order()] == list(range(5_000))
+    assert [node.value for node in bt.iter_in_order()] == list(range(4_999, -1, -1))
+    assert [node.value for node in bt.iter_post_order()] == list(range(4_999, -1, -1))
+    assert bt.find(4_999) is current and bt.last_node() is current
+
+def build_random_tree(count, seed):
+    # A random, not complete, tree built by following random links.
+    rng = random.Random(seed)
+    bt = BinaryTree()
+    for value in range(count):
+        node = Node(value)
+        if bt.root is None:
+            bt._root = node
+            continue
+        current = bt.root
+        while True:
+            side = "_left" if rng.random() < 0.5 else "_right"
+            if getattr(current, side) is None:
+                setattr(current, side, node)
+                node.parent = current
+                break
+            current = getattr(current, side)
+    return bt
+
+@pytest.mark.parametrize("order", ["pre", "in", "post"])
+@pytest.mark.parametrize("seed", range(5))
+def test_traversal_methods_agree(order, seed):
+    bt = build_random_tree(200, seed)
+    traversal = getattr(bt, f"{order}_order_traversal")
+    links = linked_bfs(bt)
+    expected = traversal(method="recursive")
+    assert len(expected) == 200
+    assert traversal(method="iterative") == expected
+    assert traversal(method="morris") == expected
+    # Morris traversals restore every link they thread.
+    assert linked_bfs(bt) == links
+    assert all(node.right is None or node.right.parent is node for node in links)
+
+@pytest.mark.parametrize("method", ["iterative", "recursive", "morris"])
+def test_traversal_methods_on_small_trees(bt, method):
+    assert [node.value for node in bt.pre_order_traversal(method)] == [0, 10, 30, 40, 20, 50]
+    assert [node.value for node in bt.in_order_traversal(method)] == [30, 10, 40, 0, 50, 20]
+    assert [node.value for node in bt.post_order_traversal(method)] == [30, 40, 10, 50, 20, 0]
+    empty = BinaryTree()
+    assert empty.pre_order_traversal(method) == []
+    assert empty.in_order_traversal(method) == []
+    assert empty.post_order_traversal(method) == []
+
+def test_traversal_unknown_method(bt):
+    with pytest.raises(ValueError):
+        bt.in_order_traversal(method="threaded")
+
+def test_morris_traversals_of_deep_tree():
+    bt = BinaryTree()
+    bt._root = Node(0)
+    current = bt._root
+    for value in range(1, 5_000):
+        current.right = Node(value, parent=current)
+        current = current.right
+    assert [node.value for node in bt.pre_order_traversal("morris")] == list(range(5_000))
+    assert [node.value for node in bt.post_order_traversal("morris")] == list(range(4_999, -1, -1))
+    with pytest.raises(RecursionError):
+        bt.in_order_traversal("recursive")
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_indexed_find_and_delete(array_backed):
+    bt = BinaryTree(array_backed=array_backed, indexed=True)
+    assert bt.indexed and not BinaryTree().indexed
+    for value in [0, 10, 20, 30, 40, 50]:
+        bt.insert_node(value)
+    assert bt.find(40) is bt.root.left.right
+    assert 50 in bt and 60 not in bt
+    bt.delete_node(0)
+    assert bt.find(0) is None
+    assert bt.find(50) is bt.root
+    assert bt.print_tree_bfs() == "Level 1: [50]\nLevel 2: [10, 20]\nLevel 3: [30, 40]"
+    assert bt.delete_node(0) == 'Target value not found in the binary tree'
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_indexed_duplicates(array_backed):
+    bt = BinaryTree(array_backed=array_backed, indexed=True)
+    for value in [1, 2, 1, 3, 1, 2]:
+        bt.insert_node(value)
+    assert bt.find(1) is bt.root
+    assert bt.find(2) is bt.root.left
+    bt.delete_node(1)  # The root takes the last value, 2.
+    assert bt.root.value == 2
+    assert bt.find(1) is bt.root.right
+    bt.delete_node(1)
+    assert bt.find(1) is bt.root.right
+    assert bt.find(1).value == 1
+    bt.delete_node(1)
+    assert 1 not in bt and set(bt._index) == {2, 3}
+
+@pytest.mark.parametrize("array_backed", [False, True])
+def test_indexed_matches_scan(array_backed):
+    rng = random.Random(7)
+    indexed = BinaryTree(array_backed=array_backed, indexed=True)
+    plain = BinaryTree(array_backed=array_backed)
+    for _ in range(300):
+        value = rng.randrange(20)
+        if rng.random() < 0.6:
+            indexed.insert_node(value)
+            plain.insert_node(value)
+        else:
+            assert indexed.delete_node(value) == plain.delete_node(value)
+        assert indexed.print_tree_bfs() == plain.print_tree_bfs()
+        for probe in range(20):
+            found, expected = indexed.find(probe), plain.find(probe)
+            assert (found is None) == (expected is None)
+            if found is not None:
+                assert linked_bfs(indexed).index(found) == linked_bfs(plain).index(expected)
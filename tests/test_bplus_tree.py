@@ -0,0 +1,127 @@
+import random
+
+import pytest
+from data_structures.bplus_tree import BPlusTree
+
+@pytest.fixture(name="path")
+def path_fixture(tmp_path):
+    return str(tmp_path / "tree.db")
+
+@pytest.fixture(name="tree")
+def tree_fixture(path):
+    # Small pages, so a few dozen keys already need several levels.
+    tree = BPlusTree(path, page_size=96)
+    for key in [50, 20, 80, 10, 30, 70, 90, 60]:
+        tree.insert_node(key, key * 10)
+    yield tree
+    tree.close()
+
+def test_insert_and_find(tree):
+    assert tree.find(30) == 300
+    assert tree.find(35) is None
+    assert 60 in tree and 65 not in tree
+    assert list(tree) == [10, 20, 30, 50, 60, 70, 80, 90]
+    tree.insert_node(30, -1)
+    assert tree.find(30) == -1 and len(tree) == 8
+
+def test_delete(tree):
+    tree.delete_node(50)
+    tree.delete_node(10)
+    assert list(tree) == [20, 30, 60, 70, 80, 90]
+    assert tree.find(50) is None
+    with pytest.raises(KeyError):
+        tree.delete_node(50)
+
+def test_range(tree):
+    assert list(tree.range(20, 70)) == [(20, 200), (30, 300), (50, 500), (60, 600)]
+    assert [key for key, _ in tree.range(25)] == [30, 50, 60, 70, 80, 90]
+    assert [key for key, _ in tree.range(stop=30)] == [10, 20]
+    assert list(tree.range(91)) == []
+
+def test_empty_tree(path):
+    with BPlusTree(path) as tree:
+        assert tree.is_empty() and len(tree) == 0 and tree.height == 1
+        assert tree.find(1) is None and list(tree) == []
+
+def test_reopen_keeps_data(path):
+    with BPlusTree(path, page_size=128) as tree:
+        for key in range(500):
+            tree.insert_node(key, -key)
+    with BPlusTree(path) as tree:
+        assert tree.page_size == 128 and len(tree) == 500 and tree.height > 2
+        assert tree.find(499) == -499
+        assert list(tree) == list(range(500))
+
+def test_not_a_tree(path):
+    with open(path, "wb") as file:
+        file.write(b"not a tree" * 10)
+    with pytest.raises(ValueError):
+        BPlusTree(path)
+    with pytest.raises(ValueError):
+        BPlusTree(path + "2", page_size=100)
+
+def test_int64_only(tree):
+    with pytest.raises(OverflowError):
+        tree.insert_node(2**63, 0)
+
+@pytest.mark.parametrize("key, value, error", [
+    (10, 2**70, OverflowError), (15, 2**70, OverflowError),
+    (15, "a", TypeError), (15, 1.5, TypeError),
+])
+def test_rejected_insert_leaves_tree_unchanged(path, tree, key, value, error):
+    with pytest.raises(error):
+        tree.insert_node(key, value)
+    assert len(tree) == 8 and 15 not in tree and tree.find(10) == 100
+    assert list(tree.range()) == [(key, key * 10) for key in [10, 20, 30, 50, 60, 70, 80, 90]]
+    tree.close()
+    with BPlusTree(path) as reopened:
+        assert len(reopened) == 8 and list(reopened) == [10, 20, 30, 50, 60, 70, 80, 90]
+
+@pytest.mark.parametrize("count", [0, 1, 5, 6, 100, 1000])
+def test_from_sorted(path, count):
+    with BPlusTree.from_sorted(path, range(0, 2 * count, 2), range(count), page_size=96) as tree:
+        assert len(tree) == count
+        assert list(tree.range()) == [(2 * index, index) for index in range(count)]
+        assert all(tree.find(2 * index) == index for index in range(count))
+        assert tree.find(1) is None
+        tree.insert_node(1, -1)
+        tree.insert_node(2 * count + 3, -2)
+        assert list(tree)[:2] == ([0, 1] if count else [1, 3])
+        assert len(tree) == count + 2
+    with BPlusTree(path) as tree:
+        assert len(tree) == count + 2
+
+def test_from_sorted_rejects_bad_input(path):
+    with pytest.raises(ValueError):
+        BPlusTree.from_sorted(path, [1, 3, 2], [0, 0, 0])
+    with pytest.raises(ValueError):
+        BPlusTree.from_sorted(path, range(10), range(9), page_size=96)
+    with pytest.raises(ValueError):
+        BPlusTree.from_sorted(path, range(10), range(11), page_size=96)
+    with pytest.raises(ValueError):
+        # Unsorted across two leaves.
+        BPlusTree.from_sorted(path, [0, 1, 2, 3, 4, 5, 1], range(7), page_size=96)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_random_operations_match_dict(path, seed):
+    rng = random.Random(seed)
+    expected = {}
+    # A tiny cache forces pages in and out of the file.
+    with BPlusTree(path, cache_pages=1, page_size=96) as tree:
+        for _ in range(4000):
+            key = rng.randrange(-1000, 1000)
+            if rng.random() < 0.7:
+                value = rng.randrange(-2**63, 2**63)
+                tree.insert_node(key, value)
+                expected[key] = value
+            elif key in expected:
+                tree.delete_node(key)
+                del expected[key]
+        assert len(tree) == len(expected)
+        assert list(tree.range()) == sorted(expected.items())
+        for key in range(-1000, 1000, 37):
+            assert tree.find(key) == expected.get(key)
+            assert list(tree.range(key, key + 100)) == \
+                sorted(item for item in expected.items() if key <= item[0] < key + 100)
+    with BPlusTree(path) as tree:
+        assert list(tree.range()) == sorted(expected.items())
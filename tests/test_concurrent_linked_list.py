@@ -0,0 +1,148 @@
+import threading
+
+import pytest
+from data_structures.concurrent_linked_list import ConcurrentDoubleLinkedList
+
+@pytest.fixture(name="clist")
+def concurrent_list_fixture():
+    return ConcurrentDoubleLinkedList([10, 20, 30])
+
+def test_head_and_tail_operations(clist):
+    clist.insert_at_head(5)
+    clist.insert_at_tail(40)
+    assert clist.traversal_forward() == [5, 10, 20, 30, 40]
+    assert clist.traversal_backward() == [40, 30, 20, 10, 5]
+    assert clist.delete_from_head() == 5
+    assert clist.delete_from_tail() == 40
+    assert len(clist) == clist.size == 3
+
+def test_positional_operations(clist):
+    clist.insert_at_position(15, 1)
+    clist.insert_at_position(35, 4)
+    clist.insert_at_position(0, 0)
+    assert list(clist) == [0, 10, 15, 20, 30, 35]
+    assert clist.delete_from_position(2) == 15
+    assert clist.delete_from_position(4) == 35
+    assert list(clist) == [0, 10, 20, 30]
+    with pytest.raises(IndexError):
+        clist.insert_at_position(1, 6)
+    with pytest.raises(IndexError):
+        clist.delete_from_position(4)
+    with pytest.raises(IndexError):
+        clist.delete_from_position(-1)
+    assert list(clist) == [0, 10, 20, 30] and len(clist) == 4
+
+def test_find_update_remove_clear(clist):
+    assert 20 in clist and 25 not in clist
+    assert clist.find(20).data == 20
+    clist.update_node(20, 25)
+    clist.remove(10)
+    assert list(clist) == [25, 30]
+    with pytest.raises(ValueError):
+        clist.remove(10)
+    with pytest.raises(ValueError):
+        clist.update_node(10, 1)
+    clist.clear()
+    assert clist.is_empty() and len(clist) == 0 and list(clist) == []
+
+def test_empty_list_errors():
+    clist = ConcurrentDoubleLinkedList()
+    with pytest.raises(IndexError):
+        clist.delete_from_head()
+    with pytest.raises(IndexError):
+        clist.delete_from_tail()
+    clist.insert_at_tail(1)
+    assert clist.delete_from_tail() == 1 and clist.is_empty()
+
+def test_iterator_survives_deletes(clist):
+    iterator = iter(clist)
+    assert next(iterator) == 10
+    clist.remove(10)
+    clist.remove(20)
+    assert list(iterator) == [30]
+
+def run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_concurrent_producers_and_consumers():
+    clist = ConcurrentDoubleLinkedList()
+    per_thread = 2000
+    consumed = [[] for _ in range(4)]
+
+    def producer(offset):
+        for value in range(offset, offset + per_thread):
+            if value % 2:
+                clist.insert_at_tail(value)
+            else:
+                clist.insert_at_head(value)
+
+    def consumer(index):
+        taken = consumed[index]
+        while len(taken) < per_thread:
+            try:
+                taken.append(clist.delete_from_head() if index % 2 else clist.delete_from_tail())
+            except IndexError:
+                pass
+
+    run_threads([lambda offset=offset: producer(offset) for offset in range(0, 4 * per_thread, per_thread)]
+                + [lambda index=index: consumer(index) for index in range(4)])
+    assert sorted(value for taken in consumed for value in taken) == list(range(4 * per_thread))
+    assert clist.is_empty() and len(clist) == 0
+
+def test_concurrent_positional_operations_and_iteration():
+    clist = ConcurrentDoubleLinkedList(range(100))
+    errors = []
+
+    def mutator(seed):
+        for step in range(500):
+            position = (seed * 31 + step * 7) % 50
+            clist.insert_at_position(-1, position)
+            clist.delete_from_position(position)
+
+    def reader():
+        try:
+            for _ in range(50):
+                assert len(list(clist)) >= 100 - 4
+                list(reversed(clist))
+        except Exception as error:  # Surface failures from the thread.
+            errors.append(error)
+
+    run_threads([lambda seed=seed: mutator(seed) for seed in range(4)] + [reader, reader])
+    assert not errors
+    values = list(clist)
+    assert len(clist) == len(values) == 100
+    assert values.count(-1) == 100 - len(set(values) & set(range(100)))
+    assert clist.traversal_backward() == clist.traversal_forward()[::-1]
+
+class Unequal:
+    def __eq__(self, other):
+        raise TypeError("ambiguous comparison")
+
+    __hash__ = object.__hash__
+
+def finishes(target):
+    # Runs target in another thread and reports whether it returned, so a
+    # lock left held fails the test instead of hanging it.
+    errors = []
+    def run():
+        try:
+            target()
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    return not thread.is_alive(), errors
+
+def test_failing_comparison_releases_locks():
+    clist = ConcurrentDoubleLinkedList([Unequal(), 1, 2])
+    for operation in (lambda: clist.remove(2), lambda: clist.update_node(2, 3)):
+        done, errors = finishes(operation)
+        assert done and [type(error) for error in errors] == [TypeError]
+    assert finishes(lambda: clist.insert_at_head(0)) == (True, [])
+    assert finishes(lambda: clist.insert_at_position(5, 2)) == (True, [])
+    assert len(clist) == 5 and clist.traversal_forward()[0] == 0
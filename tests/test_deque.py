@@ -156,3 +156,59 @@ def test_empty_peek_left():
     deque = Deque()
     with pytest.raises(IndexError, match="Peek from an empty deque"):
         deque.peek_left()
+
+def test_count(deque: Deque):
+    """
+    Test counting the occurrences of a value.
+
+    Verifies:
+        - `count()` returns an int, including 0 for missing values.
+    """
+    deque.append(1)
+    assert deque.count(1) == 2
+    assert deque.count('missing') == 0
+
+def test_index(deque: Deque):
+    """
+    Test finding the indexes of a value.
+
+    Verifies:
+        - All indexes are returned when no range is given.
+        - The range end is exclusive.
+    """
+    deque.append(1)
+    assert deque.index(1) == {0, 2}
+    assert deque.index(1, 1, 2) is None
+    with pytest.raises(IndexError, match="Invalid start and/or end values"):
+        deque.index(1, 0, 10)
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_mixed_operations(indexed: bool):
+    """
+    Test that the value index stays in sync with the deque contents.
+
+    Verifies:
+        - `count()`, `index()`, membership and `remove()` agree with a plain list
+          after appends, pops, inserts and removals at both ends and in the middle.
+    """
+    deque = Deque(indexed=indexed)
+    expected = []
+    for value in [3, 1, 3, 2, 3]:
+        deque.append(value)
+        expected.append(value)
+    deque.append_left(2)
+    expected.insert(0, 2)
+    deque.insert(2, 1)
+    expected.insert(1, 2)
+    assert deque.remove(1) == "Value deleted at index 3"
+    expected.remove(1)
+    assert deque.pop_left() == expected.pop(0)
+    assert deque.pop() == expected.pop()
+    assert deque.remove('missing') == "Value not in deque"
+
+    for value in (1, 2, 3):
+        assert deque.count(value) == expected.count(value)
+        indexes = {i for i, item in enumerate(expected) if item == value}
+        assert deque.index(value) == (indexes or None)
+        assert (value in deque) is (value in expected)
+    assert len(deque) == len(expected)
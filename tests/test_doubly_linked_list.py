@@ -1,5 +1,7 @@
+import random
+
 import pytest
-from data_structures.double_linked_list import Node, DoubleLinkedList
+from data_structures.double_linked_list import InvalidArgument, Node, DoubleLinkedList
 
 @pytest.fixture(name="dll")
 def doubly_linked_list():
@@ -102,3 +104,263 @@ def test_is_empty(dll):
     dll.delete_from_head()
     dll.delete_from_tail()
     assert dll.is_empty() is True  # It should be True after clearing all nodes
+
+def test_node_uses_slots():
+    """Test that nodes carry no per-instance __dict__ and setters still validate."""
+    node = Node(10)
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(InvalidArgument):
+        node.next = "invalid"
+    with pytest.raises(InvalidArgument):
+        node.previous = "invalid"
+
+def test_insert_invalid_node(dll):
+    """Test that only Node instances can be inserted."""
+    with pytest.raises(TypeError):
+        dll.insert_at_head(None)
+    with pytest.raises(TypeError):
+        dll.insert_at_tail("invalid")
+    assert dll.size == 2
+
+def build_dll(values):
+    """Builds a doubly linked list holding the given values."""
+    dll = DoubleLinkedList()
+    for value in values:
+        dll.insert_at_tail(Node(value))
+    return dll
+
+def test_sort():
+    """Test in-place merge sort, including stability and reverse order."""
+    pairs = [(3, 'a'), (1, 'b'), (3, 'c'), (2, 'd'), (1, 'e')]
+    dll = build_dll(pairs)
+    nodes = set(map(id, [dll.find(pair) for pair in pairs]))
+    dll.sort(key=lambda pair: pair[0])
+    assert dll.traversal_forward() == sorted(pairs, key=lambda pair: pair[0])
+    assert dll.traversal_backward() == sorted(pairs, key=lambda pair: pair[0])[::-1]
+    assert dll.head.previous is None and dll.tail.next is None
+    assert set(map(id, [dll.find(pair) for pair in pairs])) == nodes  # Same nodes, relinked.
+    dll.sort(key=lambda pair: pair[0], reverse=True)
+    assert dll.traversal_forward() == sorted(pairs, key=lambda pair: pair[0], reverse=True)
+
+def test_merge_sorted():
+    """Test merging two sorted lists."""
+    dll = build_dll([1, 4, 6])
+    other = build_dll([2, 3, 7, 8])
+    dll.merge_sorted(other)
+    assert dll.traversal_forward() == [1, 2, 3, 4, 6, 7, 8]
+    assert dll.traversal_backward() == [8, 7, 6, 4, 3, 2, 1]
+    assert dll.size == 7 and dll.tail.data == 8
+    assert other.is_empty() and other.size == 0
+    empty = DoubleLinkedList()
+    empty.merge_sorted(dll)
+    assert empty.traversal_forward() == [1, 2, 3, 4, 6, 7, 8]
+    with pytest.raises(ValueError):
+        empty.merge_sorted(empty)
+
+def test_indexed_list():
+    """Test that the value index follows every insert, delete, update and clear."""
+    dll = DoubleLinkedList(indexed=True)
+    for value in [1, 2, 3, 2]:
+        dll.insert_at_tail(Node(value))
+    dll.insert_at_head(Node(0))
+    dll.insert_at_position(Node(9), 2)
+    assert dll.indexed and not DoubleLinkedList().indexed
+    assert dll.find(2) is dll.head.next.next.next  # Earliest of the duplicates.
+    dll.update_node(9, 5)
+    assert 9 not in dll and dll.find(5).data == 5
+    dll.remove(2)
+    assert dll.traversal_forward() == [0, 1, 5, 3, 2]
+    assert dll.find(2) is dll.tail
+    dll.remove(0)
+    dll.remove(2)
+    assert dll.traversal_forward() == [1, 5, 3]
+    assert dll.traversal_backward() == [3, 5, 1]
+    with pytest.raises(ValueError):
+        dll.remove(2)
+    dll.delete_from_head()
+    dll.delete_from_tail()
+    assert 1 not in dll and 3 not in dll and 5 in dll
+    dll.clear()
+    assert dll.find(5) is None
+
+def test_indexed_merge_sorted():
+    """Test that merged nodes are added to the index of the receiving list."""
+    dll = DoubleLinkedList(indexed=True)
+    other = DoubleLinkedList(indexed=True)
+    for value in [1, 4]:
+        dll.insert_at_tail(Node(value))
+    for value in [2, 3]:
+        other.insert_at_tail(Node(value))
+    dll.merge_sorted(other)
+    assert dll.find(3) is dll.tail.previous
+    assert 3 not in other
+    dll.remove(1)
+    assert dll.head.data == 2 and dll.head.previous is None
+
+def test_node_at_walks_from_closest_end(dll):
+    dll.insert_at_tail(Node(30))
+    assert [dll.node_at(i).data for i in range(3)] == [20, 10, 30]
+    with pytest.raises(IndexError):
+        dll.node_at(3)
+    with pytest.raises(IndexError):
+        dll.node_at(-1)
+
+@pytest.mark.parametrize("finger", [False, True])
+def test_positional_operations_match_list(finger):
+    """Test random positional operations, with and without the finger, against a list."""
+    rng = random.Random(39)
+    dll = DoubleLinkedList(indexed=True, finger=finger)
+    expected = []
+    for step in range(2000):
+        action = rng.random()
+        if action < 0.45 or not expected:
+            position = rng.randint(0, len(expected))
+            dll.insert_at_position(Node(step), position)
+            expected.insert(position, step)
+        elif action < 0.75:
+            position = rng.randrange(len(expected))
+            dll.delete_from_position(position)
+            del expected[position]
+        elif action < 0.8:
+            dll.delete_from_head()
+            del expected[0]
+        elif action < 0.85:
+            dll.delete_from_tail()
+            expected.pop()
+        elif action < 0.9:
+            value = rng.choice(expected)
+            dll.remove(value)
+            expected.remove(value)
+        elif action < 0.95:
+            dll.insert_at_head(Node(step))
+            expected.insert(0, step)
+        else:
+            position = rng.randrange(len(expected))
+            assert dll.node_at(position).data == expected[position]
+    assert dll.traversal_forward() == expected
+    assert dll.traversal_backward() == expected[::-1]
+    assert [dll.node_at(i).data for i in range(len(expected))] == expected
+
+def check_links(dll, expected):
+    """Checks the values, both link directions and the size of a list."""
+    assert dll.traversal_forward() == expected
+    assert dll.traversal_backward() == expected[::-1]
+    assert dll.size == len(expected)
+    if expected:
+        assert dll.head.previous is None and dll.tail.next is None
+    else:
+        assert dll.head is None and dll.tail is None
+
+def test_concat():
+    dll = build_dll([1, 2])
+    other = build_dll([3, 4])
+    dll.concat(other)
+    check_links(dll, [1, 2, 3, 4])
+    check_links(other, [])
+    empty = DoubleLinkedList()
+    empty.concat(dll)
+    check_links(empty, [1, 2, 3, 4])
+    with pytest.raises(ValueError):
+        empty.concat(empty)
+    with pytest.raises(TypeError):
+        empty.concat([5])
+
+def test_splice_between_lists():
+    dll = build_dll([0, 1, 2, 3, 4])
+    into = build_dll([10, 11])
+    dll.splice(dll.node_at(1), dll.node_at(3), into, into.head)
+    check_links(dll, [0, 4])
+    check_links(into, [10, 1, 2, 3, 11])
+    into.splice(into.head, into.head, dll, None, count=1)
+    check_links(dll, [10, 0, 4])
+    check_links(into, [1, 2, 3, 11])
+    into.splice(into.head, into.tail, dll, dll.tail)
+    check_links(dll, [10, 0, 4, 1, 2, 3, 11])
+    check_links(into, [])
+
+def test_splice_within_list():
+    dll = build_dll([0, 1, 2, 3, 4])
+    dll.splice(dll.head, dll.node_at(1), dll, dll.tail)
+    check_links(dll, [2, 3, 4, 0, 1])
+    with pytest.raises(ValueError):
+        dll.splice(dll.head, dll.node_at(2), dll, dll.node_at(1))
+    with pytest.raises(ValueError):
+        dll.splice(dll.tail, dll.head, DoubleLinkedList())
+    check_links(dll, [2, 3, 4, 0, 1])
+
+def test_splice_rejects_foreign_nodes():
+    dll = build_dll([0, 1, 2])
+    other = build_dll([5, 6, 7])
+    with pytest.raises(ValueError, match="start_node is not in this list"):
+        dll.splice(other.head, other.node_at(1), dll)
+    with pytest.raises(ValueError, match="start_node is not in this list"):
+        dll.splice(Node(9), dll.tail, other)
+    with pytest.raises(ValueError, match="end_node is not in this list"):
+        dll.splice(dll.node_at(1), other.tail, other)
+    check_links(dll, [0, 1, 2])
+    check_links(other, [5, 6, 7])
+
+@pytest.mark.parametrize("position", [0, 1, 3, 5])
+def test_split_at(position):
+    dll = DoubleLinkedList(indexed=True, finger=True)
+    for value in range(6):
+        dll.insert_at_tail(Node(value))
+    rest = dll.split_at(dll.node_at(position))
+    check_links(dll, list(range(position)))
+    check_links(rest, list(range(position, 6)))
+    assert rest.indexed
+    assert all(value in dll for value in range(position))
+    assert not any(value in dll for value in range(position, 6))
+    assert all(rest.find(value).data == value for value in range(position, 6))
+    assert [rest.node_at(i).data for i in range(rest.size)] == list(range(position, 6))
+
+def test_indexed_splice_and_concat():
+    dll = DoubleLinkedList(indexed=True)
+    into = DoubleLinkedList(indexed=True)
+    for value in range(5):
+        dll.insert_at_tail(Node(value))
+    dll.splice(dll.node_at(1), dll.node_at(2), into)
+    assert 1 in into and 2 in into and 1 not in dll
+    dll.concat(into)
+    assert into.find(1) is None and dll.find(2) is dll.tail
+
+def test_iteration_protocol():
+    dll = build_dll([1, 2, 3, 4])
+    assert list(dll) == [1, 2, 3, 4]
+    assert list(reversed(dll)) == [4, 3, 2, 1]
+    assert len(dll) == 4 and len(DoubleLinkedList()) == 0
+    assert list(dll.iter_from(dll.node_at(2))) == [3, 4]
+    assert list(dll.iter_from(dll.node_at(2), reverse=True)) == [3, 2, 1]
+    assert [node.data for node in dll.iter_nodes(reverse=True)] == [4, 3, 2, 1]
+    assert all(isinstance(node, Node) for node in dll.iter_nodes())
+    with pytest.raises(TypeError):
+        dll.iter_from(3)
+
+def test_iteration_stops_early():
+    dll = build_dll(range(10))
+    iterator = iter(dll)
+    assert next(iterator) == 0 and next(iterator) == 1
+    assert next(value for value in dll if value > 6) == 7
+
+def test_iteration_fails_fast_on_modification():
+    dll = build_dll([1, 2, 3])
+    with pytest.raises(RuntimeError):
+        for node in dll.iter_nodes():
+            dll.remove(node.data)
+    with pytest.raises(RuntimeError):
+        for value in dll:
+            dll.insert_at_tail(Node(value))
+    assert list(dll) == [2, 3, 2]
+    iterator = reversed(dll)
+    assert next(iterator) == 2
+    dll.update_node(3, 30)  # Updating data does not change the links.
+    assert list(iterator) == [30, 2]
+
+def test_unstarted_iterator_fails_fast():
+    dll = build_dll([1, 2, 3])
+    iterators = [iter(dll), reversed(dll), dll.iter_from(dll.node_at(1)), dll.iter_nodes()]
+    dll.delete_from_head()
+    for iterator in iterators:
+        with pytest.raises(RuntimeError):
+            next(iterator)
+    assert list(dll) == [2, 3]
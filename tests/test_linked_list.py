@@ -53,13 +53,16 @@ def test_traversal(linked_list):
 def test_find_existing_value(linked_list):
     """Test finding an existing value in the linked list."""
     result = linked_list.find(10)
-    assert result == "Node with value 10 found at position 1"
+    assert isinstance(result, Node) and result.data == 10
+    assert linked_list.index_of(10) == 1
+    assert 10 in linked_list
 
 
 def test_find_non_existing_value(linked_list):
     """Test finding a non-existing value in the linked list."""
-    result = linked_list.find(30)
-    assert result == (None, -1)  # The value 30 should not be found
+    assert linked_list.find(30) is None  # The value 30 should not be found
+    assert linked_list.index_of(30) == -1
+    assert 30 not in linked_list
 
 
 def test_is_empty(linked_list):
@@ -122,3 +125,134 @@ def test_invalid_linked_list_head_setter():
     ll = LinkedList()
     with pytest.raises(TypeError):  # Expecting TypeError when setting the head to a non-Node value
         ll.head = "invalid"
+
+
+def test_node_uses_slots():
+    """Test that nodes carry no per-instance __dict__."""
+    node = Node(10)
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.extra = 1
+
+
+def test_append_and_len(linked_list):
+    """Test appending at the tail and tracking the length."""
+    linked_list.append(5)
+    assert len(linked_list) == 3
+    assert linked_list.tail.data == 5
+    assert list(linked_list) == [20, 10, 5]
+
+
+def test_extend():
+    """Test building a list in order with extend."""
+    ll = LinkedList()
+    ll.extend(range(5))
+    ll.insert(-1)
+    assert list(ll) == [-1, 0, 1, 2, 3, 4]
+    assert len(ll) == 6
+    assert ll.tail.data == 4
+
+
+def test_pop_head(linked_list):
+    """Test removing nodes from the head."""
+    assert linked_list.pop_head() == 20
+    assert linked_list.pop_head() == 10
+    assert linked_list.is_empty() is True
+    assert linked_list.tail is None
+    assert len(linked_list) == 0
+    with pytest.raises(IndexError, match="Pop from an empty list"):
+        linked_list.pop_head()
+    linked_list.append(1)
+    assert linked_list.head is linked_list.tail
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_remove(indexed):
+    """Test deleting the first node holding a value from the head, middle and tail."""
+    ll = LinkedList(indexed=indexed)
+    ll.extend([1, 2, 3, 2, 4])
+    ll.remove(2)
+    assert list(ll) == [1, 3, 2, 4] and len(ll) == 4
+    assert ll.find(2) is ll.head.next.next
+    ll.remove(1)
+    assert ll.head.data == 3
+    ll.remove(4)
+    assert ll.tail.data == 2 and ll.tail.next is None
+    ll.append(5)
+    assert list(ll) == [3, 2, 5]
+    with pytest.raises(ValueError, match="Node with data 7 not found in the list."):
+        ll.remove(7)
+    for value in [3, 2, 5]:
+        ll.remove(value)
+    assert ll.is_empty() and ll.tail is None and 2 not in ll
+
+
+def test_iter_is_lazy(linked_list):
+    """Test that iteration yields one node at a time."""
+    iterator = iter(linked_list)
+    assert next(iterator) == 20
+    assert next(iterator) == 10
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_head_setter_updates_tail_and_len():
+    """Test that setting the head recomputes the tail and length."""
+    ll = LinkedList()
+    node1, node2 = Node(1), Node(2)
+    node1.next = node2
+    ll.head = node1
+    assert len(ll) == 2
+    assert ll.tail is node2
+    ll.append(3)
+    assert list(ll) == [1, 2, 3]
+
+
+def test_sort():
+    """Test in-place merge sort on the singly linked list."""
+    ll = LinkedList()
+    values = [5, -2, 9, 0, 5, 3, 3, 8, 1]
+    ll.extend(values)
+    ll.sort()
+    assert list(ll) == sorted(values)
+    assert ll.tail.data == 9 and len(ll) == len(values)
+    ll.sort(key=abs, reverse=True)
+    assert list(ll) == sorted(values, key=abs, reverse=True)
+    LinkedList().sort()
+
+
+def test_merge_sorted():
+    """Test merging two sorted singly linked lists."""
+    ll, other = LinkedList(), LinkedList()
+    ll.extend([1, 3, 5])
+    other.extend([2, 3, 4, 9])
+    ll.merge_sorted(other)
+    assert list(ll) == [1, 2, 3, 3, 4, 5, 9]
+    assert ll.tail.data == 9 and len(ll) == 7
+    assert other.is_empty() and other.tail is None
+    ll.append(10)
+    assert list(ll)[-1] == 10
+    with pytest.raises(TypeError):
+        ll.merge_sorted([1])
+
+
+def test_indexed_list():
+    """Test that the value index follows inserts, pops, head changes and merges."""
+    ll = LinkedList(indexed=True)
+    ll.extend([1, 2, 3, 2])
+    ll.insert(0)
+    ll.append(4)
+    assert ll.indexed and not LinkedList().indexed
+    assert ll.find(2) is ll.head.next.next  # Earliest of the duplicates.
+    assert ll.index_of(2) == 2 and ll.index_of(7) == -1
+    assert ll.pop_head() == 0 and 0 not in ll
+    other = LinkedList(indexed=True)
+    other.extend([0, 5])
+    ll.sort()
+    ll.merge_sorted(other)
+    assert list(ll) == [0, 1, 2, 2, 3, 4, 5]
+    assert ll.find(5) is ll.tail and 5 not in other
+    ll.head = Node(7, Node(8))
+    assert 7 in ll and 8 in ll and 1 not in ll
+    ll.head = None
+    assert ll.find(7) is None
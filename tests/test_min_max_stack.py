@@ -0,0 +1,62 @@
+import random
+
+import pytest
+from data_structures.min_max_stack import MinMaxStack, MonotonicStack, next_greater
+
+def test_min_max_stack_aggregates():
+    stack = MinMaxStack(track_sum=True)
+    for value in [5, 2, 8, 2, 1]:
+        stack.push(value)
+    assert (stack.min(), stack.max(), stack.sum()) == (1, 8, 18)
+    assert stack.pop() == 1
+    assert (stack.min(), stack.max(), stack.sum()) == (2, 8, 17)
+    stack.pop()
+    stack.pop()
+    assert (stack.min(), stack.max(), stack.sum()) == (2, 5, 7)
+    assert stack.peek() == 2
+    assert stack.size() == 2
+
+def test_min_max_stack_matches_naive():
+    rng = random.Random(3)
+    stack = MinMaxStack()
+    values = []
+    for _ in range(500):
+        if values and rng.random() < 0.4:
+            assert stack.pop() == values.pop()
+        else:
+            value = rng.randint(-100, 100)
+            stack.push(value)
+            values.append(value)
+        if values:
+            assert stack.min() == min(values)
+            assert stack.max() == max(values)
+            assert stack.sum() == sum(values)
+
+def test_min_max_stack_empty():
+    stack = MinMaxStack(track_sum=True)
+    assert stack.sum() == 0
+    with pytest.raises(IndexError, match="Min of an empty stack."):
+        stack.min()
+    with pytest.raises(IndexError, match="Max of an empty stack."):
+        stack.max()
+    with pytest.raises(IndexError, match="Pop from an empty stack."):
+        stack.pop()
+
+def test_monotonic_stack_push_returns_resolved():
+    stack = MonotonicStack()
+    assert stack.push(3) == []
+    assert stack.push(1) == []
+    assert stack.push(2) == [1]
+    assert stack.push(5) == [2, 3]
+    assert stack.size() == 1
+
+def test_monotonic_stack_increasing():
+    stack = MonotonicStack(decreasing=False)
+    stack.push(1)
+    stack.push(4)
+    assert stack.push(2) == [4]
+    assert stack.peek() == 2
+
+def test_next_greater():
+    assert next_greater([2, 1, 3, 3, 0, 4]) == [3, 3, 4, 4, 4, None]
+    assert next_greater([]) == []
@@ -0,0 +1,55 @@
+import pytest
+from data_structures import double_linked_list, linked_list
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+from data_structures.node_pool import NodePool
+
+def test_pool_acquire_release():
+    pool = NodePool(linked_list.Node, cap=2)
+    first = pool.acquire(1)
+    assert pool.stats()["misses"] == 1
+    pool.release(first)
+    assert len(pool) == 1
+    assert first.data is None
+    again = pool.acquire(5)
+    assert again is first and again.data == 5
+    for _ in range(3):
+        pool.release(linked_list.Node(0))
+    assert pool.stats() == {
+        "size": 2, "cap": 2, "hits": 1, "misses": 1, "released": 4, "discarded": 1,
+    }
+
+def test_pool_rejects_other_nodes():
+    pool = NodePool(linked_list.Node)
+    with pytest.raises(TypeError):
+        pool.release(double_linked_list.Node(1))
+    with pytest.raises(TypeError):
+        DoubleLinkedList(pool=pool)
+    with pytest.raises(ValueError):
+        NodePool(linked_list.Node, cap=-1)
+
+def test_linked_list_recycles_nodes():
+    pool = NodePool(linked_list.Node)
+    ll = LinkedList(pool=pool)
+    ll.extend(range(3))
+    assert [ll.pop_head() for _ in range(3)] == [0, 1, 2]
+    assert len(pool) == 3
+    ll.append(7)
+    ll.insert(6)
+    assert list(ll) == [6, 7]
+    assert pool.stats()["hits"] == 2
+
+def test_double_linked_list_recycles_nodes():
+    pool = NodePool(double_linked_list.Node, cap=8)
+    dll = DoubleLinkedList(pool=pool)
+    for value in range(4):
+        dll.insert_at_tail(dll.new_node(value))
+    dll.delete_from_head()
+    dll.delete_from_tail()
+    dll.delete_from_position(1)
+    assert dll.traversal_forward() == [1]
+    assert len(pool) == 3
+    dll.insert_at_head(dll.new_node(9))
+    assert dll.traversal_forward() == [9, 1]
+    assert dll.traversal_backward() == [1, 9]
+    assert pool.stats()["hits"] == 1
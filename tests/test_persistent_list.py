@@ -0,0 +1,57 @@
+import copy
+import pickle
+
+import pytest
+from data_structures.persistent_list import PersistentList
+
+@pytest.fixture(name="plist")
+def persistent_list_fixture():
+    return PersistentList.from_iterable([1, 2, 3])
+
+def test_from_iterable(plist):
+    assert list(plist) == [1, 2, 3]
+    assert len(plist) == 3
+    assert plist.head == 1
+    assert not plist.is_empty()
+
+def test_empty_list():
+    empty = PersistentList()
+    assert empty is PersistentList()
+    assert empty.is_empty() and len(empty) == 0 and list(empty) == []
+    with pytest.raises(IndexError):
+        empty.head
+    with pytest.raises(IndexError):
+        empty.tail
+
+def test_prepend_shares_structure(plist):
+    version = plist.prepend(0)
+    assert list(version) == [0, 1, 2, 3]
+    assert version.tail is plist
+    assert list(plist) == [1, 2, 3]  # The original is unchanged.
+    branch = plist.tail.prepend(9)
+    assert list(branch) == [9, 2, 3]
+    assert branch.tail is plist.tail
+
+def test_equality_and_hash(plist):
+    assert plist == PersistentList.from_iterable([1, 2, 3])
+    assert plist.prepend(0).tail == plist
+    assert plist != plist.tail
+    assert plist != PersistentList.from_iterable([1, 2, 4])
+    assert plist != [1, 2, 3]
+    assert hash(plist) == hash(PersistentList.from_iterable([1, 2, 3]))
+    assert repr(plist) == "PersistentList([1, 2, 3])"
+
+def test_long_list_is_not_recursive():
+    count = 200_000
+    long_list = PersistentList.from_iterable(range(count))
+    other = PersistentList.from_iterable(range(count))
+    assert sum(long_list) == sum(range(count))
+    assert long_list == other
+    assert len(repr(long_list)) > count
+    del long_list, other
+
+def test_pickle_and_copy(plist):
+    restored = pickle.loads(pickle.dumps(plist))
+    assert restored == plist
+    assert copy.deepcopy(PersistentList()) is PersistentList()
+    assert PersistentList().is_empty()
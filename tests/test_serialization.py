@@ -0,0 +1,182 @@
+import copy
+import pickle
+
+import pytest
+from data_structures.binary_tree import BinaryTree, Node
+from data_structures.deque_list import Deque
+from data_structures.double_linked_list import DoubleLinkedList
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list import Node as ListNode
+from data_structures.min_max_stack import MinMaxStack, MonotonicStack
+from data_structures.node_pool import NodePool
+from data_structures.queue_list import Queue
+from data_structures.serialization import dumps, loads
+from data_structures.stack_list import Stack
+
+VALUES = [
+    [],
+    [1, -2, 3, 2**63 - 1],
+    [1.5, -0.25, float("inf")],
+    ["a", None, (1, 2), 2**70],
+    [1, 2.0],
+    [True, False],
+]
+
+@pytest.mark.parametrize("values", VALUES)
+def test_sequences_round_trip(values):
+    linked = LinkedList()
+    linked.extend(values)
+    dll = DoubleLinkedList()
+    for value in values:
+        dll.insert_at_tail(dll.new_node(value))
+    deque, stack, queue = Deque(), Stack(), Queue()
+    for value in values:
+        deque.append(value)
+        stack.push(value)
+        queue.enqueue(value)
+
+    restored = loads(dumps(linked))
+    assert type(restored) is LinkedList and list(restored) == values and len(restored) == len(values)
+    restored = loads(dumps(dll))
+    assert restored.traversal_forward() == values and restored.traversal_backward() == values[::-1]
+    restored = loads(dumps(deque))
+    assert [restored.pop_left() for _ in range(len(restored))] == values
+    restored = loads(dumps(stack))
+    assert [restored.pop() for _ in range(restored.size())] == values[::-1]
+    restored = loads(dumps(queue))
+    assert [restored.dequeue() for _ in range(restored.size())] == values
+
+def stack_of(values):
+    stack = Stack()
+    for value in values:
+        stack.push(value)
+    return stack
+
+@pytest.mark.parametrize("values", VALUES)
+def test_value_types_are_kept(values):
+    restored = loads(dumps(stack_of(values)))
+    assert [type(value) for value in restored._stack] == [type(value) for value in values]
+
+def test_options_are_kept():
+    linked = LinkedList(pool=NodePool(ListNode), indexed=True)
+    linked.extend([3, 1, 3])
+    restored = loads(dumps(linked))
+    assert restored.indexed and restored.index_of(3) == 0 and restored._pool is None
+    dll = DoubleLinkedList(indexed=True, finger=True)
+    for value in [5, 6, 5]:
+        dll.insert_at_tail(dll.new_node(value))
+    restored = loads(dumps(dll))
+    assert restored.indexed and restored._uses_finger
+    restored.remove(5)
+    assert restored.traversal_forward() == [6, 5] and restored.node_at(1).data == 5
+    deque = Deque(indexed=True)
+    for value in [1, 2, 1]:
+        deque.append(value)
+    restored = loads(dumps(deque))
+    assert restored.count(1) == 2 and 2 in restored
+
+@pytest.mark.parametrize("array_backed", [False, True])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_binary_tree_round_trip(array_backed, indexed):
+    tree = BinaryTree(array_backed=array_backed, indexed=indexed)
+    for value in range(10):
+        tree.insert_node(value)
+    tree.delete_node(3)
+    restored = loads(dumps(tree))
+    assert restored.array_backed == array_backed and restored.indexed == indexed
+    assert restored.print_tree_bfs() == tree.print_tree_bfs()
+    assert [node.value for node in restored.iter_pre_order()] == [node.value for node in tree.iter_pre_order()]
+    assert restored.find(9).parent.value == tree.find(9).parent.value
+    assert loads(dumps(BinaryTree(array_backed=array_backed))).is_empty()
+
+def test_irregular_and_deep_tree_round_trip():
+    tree = BinaryTree()
+    tree._root = current = Node("root")
+    for value in range(20_000):
+        child = Node(value, parent=current)
+        if value % 3:
+            current.left = child
+        else:
+            current.right = child
+        current = child
+    current.right = Node("leaf", parent=current)
+    restored = loads(dumps(tree))
+    assert [node.value for node in restored.iter_pre_order()] == [node.value for node in tree.iter_pre_order()]
+    assert [node.value for node in restored.iter_in_order()] == [node.value for node in tree.iter_in_order()]
+
+def test_pickle_and_copy_use_the_fast_path():
+    linked = LinkedList()
+    linked.extend(range(100_000))  # Far too long for recursive pickling.
+    assert list(pickle.loads(pickle.dumps(linked))) == list(range(100_000))
+    tree = BinaryTree(array_backed=True)
+    for value in range(100):
+        tree.insert_node(value)
+    copied = copy.deepcopy(tree)
+    assert copied.print_tree_bfs() == tree.print_tree_bfs() and copied.root is not tree.root
+    nested = stack_of([stack_of([1, 2]), "x"])
+    restored = pickle.loads(pickle.dumps(nested))
+    assert restored.pop() == "x" and restored.pop().peek() == 2
+
+def test_shared_values_keep_their_identity():
+    shared = ["shared"]
+    linked = LinkedList()
+    linked.extend([shared, shared])
+    restored, restored_shared = pickle.loads(pickle.dumps((linked, shared)))
+    assert restored.head.data is restored_shared and restored.tail.data is restored_shared
+    tree = BinaryTree()
+    tree.insert_node(shared)
+    restored_tree, restored_list = pickle.loads(pickle.dumps((tree, linked)))
+    assert restored_tree.root.value is restored_list.head.data
+
+def test_copy_is_shallow():
+    value = ["mutable"]
+    stack = stack_of([value, 1])
+    copied = copy.copy(stack)
+    assert copied._stack[0] is value and copied._stack is not stack._stack
+    copied.push(2)
+    assert stack.size() == 2
+    tree = BinaryTree()
+    tree.insert_node(value)
+    assert copy.copy(tree).root.value is value
+    deep = copy.deepcopy(stack_of([value, lambda: 1]))  # Not picklable, but deep-copyable.
+    assert deep._stack[0] == value and deep._stack[0] is not value
+    assert deep._stack[1]() == 1
+
+class TaggedList(LinkedList):
+    def __init__(self, tag):
+        super().__init__(indexed=True)
+        self.tag = tag
+
+def test_subclasses_round_trip():
+    stack = MinMaxStack(track_sum=True)
+    for value in [5, 2, 8]:
+        stack.push(value)
+    for restored in (pickle.loads(pickle.dumps(stack)), loads(dumps(stack)),
+                     copy.copy(stack), copy.deepcopy(stack)):
+        assert type(restored) is MinMaxStack
+        assert (restored.min(), restored.max(), restored.sum()) == (2, 8, 15)
+        restored.push(1)
+        assert restored.min() == 1 and restored.pop() == 1
+    assert (stack.min(), stack.size()) == (2, 3)
+    monotonic = MonotonicStack(decreasing=False)
+    for value in [3, 1, 2]:
+        monotonic.push(value)
+    restored = pickle.loads(pickle.dumps(monotonic))
+    assert type(restored) is MonotonicStack and restored._stack == monotonic._stack
+    assert restored._decreasing is False
+    tagged = TaggedList("a")
+    tagged.extend([1, 2])
+    restored = copy.deepcopy(tagged)
+    assert type(restored) is TaggedList and restored.tag == "a"
+    assert list(restored) == [1, 2] and restored.indexed and 2 in restored
+
+def test_invalid_data():
+    with pytest.raises(TypeError):
+        dumps([1, 2])
+    with pytest.raises(ValueError):
+        loads(b"not serialized")
+    with pytest.raises(ValueError):
+        loads(pickle.dumps([1, 2]))
+    data = dumps(stack_of([1, 2, 3]))
+    with pytest.raises(ValueError):
+        loads(data[:-8])
@@ -0,0 +1,84 @@
+import bisect
+import random
+
+import pytest
+from data_structures.skip_list import SkipList
+
+@pytest.fixture(name="skip_list")
+def skip_list_fixture():
+    skip_list = SkipList(seed=1)
+    for value in [5, 1, 9, 3, 7]:
+        skip_list.insert(value)
+    return skip_list
+
+def test_insert_keeps_order(skip_list):
+    assert list(skip_list) == [1, 3, 5, 7, 9]
+    assert len(skip_list) == 5
+
+def test_find(skip_list):
+    assert skip_list.find(7).data == 7
+    assert skip_list.find(7).next.data == 9
+    assert skip_list.find(4) is None
+    assert 3 in skip_list
+    assert 4 not in skip_list
+
+def test_delete(skip_list):
+    skip_list.delete(5)
+    assert list(skip_list) == [1, 3, 7, 9]
+    with pytest.raises(ValueError, match="Value 5 not found in the skip list."):
+        skip_list.delete(5)
+
+def test_positions_and_rank(skip_list):
+    assert [skip_list[i] for i in range(5)] == [1, 3, 5, 7, 9]
+    assert skip_list[-1] == 9
+    with pytest.raises(IndexError):
+        skip_list[5]
+    assert skip_list.rank(1) == 0
+    assert skip_list.rank(6) == 3
+    assert skip_list.rank(100) == 5
+
+def test_range(skip_list):
+    assert list(skip_list.range(3, 9)) == [3, 5, 7]
+    assert list(skip_list.range(4)) == [5, 7, 9]
+    assert list(skip_list.range(stop=3)) == [1]
+    assert list(skip_list.range(10, 20)) == []
+
+def test_from_sorted():
+    skip_list = SkipList.from_sorted(range(0, 100, 2), seed=3)
+    assert list(skip_list) == list(range(0, 100, 2))
+    assert skip_list[10] == 20
+    skip_list.insert(21)
+    assert skip_list[11] == 21
+    assert skip_list.rank(22) == 12
+    with pytest.raises(ValueError, match="Values must be sorted"):
+        SkipList.from_sorted([2, 1])
+
+def test_duplicates_and_empty():
+    skip_list = SkipList()
+    assert skip_list.is_empty()
+    assert list(skip_list.range(0, 10)) == []
+    for value in [2, 2, 1, 2]:
+        skip_list.insert(value)
+    assert list(skip_list) == [1, 2, 2, 2]
+    skip_list.delete(2)
+    assert list(skip_list) == [1, 2, 2]
+    skip_list.clear()
+    assert skip_list.size == 0 and list(skip_list) == []
+
+def test_matches_sorted_list():
+    rng = random.Random(5)
+    skip_list = SkipList(seed=5)
+    expected = []
+    for _ in range(3000):
+        value = rng.randrange(200)
+        if rng.random() < 0.6:
+            skip_list.insert(value)
+            bisect.insort_right(expected, value)
+        elif value in expected:
+            skip_list.delete(value)
+            expected.remove(value)
+        assert skip_list.rank(value) == bisect.bisect_left(expected, value)
+        if expected:
+            position = rng.randrange(len(expected))
+            assert skip_list[position] == expected[position]
+    assert list(skip_list) == expected
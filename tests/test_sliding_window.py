@@ -0,0 +1,97 @@
+"""
+Test suite for the SlidingWindow class.
+
+The tests compare the streaming aggregates against a naive recomputation over
+the window contents, for both count-based and time-based windows.
+"""
+import random
+
+import pytest
+from data_structures.sliding_window import SlidingWindow
+
+
+@pytest.fixture(name="window")
+def window_fixture() -> SlidingWindow:
+    """
+    Fixture to initialize a count-based window of size 3 with four values.
+
+    Returns:
+        SlidingWindow: A window holding 1, 7 and 3.
+    """
+    window = SlidingWindow(size=3)
+    window.push_many([4, 1, 7, 3])
+    return window
+
+def test_count_window_aggregates(window: SlidingWindow):
+    """The oldest value falls out once the window is full."""
+    assert len(window) == 3
+    assert window.min() == 1
+    assert window.max() == 7
+    assert window.sum() == 11
+    assert window.mean() == pytest.approx(11 / 3)
+
+def test_count_window_matches_naive():
+    """Aggregates match a naive recomputation after every push."""
+    rng = random.Random(7)
+    window = SlidingWindow(size=5)
+    values = []
+    for _ in range(200):
+        value = rng.randint(-50, 50)
+        window.push(value)
+        values.append(value)
+        recent = values[-5:]
+        assert window.min() == min(recent)
+        assert window.max() == max(recent)
+        assert window.sum() == sum(recent)
+
+def test_push_many_large_batch():
+    """A batch larger than the window keeps only its tail."""
+    window = SlidingWindow(size=4)
+    window.push(100)
+    window.push_many(range(10))
+    assert len(window) == 4
+    assert window.min() == 6
+    assert window.max() == 9
+
+def test_time_window():
+    """Values older than the duration are evicted."""
+    window = SlidingWindow(duration=10)
+    window.push_many([5, 2, 8], timestamps=[0, 4, 9])
+    assert window.min() == 2
+    window.push(6, timestamp=12)
+    assert window.min() == 2
+    assert window.max() == 8
+    window.push(7, timestamp=14)
+    assert window.min() == 6
+    assert len(window) == 3
+    window.expire(30)
+    assert window.is_empty()
+    assert window.sum() == 0
+
+def test_time_window_rejects_older_timestamps():
+    """Timestamps must never go backwards."""
+    window = SlidingWindow(duration=1)
+    window.push(1, timestamp=5)
+    with pytest.raises(ValueError, match="Timestamps must be non-decreasing"):
+        window.push(2, timestamp=4)
+
+def test_empty_window_queries():
+    """Querying an empty window raises an IndexError."""
+    window = SlidingWindow(size=2)
+    with pytest.raises(IndexError, match="Min of an empty window"):
+        window.min()
+    with pytest.raises(IndexError, match="Max of an empty window"):
+        window.max()
+    with pytest.raises(IndexError, match="Mean of an empty window"):
+        window.mean()
+
+def test_invalid_arguments():
+    """Exactly one positive window bound is required."""
+    with pytest.raises(ValueError):
+        SlidingWindow()
+    with pytest.raises(ValueError):
+        SlidingWindow(size=3, duration=1.0)
+    with pytest.raises(ValueError):
+        SlidingWindow(size=0)
+    with pytest.raises(ValueError):
+        SlidingWindow(size=3).expire(1.0)
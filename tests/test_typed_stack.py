@@ -0,0 +1,91 @@
+import sys
+from array import array
+
+import pytest
+from data_structures.typed_stack import TypedStack
+
+def test_typed_stack_push_pop():
+    stack = TypedStack('q', capacity=2)
+    for value in range(10):
+        stack.push(value)
+    assert stack.size() == 10
+    assert stack.capacity >= 10
+    assert stack.peek() == 9
+    assert stack.pop() == 9
+    assert stack.size() == 9
+
+def test_typed_stack_rejects_wrong_type():
+    stack = TypedStack('q')
+    with pytest.raises(TypeError):
+        stack.push(1.5)
+
+def test_typed_stack_push_many_pop_many():
+    stack = TypedStack('d')
+    stack.push(0.5)
+    stack.push_many([1.0, 2.0, 3.0])
+    stack.push_many(array('d', [4.0, 5.0]))
+    stack.push_many(memoryview(array('d', [6.0])))
+    assert stack.pop_many(3).tolist() == [4.0, 5.0, 6.0]
+    assert stack.pop_many(0).tolist() == []
+    assert stack.size() == 4
+    assert stack.peek() == 3.0
+    with pytest.raises(IndexError):
+        stack.pop_many(5)
+    with pytest.raises(ValueError):
+        stack.pop_many(-1)
+
+def test_typed_stack_push_many_same_layout_is_block_copied():
+    stack = TypedStack('q')
+    longs = array('l', [1, -2, 3]) if array('l').itemsize == 8 else array('q', [1, -2, 3])
+    assert stack._from_buffer(longs) is not None
+    assert stack._from_buffer(memoryview(longs)) is not None
+    stack.push_many(longs)
+    assert stack.pop_many(3).tolist() == [1, -2, 3]
+    # Same size but another kind: converted value by value, not reinterpreted.
+    assert stack._from_buffer(array('d', [1.0])) is None
+    assert stack._from_buffer(array('Q', [1])) is None
+    assert stack._from_buffer(array('i', [1])) is None
+    stack.push_many(array('i', [4, 5]))
+    assert stack.pop_many(2).tolist() == [4, 5]
+
+def test_typed_stack_push_many_numpy_int64():
+    numpy = pytest.importorskip("numpy")
+    stack = TypedStack('q')
+    values = numpy.arange(-3, 3, dtype=numpy.int64)
+    assert stack._from_buffer(values) is not None
+    stack.push_many(values)
+    assert stack.pop_many(6).tolist() == list(range(-3, 3))
+
+def test_typed_stack_peek_n_is_read_only_view():
+    stack = TypedStack('d', capacity=4)
+    stack.push_many([1.0, 2.0, 3.0])
+    view = stack.peek_n(2)
+    assert view.readonly
+    assert view.tolist() == [2.0, 3.0]
+    stack.pop()
+    stack.push(9.0)
+    assert view.tolist() == [2.0, 9.0]  # The view shares memory with the stack.
+    stack.push_many([4.0, 5.0, 6.0])  # Growing keeps the old view valid.
+    assert view.tolist() == [2.0, 9.0]
+    with pytest.raises(TypeError):
+        view[0] = 0.0
+
+def test_typed_stack_view():
+    stack = TypedStack('i')
+    stack.push_many(range(4))
+    assert stack.view().tolist() == [0, 1, 2, 3]
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="__buffer__ requires Python 3.12")
+def test_typed_stack_buffer_protocol():
+    stack = TypedStack('d')
+    stack.push_many([1.0, 2.0])
+    assert memoryview(stack).tolist() == [1.0, 2.0]
+    assert bytes(stack) == array('d', [1.0, 2.0]).tobytes()
+
+def test_typed_stack_empty():
+    stack = TypedStack()
+    assert stack.is_empty() is True
+    with pytest.raises(IndexError, match="Pop from an empty stack."):
+        stack.pop()
+    with pytest.raises(IndexError, match="Peek from an empty stack."):
+        stack.peek()
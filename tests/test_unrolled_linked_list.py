@@ -0,0 +1,79 @@
+import random
+
+import pytest
+from data_structures.unrolled_linked_list import UnrolledLinkedList
+
+@pytest.fixture(name="unrolled")
+def unrolled_fixture():
+    """Fixture holding the values 0 to 9 in blocks of 4."""
+    unrolled = UnrolledLinkedList(capacity=4)
+    for value in range(10):
+        unrolled.insert_at_tail(value)
+    return unrolled
+
+def test_insert_at_tail(unrolled):
+    assert unrolled.size == 10
+    assert unrolled.traversal_forward() == list(range(10))
+    assert unrolled.head.items == [0, 1, 2, 3]
+    assert unrolled.tail.items == [8, 9]
+
+def test_insert_at_head(unrolled):
+    unrolled.insert_at_head(-1)
+    assert unrolled.traversal_forward() == list(range(-1, 10))
+    assert unrolled.head.items == [-1]
+
+def test_insert_at_position_splits_block(unrolled):
+    unrolled.insert_at_position(99, 2)
+    assert unrolled.traversal_forward() == [0, 1, 99, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert unrolled.head.items == [0, 1, 99]
+    with pytest.raises(IndexError):
+        unrolled.insert_at_position(1, 12)
+
+def test_delete(unrolled):
+    assert unrolled.delete_from_head() == 0
+    assert unrolled.delete_from_tail() == 9
+    assert unrolled.delete_from_position(3) == 4
+    assert unrolled.traversal_forward() == [1, 2, 3, 5, 6, 7, 8]
+    assert unrolled.traversal_backward() == [8, 7, 6, 5, 3, 2, 1]
+    assert unrolled.size == 7
+
+def test_find_and_update(unrolled):
+    assert unrolled.find(7) == 7
+    assert unrolled.find(42) is None
+    unrolled.update_node(7, 70)
+    assert unrolled[7] == 70
+    with pytest.raises(ValueError):
+        unrolled.update_node(42, 1)
+
+def test_empty_list():
+    unrolled = UnrolledLinkedList()
+    assert unrolled.is_empty()
+    with pytest.raises(IndexError, match="Cannot delete from an empty list"):
+        unrolled.delete_from_head()
+    with pytest.raises(IndexError, match="Cannot update empty list."):
+        unrolled.update_node(1, 2)
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(capacity=1)
+
+def test_matches_python_list():
+    rng = random.Random(11)
+    unrolled = UnrolledLinkedList(capacity=5)
+    expected = []
+    for _ in range(2000):
+        operation = rng.random()
+        if operation < 0.45 or not expected:
+            position = rng.randint(0, len(expected))
+            value = rng.randrange(100)
+            unrolled.insert_at_position(value, position)
+            expected.insert(position, value)
+        elif operation < 0.9:
+            position = rng.randrange(len(expected))
+            assert unrolled.delete_from_position(position) == expected.pop(position)
+        else:
+            value = rng.randrange(100)
+            assert unrolled.find(value) == (expected.index(value) if value in expected else None)
+        assert len(unrolled) == len(expected)
+    assert list(unrolled) == expected
+    assert list(reversed(unrolled)) == expected[::-1]
+    unrolled.clear()
+    assert unrolled.is_empty() and unrolled.head is None
@@ -0,0 +1,112 @@
+"""
+Test suite for the WorkStealingDeque and WorkStealingPool classes.
+
+The tests cover the owner and thief ends of the deque, nested fork-join
+computations on the pool, exception propagation and pool configuration.
+"""
+import os
+import threading
+import time
+
+import pytest
+from data_structures.binary_tree import BinaryTree
+from data_structures.work_stealing import WorkStealingDeque, WorkStealingPool
+
+def tree_sum(pool, node):
+    """Sums a binary tree, forking the left subtree onto the pool."""
+    if node is None:
+        return 0
+    left = pool.submit(tree_sum, pool, node.left)
+    right = tree_sum(pool, node.right)
+    return node.value + right + pool.join(left)
+
+def merge_sort(pool, values):
+    """Sorts values, forking the left half onto the pool."""
+    if len(values) <= 8:
+        return sorted(values)
+    middle = len(values) // 2
+    left = pool.submit(merge_sort, pool, values[:middle])
+    right = merge_sort(pool, values[middle:])
+    left = pool.join(left)
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    return merged + left[i:] + right[j:]
+
+def test_deque_owner_and_thief_ends():
+    """The owner pops the newest task and a thief steals the oldest."""
+    deque = WorkStealingDeque()
+    for value in range(3):
+        deque.push(value)
+    assert deque.size() == 3
+    assert deque.pop() == 2
+    assert deque.steal() == 0
+    assert deque.pop() == 1
+    assert deque.is_empty()
+    assert deque.pop() is None
+    assert deque.steal() is None
+
+def test_parallel_tree_sum():
+    """Nested fork-join over a tree gives the sequential sum."""
+    bt = BinaryTree()
+    for value in range(200):
+        bt.insert_node(value)
+    with WorkStealingPool(workers=4) as pool:
+        assert pool.run(tree_sum, pool, bt.root) == sum(range(200))
+
+def test_parallel_sort():
+    """A parallel merge sort matches sorted()."""
+    values = [(value * 7919) % 1000 for value in range(1000)]
+    with WorkStealingPool(workers=3) as pool:
+        assert pool.run(merge_sort, pool, values) == sorted(values)
+
+def test_task_exception():
+    """An exception raised by a task is re-raised by result()."""
+    with WorkStealingPool(workers=2) as pool:
+        task = pool.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            task.result(timeout=5)
+
+def test_submit_after_shutdown():
+    """A shut-down pool rejects new tasks."""
+    pool = WorkStealingPool(workers=1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError, match="Cannot submit tasks after shutdown"):
+        pool.submit(print)
+
+def test_submit_racing_shutdown():
+    """A task pushed while the pool shuts down still runs."""
+    pool = WorkStealingPool(workers=1)
+    deque = pool._deques[0]
+    pushing = threading.Event()
+    def slow_push(task, push=deque.push):
+        pushing.set()
+        time.sleep(0.05)  # Shutdown starts between the flag check and the push.
+        push(task)
+    deque.push = slow_push
+    tasks = []
+    submitter = threading.Thread(target=lambda: tasks.append(pool.submit(abs, -1)))
+    submitter.start()
+    pushing.wait()
+    pool.shutdown()
+    submitter.join()
+    assert tasks[0].result(timeout=1) == 1
+    with pytest.raises(RuntimeError):
+        pool.submit(abs, -1)
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_invalid_worker_count(workers):
+    """An explicit worker count below one is rejected, not replaced."""
+    with pytest.raises(ValueError, match="Number of workers must be positive"):
+        WorkStealingPool(workers=workers)
+
+def test_default_worker_count():
+    """Without a worker count, the pool starts one worker per CPU."""
+    with WorkStealingPool() as pool:
+        assert pool.workers == (os.cpu_count() or 1)